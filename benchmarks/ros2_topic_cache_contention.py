@@ -0,0 +1,101 @@
+"""Topic cache contention benchmark.
+
+Measures how fast the ROS2 topic plugin can ingest messages while reader
+threads poll the cache, the way REST handlers and WebSocket pollers do.
+Messages are fed straight into the plugin's ingest callbacks, so no Zenoh
+router is needed (zenoh_ros2_sdk must still be importable).
+
+Usage:
+    python benchmarks/ros2_topic_cache_contention.py [--seconds 3] [--topics 4]
+
+Ingest throughput should stay roughly flat as readers are added: readers
+never take a lock the ingest path waits on, and each message is converted
+at most once no matter how many readers ask for it.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from talos.plugins.ros2_topic_subscriber import ROS2TopicSubscriber  # noqa: E402
+
+READER_COUNTS = (0, 1, 4, 16)
+
+
+@dataclass
+class Header:
+    frame_id: str = "base_link"
+
+
+@dataclass
+class JointState:
+    header: Header = field(default_factory=Header)
+    name: list = field(default_factory=lambda: [f"joint{i}" for i in range(32)])
+    position: np.ndarray = field(default_factory=lambda: np.random.rand(32))
+    velocity: np.ndarray = field(default_factory=lambda: np.random.rand(32))
+    effort: np.ndarray = field(default_factory=lambda: np.random.rand(32))
+    __msgtype__: str = "sensor_msgs/msg/JointState"
+
+
+def run(topic_count: int, reader_count: int, seconds: float) -> tuple[float, float]:
+    """Run one configuration.
+
+    Returns:
+        Tuple of (messages ingested per second, reads per second).
+    """
+    topics = {f"/bench_{i}": "sensor_msgs/msg/JointState" for i in range(topic_count)}
+    plugin = ROS2TopicSubscriber("bench", topics, history_size=100)
+    callbacks = [plugin._make_message_callback(topic) for topic in topics]
+    messages = [JointState() for _ in range(64)]
+    stop = threading.Event()
+    ingested = [0] * len(callbacks)
+    reads = [0] * reader_count
+
+    def writer(index: int) -> None:
+        callback = callbacks[index]
+        count = 0
+        while not stop.is_set():
+            callback(messages[count % len(messages)], 1024)
+            count += 1
+        ingested[index] = count
+
+    def reader(index: int) -> None:
+        names = list(topics)
+        count = 0
+        while not stop.is_set():
+            plugin.get_topic_data(names[count % len(names)])
+            count += 1
+        reads[index] = count
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(len(callbacks))]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(reader_count)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(ingested) / seconds, sum(reads) / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration per configuration")
+    parser.add_argument("--topics", type=int, default=4, help="Number of topics (one writer each)")
+    args = parser.parse_args()
+
+    print(f"{'readers':>8} {'ingest msg/s':>14} {'reads/s':>12}")
+    for reader_count in READER_COUNTS:
+        ingest_rate, read_rate = run(args.topics, reader_count, args.seconds)
+        print(f"{reader_count:>8} {ingest_rate:>14,.0f} {read_rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
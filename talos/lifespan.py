@@ -1,10 +1,12 @@
 """Lifespan management for FastAPI app."""
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 
 from talos.agent_client import AgentClientPool
 from talos.config import load_config
@@ -14,11 +16,18 @@ from talos.state import (
     set_client_pool,
     set_docker_client,
     set_ros2_plugin,
+    set_tf_buffer,
     get_client_pool,
     get_docker_client,
     get_ros2_plugins,
     clear_ros2_plugins,
+    get_tf_buffers,
+    clear_tf_buffers,
 )
+from talos.plugins.ros2_ingest_process import ROS2IngestProcess
+from talos.plugins.ros2_image import get_image_encoder
+from talos.plugins.ros2_memory import get_memory_budget
+from talos.plugins.ros2_tf_buffer import ROS2TFBuffer
 from talos.plugins.ros2_topic_subscriber import ROS2TopicSubscriber
 
 logger = logging.getLogger(__name__)
@@ -49,7 +58,14 @@ async def lifespan(app: FastAPI):
             logger.warning(f"Docker client initialization failed (Docker operations will be unavailable): {e}")
             set_docker_client(None)
 
+        # Process-wide budget for cached ROS2 data (enforced together with per-container budgets)
+        if config.ros2_memory_budget_mb is not None:
+            get_memory_budget().set_budget(int(config.ros2_memory_budget_mb * 1024 * 1024))
+        get_image_encoder().set_workers(config.ros2_image_workers)
+
         # Initialize ROS2 plugins for containers with ROS2 configuration
+        plugins = {}
+        tf_buffers = {}
         for container_name, container_config in config.containers.items():
             if container_config.ros2:
                 try:
@@ -63,25 +79,88 @@ async def lifespan(app: FastAPI):
                     router_port_str = os.getenv("ZENOH_ROUTER_PORT")
                     router_port = int(router_port_str) if router_port_str else ros2_config.router_port
 
-                    plugin = ROS2TopicSubscriber(
+                    plugin_kwargs = dict(
                         container_name=container_name,
                         topics=ros2_config.topics,
                         static_topics=ros2_config.static_topics,
                         domain_id=domain_id,
                         router_ip=router_ip,
                         router_port=router_port,
+                        history_size=ros2_config.history_size,
+                        history_sizes=ros2_config.history_sizes,
+                        timeseries={
+                            topic: series_config.model_dump()
+                            for topic, series_config in ros2_config.timeseries.items()
+                        },
+                        ingest={
+                            topic: policy_config.model_dump()
+                            for topic, policy_config in ros2_config.ingest.items()
+                        },
+                        precision={
+                            topic: precision_config.model_dump()
+                            for topic, precision_config in ros2_config.precision.items()
+                        },
+                        lazy_subscribe=ros2_config.lazy_subscribe,
+                        idle_timeout=ros2_config.idle_timeout,
+                        discovery=ros2_config.discovery,
+                        subscribe_workers=ros2_config.subscribe_workers,
+                        subscribe_timeout=ros2_config.subscribe_timeout,
+                        memory_budget_mb=ros2_config.memory_budget_mb,
+                        lazy_deserialize=ros2_config.lazy_deserialize,
+                        snapshot_dir=ros2_config.snapshot_dir,
+                        diagnostics_index=ros2_config.diagnostics_index,
                     )
-                    plugin.start()
-                    set_ros2_plugin(container_name, plugin)
-                    logger.info(
-                        f"ROS2 plugin initialized for container '{container_name}' "
-                    )
+                    if ros2_config.isolated_ingest:
+                        # Ingest runs in its own process; history, time series, diagnostics and discovery are off there
+                        plugin_kwargs.update(
+                            history_size=0, history_sizes={}, timeseries={}, diagnostics_index=False, discovery=False
+                        )
+                        plugins[container_name] = ROS2IngestProcess(
+                            frame_capacity=ros2_config.isolated_frame_bytes, **plugin_kwargs
+                        )
+                    else:
+                        plugins[container_name] = ROS2TopicSubscriber(**plugin_kwargs)
+                    if ros2_config.tf is not None:
+                        # Always in this process: lookups need the tree, not the converted messages
+                        tf_buffers[container_name] = ROS2TFBuffer(
+                            container_name=container_name,
+                            domain_id=domain_id,
+                            router_ip=router_ip,
+                            router_port=router_port,
+                            cache_time=ros2_config.tf.cache_time,
+                            topic=ros2_config.tf.topic,
+                            static_topic=ros2_config.tf.static_topic,
+                        )
                 except Exception as e:
                     logger.warning(
-                        f"ROS2 plugin initialization failed for container '{container_name}' "
+                        f"ROS2 plugin initialization failed for container '{container_name}': {e}"
                     )
                     # Continue with other containers even if one fails
 
+        # Start the plugins concurrently so one slow router or container does not delay the others
+        results = await asyncio.gather(
+            *(run_in_threadpool(plugin.start) for plugin in plugins.values()),
+            *(run_in_threadpool(tf_buffer.start) for tf_buffer in tf_buffers.values()),
+            return_exceptions=True,
+        )
+        tf_results = results[len(plugins):]
+        for (container_name, plugin), result in zip(plugins.items(), results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"ROS2 plugin initialization failed for container '{container_name}': {result}"
+                )
+                continue
+            set_ros2_plugin(container_name, plugin)
+            logger.info(
+                f"ROS2 plugin initialized for container '{container_name}' "
+            )
+        for (container_name, tf_buffer), result in zip(tf_buffers.items(), tf_results):
+            if isinstance(result, BaseException):
+                logger.warning(f"TF buffer initialization failed for container '{container_name}': {result}")
+                continue
+            set_tf_buffer(container_name, tf_buffer)
+            logger.info(f"TF buffer initialized for container '{container_name}'")
+
         logger.info("Talos initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize talos: {e}")
@@ -109,5 +188,13 @@ async def lifespan(app: FastAPI):
             logger.error(f"Error stopping ROS2 plugin for container '{container_name}': {e}")
     clear_ros2_plugins()
 
+    for container_name, tf_buffer in get_tf_buffers().items():
+        try:
+            tf_buffer.stop()
+        except Exception as e:
+            logger.error(f"Error stopping TF buffer for container '{container_name}': {e}")
+    clear_tf_buffers()
+    get_image_encoder().shutdown()
+
     logger.info("Talos shut down")
 
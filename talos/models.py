@@ -13,6 +13,68 @@ class ServiceInfo(BaseModel):
     label: str = Field(..., description="Human-readable service label", examples=["AI Worker Bringup"])
 
 
+class ROS2TimeSeriesConfig(BaseModel):
+    """Numeric time-series storage for a ROS2 topic."""
+
+    fields: list[str] = Field(
+        ...,
+        min_length=1,
+        description="Dotted numeric field paths to store (numeric segments index sequences)",
+        examples=[["position", "velocity", "effort"]],
+    )
+    capacity: int = Field(
+        default=30000, gt=0, description="Number of samples kept (ring buffer)", examples=[30000]
+    )
+    dtype: Literal["float32", "float64"] = Field(
+        default="float64", description="Storage dtype of the value columns"
+    )
+
+
+class ROS2IngestPolicyConfig(BaseModel):
+    """Ingest policy for a dynamic ROS2 topic."""
+
+    max_rate: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Maximum rate (Hz) at which messages are stored (None stores all)",
+        examples=[50.0],
+    )
+    keep: Literal["first", "latest"] = Field(
+        default="latest",
+        description="Message kept per max_rate window: 'first' drops the rest on arrival, "
+                    "'latest' caches and stores the last message of each window once it closes "
+                    "(the cached value lags by up to one window)",
+    )
+    drop_without_consumers: bool = Field(
+        default=False,
+        description="Drop messages while no REST/WebSocket client has read the topic within consumer_timeout",
+    )
+    consumer_timeout: float = Field(
+        default=5.0, gt=0, description="Seconds after the last read before the topic counts as unread"
+    )
+
+
+class ROS2PrecisionConfig(BaseModel):
+    """Float precision of a ROS2 topic's converted data."""
+
+    decimals: Optional[int] = Field(
+        None, ge=0, le=15, description="Decimal places kept for every float (None keeps full precision)", examples=[4]
+    )
+    float32: bool = Field(
+        default=False, description="Round floats to float32 precision (shortest digits identifying the float32)"
+    )
+
+
+class ROS2TFConfig(BaseModel):
+    """TF buffer of a container (transform lookups via /ros2/tf)."""
+
+    cache_time: float = Field(
+        default=10.0, gt=0, description="Seconds of transform history kept per dynamic frame for time lookups"
+    )
+    topic: str = Field(default="/tf", description="Dynamic transform topic")
+    static_topic: str = Field(default="/tf_static", description="Static transform topic")
+
+
 class ROS2Config(BaseModel):
     """ROS2 configuration for a container."""
 
@@ -35,6 +97,88 @@ class ROS2Config(BaseModel):
     router_port: Optional[int] = Field(
         None, description="Optional Zenoh router port"
     )
+    history_size: int = Field(
+        default=0,
+        ge=0,
+        description="Number of recent messages kept per dynamic topic for history queries (0 disables history)",
+        examples=[0, 100],
+    )
+    history_sizes: dict[str, int] = Field(
+        default_factory=dict,
+        description="Optional per-topic overrides of history_size (image topics keep history only when listed here)",
+        examples=[{"/joint_states": 2500}],
+    )
+    timeseries: dict[str, ROS2TimeSeriesConfig] = Field(
+        default_factory=dict,
+        description="Optional numeric time-series storage per dynamic topic",
+        examples=[{"/joint_states": {"fields": ["position", "velocity"], "capacity": 30000}}],
+    )
+    ingest: dict[str, ROS2IngestPolicyConfig] = Field(
+        default_factory=dict,
+        description="Optional ingest policy (decimation, consumer-based dropping) per dynamic topic",
+        examples=[{"/joint_states": {"max_rate": 50.0, "keep": "latest"}}],
+    )
+    precision: dict[str, ROS2PrecisionConfig] = Field(
+        default_factory=dict,
+        description="Optional: float precision per topic, applied when messages are converted for output",
+        examples=[{"/joint_states": {"decimals": 4}}],
+    )
+    diagnostics_index: bool = Field(
+        default=True,
+        description="Index the statuses of dynamic diagnostic_msgs/msg/DiagnosticArray topics "
+                    "for the /diagnostics endpoints (those topics are deserialized on arrival)",
+    )
+    tf: Optional[ROS2TFConfig] = Field(
+        None,
+        description="Optional TF buffer: keeps the transform tree of /tf and /tf_static for transform lookups",
+        examples=[{"cache_time": 10.0}],
+    )
+    lazy_subscribe: bool = Field(
+        default=False,
+        description="Subscribe dynamic topics on the first REST/WebSocket read and unsubscribe them "
+                    "after idle_timeout without reads (static topics stay subscribed)",
+    )
+    idle_timeout: float = Field(
+        default=60.0, gt=0, description="Seconds without reads before a lazily subscribed topic is unsubscribed"
+    )
+    discovery: bool = Field(
+        default=True,
+        description="Watch the live ROS2 graph (topics, types, publishers) through Zenoh liveliness tokens",
+    )
+    subscribe_workers: int = Field(
+        default=8, ge=1, description="Number of topic subscribers created concurrently at startup"
+    )
+    subscribe_timeout: float = Field(
+        default=10.0, gt=0, description="Seconds to wait for each topic's subscriber at startup before reporting it as failed"
+    )
+    memory_budget_mb: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Limit (MiB) on the estimated size of this container's cached topic data; "
+                    "dynamic topics are evicted coldest first, static topics are kept. "
+                    "With isolated_ingest it is enforced in the container's ingest process",
+    )
+    lazy_deserialize: bool = Field(
+        default=False,
+        description="Cache serialized payloads and deserialize a message only when it is first read "
+                    "(topics with time series are still deserialized on arrival)",
+    )
+    snapshot_dir: Optional[str] = Field(
+        default=None,
+        description="Directory where the last message of each static topic is saved and loaded from "
+                    "at startup (served as from_snapshot until live data arrives)",
+        examples=["/var/lib/talos/snapshots"],
+    )
+    isolated_ingest: bool = Field(
+        default=False,
+        description="Run this container's topic ingest in a separate process that publishes the latest "
+                    "encoded messages through shared memory (no history, time series, graph or runtime topics)",
+    )
+    isolated_frame_bytes: int = Field(
+        default=1024 * 1024,
+        gt=0,
+        description="Maximum encoded message size per topic with isolated_ingest; larger messages are not forwarded",
+    )
 
 
 class ContainerConfig(BaseModel):
@@ -60,6 +204,15 @@ class SystemConfig(BaseModel):
     containers: dict[str, ContainerConfig] = Field(
         default_factory=dict, description="Map of container names to their configurations"
     )
+    ros2_memory_budget_mb: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Limit (MiB) on the estimated size of cached ROS2 topic data across all containers "
+                    "with in-process ingest (isolated_ingest containers are bounded by their own budget)",
+    )
+    ros2_image_workers: int = Field(
+        default=2, ge=1, description="Threads encoding image topics to JPEG/PNG, shared by all containers"
+    )
 
 
 # API Request/Response Models
@@ -249,10 +402,112 @@ class ROS2TopicDataResponse(BaseModel):
     topic: str = Field(..., description="ROS2 topic name", examples=["/robot_description"])
     msg_type: str = Field(..., description="Message type", examples=["std_msgs/msg/String"])
     data: Optional[Any] = Field(
-        None, description="Latest message data if available"
+        None,
+        description="Latest message data if available; with the fields parameter, "
+                    "an object mapping each requested field path to its value",
     )
     available: bool = Field(..., description="Whether topic data is available")
     domain_id: int = Field(..., description="ROS2 domain ID used")
+    seq: Optional[int] = Field(
+        None,
+        description="Per-topic sequence number of the message; pass it as after_seq to poll for changes",
+    )
+    from_snapshot: bool = Field(
+        False, description="Whether the data was loaded from an on-disk snapshot and not yet replaced by live data"
+    )
+
+
+class ROS2TopicSubscribeRequest(BaseModel):
+    """Request body for PUT /containers/{container}/ros2/topics/{topic}."""
+
+    msg_type: Optional[str] = Field(
+        default=None,
+        description="Message type; taken from the live topic graph when omitted",
+        examples=["sensor_msgs/msg/JointState"],
+    )
+    static: bool = Field(
+        default=False,
+        description="Subscribe with TRANSIENT_LOCAL durability and never mark data stale (like static_topics)",
+    )
+
+
+class ROS2TopicSubscriptionResponse(BaseModel):
+    """Response for PUT/DELETE /containers/{container}/ros2/topics/{topic}."""
+
+    container: str = Field(..., description="Container name")
+    topic: str = Field(..., description="ROS2 topic name", examples=["/joint_states"])
+    action: Literal["added", "removed"] = Field(..., description="Action that was performed")
+    msg_type: Optional[str] = Field(None, description="Message type of the added topic")
+    static: Optional[bool] = Field(None, description="Whether the added topic is static")
+    subscribed: bool = Field(
+        ..., description="Whether the subscription is active (lazy dynamic topics subscribe on first read)"
+    )
+
+
+class ROS2TopicSample(BaseModel):
+    """A single buffered message of a ROS2 topic."""
+
+    received_at: float = Field(..., description="Receive timestamp (seconds since epoch)")
+    data: Optional[Any] = Field(None, description="Message data")
+
+
+class ROS2TopicHistoryResponse(BaseModel):
+    """Response for GET /containers/{container}/ros2/history?topic=..."""
+
+    container: str = Field(..., description="Container name")
+    topic: str = Field(..., description="ROS2 topic name", examples=["/joint_states"])
+    msg_type: str = Field(..., description="Message type", examples=["sensor_msgs/msg/JointState"])
+    domain_id: int = Field(..., description="ROS2 domain ID used")
+    samples: list[ROS2TopicSample] = Field(..., description="Buffered messages in the window, oldest first")
+
+
+class ROS2TopicSeriesStats(BaseModel):
+    """Per-column summary statistics of a time-series field."""
+
+    count: int = Field(..., description="Number of samples in the window")
+    min: list[Optional[float]] = Field(..., description="Per-column minimum")
+    max: list[Optional[float]] = Field(..., description="Per-column maximum")
+    mean: list[Optional[float]] = Field(..., description="Per-column mean")
+
+
+class ROS2TopicSeriesResponse(BaseModel):
+    """Response for GET /containers/{container}/ros2/series?topic=..."""
+
+    container: str = Field(..., description="Container name")
+    topic: str = Field(..., description="ROS2 topic name", examples=["/joint_states"])
+    field: str = Field(..., description="Field path", examples=["position"])
+    period: Optional[float] = Field(None, description="Resample period in seconds, if resampled")
+    timestamps: list[float] = Field(..., description="Sample (or bucket start) receive timestamps")
+    values: list[list[Optional[float]]] = Field(..., description="Row values per timestamp")
+    stats: ROS2TopicSeriesStats = Field(..., description="Summary statistics over the window")
+
+
+class ROS2TopicPlotResponse(BaseModel):
+    """Response for GET /containers/{container}/ros2/plot?topic=..."""
+
+    container: str = Field(..., description="Container name")
+    topic: str = Field(..., description="ROS2 topic name", examples=["/joint_states"])
+    field: str = Field(..., description="Numeric field path", examples=["position.3"])
+    method: Literal["lttb", "minmax"] = Field(..., description="Downsampling method")
+    source_count: int = Field(..., description="Number of buffered samples in the window")
+    timestamps: list[float] = Field(..., description="Receive timestamps of the selected samples")
+    values: list[float] = Field(..., description="Values of the selected samples")
+
+
+class ROS2TopicStats(BaseModel):
+    """Ingest statistics for a ROS2 topic."""
+
+    message_count: int = Field(..., description="Messages received since subscription")
+    rate_hz: Optional[float] = Field(None, description="Smoothed receive rate (decays when silent)")
+    bandwidth_bps: Optional[float] = Field(None, description="Smoothed payload bandwidth in bytes/s")
+    payload_bytes_total: int = Field(..., description="Total serialized payload bytes received")
+    avg_payload_bytes: Optional[float] = Field(None, description="Smoothed serialized payload size")
+    dropped_rate_limited: int = Field(0, description="Messages not stored because of the ingest max_rate")
+    dropped_no_consumers: int = Field(0, description="Messages dropped because no client was reading the topic")
+    interval_min_ms: Optional[float] = Field(None, description="Minimum inter-arrival time (recent window)")
+    interval_max_ms: Optional[float] = Field(None, description="Maximum inter-arrival time (recent window)")
+    interval_p99_ms: Optional[float] = Field(None, description="Approximate p99 inter-arrival time (recent window)")
+    jitter_ms: Optional[float] = Field(None, description="Smoothed mean absolute deviation of inter-arrival time")
 
 
 class ROS2TopicStatus(BaseModel):
@@ -263,6 +518,141 @@ class ROS2TopicStatus(BaseModel):
     configured: bool = Field(..., description="Whether topic is configured")
     available: bool = Field(..., description="Whether topic has received data")
     subscribed: bool = Field(..., description="Whether subscription is active")
+    stats: Optional[ROS2TopicStats] = Field(None, description="Ingest statistics")
+    subscribe_latency_ms: Optional[float] = Field(
+        None, description="Duration of the last successful subscriber creation (milliseconds)"
+    )
+    subscribe_error: Optional[str] = Field(
+        None, description="Error of the last failed or timed-out subscriber creation"
+    )
+    cached_bytes: int = Field(0, description="Estimated size of the topic's cached message and history (bytes)")
+    from_snapshot: bool = Field(False, description="Whether the cached data was loaded from an on-disk snapshot")
+    shared_by: int = Field(
+        0, description="Number of containers receiving this topic through one shared subscription (0 if not subscribed)"
+    )
+
+
+class ROS2GraphEndpoint(BaseModel):
+    """A publisher or subscription announced in the ROS2 graph."""
+
+    node_name: str = Field(..., description="Node name")
+    node_namespace: str = Field(..., description="Node namespace")
+    msg_type: str = Field(..., description="Message type", examples=["sensor_msgs/msg/JointState"])
+    type_hash: str = Field(..., description="Message type hash")
+    qos: str = Field(..., description="Encoded QoS profile of the endpoint")
+
+
+class ROS2GraphTopic(BaseModel):
+    """A topic of the live ROS2 graph."""
+
+    topic: str = Field(..., description="Topic name", examples=["/joint_states"])
+    types: list[str] = Field(..., description="Message types announced for the topic")
+    publishers: list[ROS2GraphEndpoint] = Field(..., description="Publishers of the topic")
+    subscribers: list[ROS2GraphEndpoint] = Field(..., description="Subscriptions to the topic")
+    configured: bool = Field(..., description="Whether talos is configured for the topic")
+
+
+class ROS2GraphResponse(BaseModel):
+    """Response for GET /containers/{container}/ros2/graph."""
+
+    container: str = Field(..., description="Container name")
+    domain_id: int = Field(..., description="ROS2 domain ID")
+    topics: list[ROS2GraphTopic] = Field(..., description="Topics currently announced in the domain")
+
+
+class ROS2DiagnosticValue(BaseModel):
+    """A key/value pair of a diagnostic status."""
+
+    key: str = Field(..., description="Value name")
+    value: str = Field(..., description="Value")
+
+
+class ROS2DiagnosticStatus(BaseModel):
+    """Latest state of a diagnostic status, indexed by hardware_id and name."""
+
+    name: str = Field(..., description="Status name", examples=["motor_driver: left_arm"])
+    hardware_id: str = Field(..., description="Hardware ID")
+    level: int = Field(..., description="Level (0 OK, 1 WARN, 2 ERROR, 3 STALE)")
+    level_name: str = Field(..., description="Level name", examples=["OK", "WARN", "ERROR", "STALE"])
+    message: str = Field(..., description="Status message")
+    values: list[ROS2DiagnosticValue] = Field(..., description="Key/value pairs of the status")
+    last_update: float = Field(..., description="Receive time of the latest message carrying the status")
+    last_change: float = Field(..., description="Receive time of the latest change of level, message or values")
+    seq: int = Field(..., description="Index sequence number of the latest change")
+
+
+class ROS2DiagnosticsResponse(BaseModel):
+    """Response for GET /containers/{container}/ros2/diagnostics."""
+
+    container: str = Field(..., description="Container name")
+    topic: str = Field(..., description="DiagnosticArray topic", examples=["/diagnostics"])
+    seq: int = Field(..., description="Sequence number of the latest change; pass it as after_seq to get changes")
+    level_counts: dict[str, int] = Field(
+        ..., description="Number of statuses per level name", examples=[{"OK": 40, "WARN": 2}]
+    )
+    statuses: list[ROS2DiagnosticStatus] = Field(..., description="Matching statuses")
+
+
+class ROS2Vector3(BaseModel):
+    """A 3D vector."""
+
+    x: float = Field(..., description="X component")
+    y: float = Field(..., description="Y component")
+    z: float = Field(..., description="Z component")
+
+
+class ROS2Quaternion(BaseModel):
+    """A rotation quaternion."""
+
+    x: float = Field(..., description="X component")
+    y: float = Field(..., description="Y component")
+    z: float = Field(..., description="Z component")
+    w: float = Field(..., description="W component")
+
+
+class ROS2TransformResponse(BaseModel):
+    """Response for GET /containers/{container}/ros2/tf."""
+
+    container: str = Field(..., description="Container name")
+    target: str = Field(..., description="Target frame", examples=["base_link"])
+    source: str = Field(..., description="Source frame", examples=["end_effector_link"])
+    time: float = Field(
+        ..., description="Time of the transform (ROS time in seconds; 0 if all transforms on the chain are static)"
+    )
+    translation: ROS2Vector3 = Field(..., description="Position of the source frame in the target frame")
+    rotation: ROS2Quaternion = Field(..., description="Orientation of the source frame in the target frame")
+
+
+class ROS2TFFrame(BaseModel):
+    """A frame of the TF tree with the range of its buffered transforms."""
+
+    frame: str = Field(..., description="Child frame", examples=["link1"])
+    parent: str = Field(..., description="Parent frame", examples=["base_link"])
+    static: bool = Field(..., description="Whether the frame comes from the static transform topic")
+    latest: float = Field(..., description="Stamp of the newest buffered transform (seconds)")
+    oldest: float = Field(..., description="Stamp of the oldest buffered transform (seconds)")
+
+
+class ROS2TFFramesResponse(BaseModel):
+    """Response for GET /containers/{container}/ros2/tf/frames."""
+
+    container: str = Field(..., description="Container name")
+    message_count: int = Field(..., description="Number of TF messages received")
+    frames: list[ROS2TFFrame] = Field(..., description="Frames with a parent, sorted by name")
+
+
+class ROS2MemoryUsage(BaseModel):
+    """Estimated memory used by cached ROS2 topic data, with the configured budgets."""
+
+    used_bytes: int = Field(..., description="Cached data of this container (bytes)")
+    budget_bytes: Optional[int] = Field(None, description="Budget of this container (bytes), null if unlimited")
+    process_used_bytes: int = Field(
+        ..., description="Cached data of all containers with in-process ingest (bytes)"
+    )
+    process_budget_bytes: Optional[int] = Field(
+        None, description="Process-wide budget (bytes), null if unlimited"
+    )
+    evicted_count: int = Field(..., description="Topic evictions made in this container to meet budgets")
 
 
 class ROS2TopicsListResponse(BaseModel):
@@ -271,4 +661,5 @@ class ROS2TopicsListResponse(BaseModel):
     container: str = Field(..., description="Container name")
     domain_id: int = Field(..., description="ROS2 domain ID")
     topics: list[ROS2TopicStatus] = Field(..., description="List of topic statuses")
+    memory: Optional[ROS2MemoryUsage] = Field(None, description="Memory usage of cached topic data")
 
@@ -0,0 +1,188 @@
+"""Indexed view of diagnostic_msgs/msg/DiagnosticArray topics.
+
+Every /diagnostics message repeats the full array of statuses, although
+usually only a few of them change. The index keeps the latest state of
+each status keyed by (hardware_id, name), with per-level sets for level
+queries. Each change of a status's level, message or values is stamped
+with an index-wide sequence number. Statuses are kept in change order, so
+"what changed after seq N" only walks the changed statuses.
+"""
+
+import threading
+from typing import Any, Optional
+
+DIAGNOSTIC_ARRAY_TYPE = "diagnostic_msgs/msg/DiagnosticArray"
+
+# diagnostic_msgs/msg/DiagnosticStatus level constants
+LEVEL_NAMES = {0: "OK", 1: "WARN", 2: "ERROR", 3: "STALE"}
+LEVELS_BY_NAME = {name: level for level, name in LEVEL_NAMES.items()}
+
+
+def parse_level(level: str) -> int:
+    """Parse a diagnostic level given as a number or name (OK, WARN, ERROR, STALE).
+
+    Raises:
+        ValueError: If the level is unknown.
+    """
+    by_name = LEVELS_BY_NAME.get(level.upper())
+    if by_name is not None:
+        return by_name
+    try:
+        return int(level)
+    except ValueError:
+        raise ValueError(f"Unknown diagnostic level '{level}' (use 0-3 or {', '.join(LEVELS_BY_NAME)})")
+
+
+def _level_value(level: Any) -> int:
+    """Normalize a message level (uint8 may arrive as int or bytes)."""
+    if isinstance(level, (bytes, bytearray)):
+        return level[0] if level else 0
+    return int(level)
+
+
+class DiagnosticStatusEntry:
+    """Latest state of one diagnostic status.
+
+    Attributes:
+        name: Status name
+        hardware_id: Hardware ID
+        level: Level (0 OK, 1 WARN, 2 ERROR, 3 STALE)
+        message: Status message
+        values: Key/value pairs in message order
+        last_update: Receive time of the latest message carrying the status
+        last_change: Receive time of the latest change of level, message or values
+        seq: Index sequence number of the latest change
+    """
+
+    __slots__ = ("name", "hardware_id", "level", "message", "values", "last_update", "last_change", "seq")
+
+    def __init__(self, name: str, hardware_id: str):
+        self.name = name
+        self.hardware_id = hardware_id
+        self.level = 0
+        self.message = ""
+        self.values: tuple[tuple[str, str], ...] = ()
+        self.last_update = 0.0
+        self.last_change = 0.0
+        self.seq = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the JSON-serializable form of the status."""
+        return {
+            "name": self.name,
+            "hardware_id": self.hardware_id,
+            "level": self.level,
+            "level_name": LEVEL_NAMES.get(self.level, str(self.level)),
+            "message": self.message,
+            "values": [{"key": key, "value": value} for key, value in self.values],
+            "last_update": self.last_update,
+            "last_change": self.last_change,
+            "seq": self.seq,
+        }
+
+
+class DiagnosticsIndex:
+    """Latest diagnostic statuses of one DiagnosticArray topic.
+
+    Attributes:
+        seq: Sequence number of the latest change (0 before the first status)
+    """
+
+    def __init__(self):
+        self.seq = 0
+        # Insertion order is change order: changed statuses are moved to the end
+        self._entries: dict[tuple[str, str], DiagnosticStatusEntry] = {}
+        self._by_level: dict[int, dict[tuple[str, str], DiagnosticStatusEntry]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, received_at: float, msg: Any) -> int:
+        """Index the statuses of a DiagnosticArray message.
+
+        Args:
+            received_at: Receive timestamp of the message.
+            msg: diagnostic_msgs/msg/DiagnosticArray message object.
+
+        Returns:
+            Number of statuses that are new or changed.
+        """
+        changed = 0
+        with self._lock:
+            for status in msg.status:
+                key = (status.hardware_id, status.name)
+                level = _level_value(status.level)
+                values = tuple((item.key, item.value) for item in status.values)
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = DiagnosticStatusEntry(status.name, status.hardware_id)
+                elif entry.level == level and entry.message == status.message and entry.values == values:
+                    entry.last_update = received_at
+                    continue
+                else:
+                    del self._entries[key]
+                    self._by_level[entry.level].pop(key, None)
+
+                self.seq += 1
+                entry.level = level
+                entry.message = status.message
+                entry.values = values
+                entry.last_update = received_at
+                entry.last_change = received_at
+                entry.seq = self.seq
+                self._entries[key] = entry
+                self._by_level.setdefault(level, {})[key] = entry
+                changed += 1
+        return changed
+
+    def get_statuses(
+        self,
+        level: Optional[int] = None,
+        hardware_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Get statuses, optionally filtered, sorted by hardware_id and name.
+
+        Args:
+            level: Only statuses at this level (uses the level index).
+            hardware_id: Only statuses of this hardware ID.
+            name: Only statuses with this name.
+
+        Returns:
+            List of status dictionaries.
+        """
+        with self._lock:
+            entries = self._entries if level is None else self._by_level.get(level, {})
+            return [
+                entry.to_dict()
+                for key, entry in sorted(entries.items())
+                if (hardware_id is None or entry.hardware_id == hardware_id)
+                and (name is None or entry.name == name)
+            ]
+
+    def get_changes(self, after_seq: int) -> list[dict[str, Any]]:
+        """Get the statuses changed after a sequence number, oldest change first."""
+        changes = []
+        with self._lock:
+            for entry in reversed(self._entries.values()):
+                if entry.seq <= after_seq:
+                    break
+                changes.append(entry.to_dict())
+        changes.reverse()
+        return changes
+
+    def get_level_counts(self) -> dict[str, int]:
+        """Get the number of statuses per level name."""
+        with self._lock:
+            return {
+                LEVEL_NAMES.get(level, str(level)): len(entries)
+                for level, entries in sorted(self._by_level.items())
+                if entries
+            }
+
+    def clear(self) -> None:
+        """Remove all statuses (the sequence number keeps counting)."""
+        with self._lock:
+            self._entries.clear()
+            self._by_level.clear()
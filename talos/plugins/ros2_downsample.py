@@ -0,0 +1,126 @@
+"""Visual downsampling of numeric time series for plotting.
+
+Both methods select a subset of the original samples (returned as indices),
+so every plotted point is a real measurement:
+
+- ``lttb``: Largest-Triangle-Three-Buckets, which keeps the points that
+  contribute most to the visual shape of the line.
+- ``minmax``: keeps the minimum and maximum of each bucket, which preserves
+  spikes and the envelope of noisy signals.
+
+NaN samples are dropped before downsampling.
+"""
+
+from typing import Literal
+
+import numpy as np
+
+DownsampleMethod = Literal["lttb", "minmax"]
+
+
+def downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    points: int,
+    method: DownsampleMethod = "lttb",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a series to at most ``points`` samples.
+
+    Args:
+        x: Sample timestamps, ascending, shape (n,).
+        y: Sample values, shape (n,).
+        points: Target number of points.
+        method: "lttb" or "minmax".
+
+    Returns:
+        Tuple of (x, y) arrays of the selected samples, in time order.
+
+    Raises:
+        ValueError: If method is unknown or points is not positive.
+    """
+    if points <= 0:
+        raise ValueError(f"Target point count must be positive, got {points}")
+
+    valid = ~np.isnan(y)
+    if not valid.all():
+        x, y = x[valid], y[valid]
+
+    if method == "lttb":
+        indices = lttb_indices(x, y, points)
+    elif method == "minmax":
+        indices = minmax_indices(y, points)
+    else:
+        raise ValueError(f"Unknown downsample method '{method}'")
+    return x[indices], y[indices]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Select sample indices with Largest-Triangle-Three-Buckets.
+
+    The first and last samples are always kept. The samples in between are
+    split into ``threshold - 2`` buckets, and from each bucket the sample
+    forming the largest triangle with the previously selected sample and the
+    average of the next bucket is kept.
+
+    Args:
+        x: Sample x values, ascending, shape (n,).
+        y: Sample y values, shape (n,).
+        threshold: Number of samples to keep.
+
+    Returns:
+        Ascending array of selected indices.
+    """
+    n = x.size
+    if threshold >= n:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1])[:threshold]
+
+    # Relative x keeps triangle areas precise for epoch timestamps
+    x = x - x[0]
+    edges = np.append(np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.int64), n)
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        bx = x[start:end]
+        by = y[start:end]
+        areas = np.abs((x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[bucket + 1] = a
+    return selected
+
+
+def minmax_indices(y: np.ndarray, points: int) -> np.ndarray:
+    """Select the minimum and maximum sample of each bucket.
+
+    Samples are split into ``points // 2`` equal-count buckets. The result
+    holds at most ``points`` indices (fewer where min and max coincide).
+
+    Args:
+        y: Sample values, shape (n,).
+        points: Target number of samples.
+
+    Returns:
+        Ascending array of selected indices.
+    """
+    n = y.size
+    buckets = max(points // 2, 1)
+    if n <= points or n <= buckets:
+        return np.arange(n)
+
+    size = -(-n // buckets)  # ceil division
+    padding = buckets * size - n
+    low = np.concatenate((y, np.full(padding, np.inf))).reshape(buckets, size)
+    high = np.concatenate((y, np.full(padding, -np.inf))).reshape(buckets, size)
+
+    offsets = np.arange(buckets) * size
+    indices = np.concatenate((offsets + low.argmin(axis=1), offsets + high.argmax(axis=1)))
+    return np.unique(indices[indices < n])
@@ -0,0 +1,108 @@
+"""JSON encoding helpers for ROS2 topic data.
+
+Topic payloads are encoded once per cached message and reused by every
+reader, so the REST and WebSocket endpoints only wrap pre-encoded bytes
+in their response envelopes instead of re-serializing the message.
+"""
+
+import json
+from typing import Any, Optional
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode an object to compact UTF-8 JSON bytes.
+
+    Uses the same options as Starlette's ``WebSocket.send_json`` so the
+    output is identical to what the endpoints previously sent.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        Encoded JSON bytes.
+    """
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def encode_topic_data_response(
+    container: str,
+    topic: str,
+    msg_type: str,
+    data_json: bytes,
+    available: bool,
+    domain_id: int,
+    seq: Optional[int] = None,
+    from_snapshot: bool = False,
+) -> bytes:
+    """Encode a ROS2TopicDataResponse body around pre-encoded message data.
+
+    Args:
+        container: Container name.
+        topic: Topic name.
+        msg_type: Message type string.
+        data_json: Pre-encoded JSON bytes for the ``data`` field.
+        available: Whether topic data is available.
+        domain_id: ROS2 domain ID.
+        seq: Sequence number of the message, or None if no data is available.
+        from_snapshot: Whether the data was loaded from an on-disk snapshot.
+
+    Returns:
+        Encoded JSON bytes matching the ROS2TopicDataResponse schema.
+    """
+    envelope = encode_json({
+        "container": container,
+        "topic": topic,
+        "msg_type": msg_type,
+        "available": available,
+        "domain_id": domain_id,
+        "seq": seq,
+        "from_snapshot": from_snapshot,
+    })
+    # Splice the pre-encoded data in before the closing brace
+    return b"".join((envelope[:-1], b',"data":', data_json, b"}"))
+
+
+def encode_topic_history_response(
+    container: str,
+    topic: str,
+    msg_type: str,
+    domain_id: int,
+    samples: list[tuple[float, bytes]],
+) -> bytes:
+    """Encode a ROS2TopicHistoryResponse body around pre-encoded sample data.
+
+    Args:
+        container: Container name.
+        topic: Topic name.
+        msg_type: Message type string.
+        domain_id: ROS2 domain ID.
+        samples: List of (received_at, data_json) tuples, oldest first.
+
+    Returns:
+        Encoded JSON bytes matching the ROS2TopicHistoryResponse schema.
+    """
+    envelope = encode_json({
+        "container": container,
+        "topic": topic,
+        "msg_type": msg_type,
+        "domain_id": domain_id,
+    })
+    parts = [envelope[:-1], b',"samples":[']
+    for index, (received_at, data_json) in enumerate(samples):
+        if index:
+            parts.append(b",")
+        parts.extend((b'{"received_at":', encode_json(received_at), b',"data":', data_json, b"}"))
+    parts.append(b"]}")
+    return b"".join(parts)
+
+
+def encode_websocket_data_message(payload_json: bytes) -> bytes:
+    """Wrap a pre-encoded payload in the WebSocket ``data`` message envelope.
+
+    Args:
+        payload_json: Pre-encoded JSON bytes for the message ``data`` field.
+
+    Returns:
+        Encoded JSON bytes of ``{"type": "data", "data": <payload>}``.
+    """
+    return b"".join((b'{"type":"data","data":', payload_json, b"}"))
@@ -0,0 +1,182 @@
+"""Live ROS2 topic graph discovered through Zenoh liveliness tokens.
+
+rmw_zenoh announces every publisher and subscription with a liveliness
+token of the form::
+
+    @ros2_lv/<domain>/<zid>/<node_id>/<entity_id>/<MP|MS>/<enclave>/<namespace>/
+    <node_name>/<topic>/<dds_type>/<type_hash>/<qos>
+
+The index subscribes to the tokens of one domain (with history, so tokens
+that already exist are reported once at startup) and applies each token
+appearing or disappearing as an incremental update. Lookups are served from
+the index; the graph is never rescanned.
+"""
+
+import logging
+import threading
+from typing import Any, Optional
+
+import zenoh
+from zenoh_ros2_sdk.keyexpr import ADMIN_SPACE
+from zenoh_ros2_sdk.utils import dds_to_ros_type, demangle_name, demangle_name_optional_leading_slash
+
+from talos.plugins.ros2_session import ROS2DomainSession
+
+logger = logging.getLogger(__name__)
+
+_KIND_PUBLISHER = "MP"
+_KIND_SUBSCRIPTION = "MS"
+# Token key expression segment indices (see module docstring)
+_IDX_KIND = 5
+_IDX_NAMESPACE = 7
+_IDX_NODE_NAME = 8
+_IDX_TOPIC = 9
+_IDX_DDS_TYPE = 10
+_IDX_TYPE_HASH = 11
+_IDX_QOS = 12
+
+
+def _parse_endpoint_token(key_expr: str) -> Optional[tuple[str, str, dict[str, Any]]]:
+    """Parse a publisher/subscription liveliness token.
+
+    Args:
+        key_expr: Liveliness token key expression.
+
+    Returns:
+        Tuple of (kind, topic, endpoint_info), or None if the token is not a
+        topic endpoint.
+    """
+    parts = key_expr.split("/")
+    if len(parts) <= _IDX_TYPE_HASH or parts[0] != ADMIN_SPACE:
+        return None
+    kind = parts[_IDX_KIND]
+    if kind not in (_KIND_PUBLISHER, _KIND_SUBSCRIPTION):
+        return None
+    return kind, demangle_name(parts[_IDX_TOPIC]), {
+        "node_name": demangle_name_optional_leading_slash(parts[_IDX_NODE_NAME]),
+        "node_namespace": demangle_name_optional_leading_slash(parts[_IDX_NAMESPACE]),
+        "msg_type": dds_to_ros_type(parts[_IDX_DDS_TYPE]),
+        "type_hash": parts[_IDX_TYPE_HASH],
+        "qos": parts[_IDX_QOS] if len(parts) > _IDX_QOS else "",
+    }
+
+
+class ROS2GraphIndex:
+    """Incrementally maintained index of topic -> types -> publishers/subscribers.
+
+    Attributes:
+        domain: Shared session of the router and domain being watched
+        domain_id: ROS2 domain ID being watched
+    """
+
+    def __init__(self, domain: ROS2DomainSession):
+        self.domain = domain
+        self.domain_id = domain.domain_id
+        # token key -> (kind, topic); topic -> kind -> token key -> endpoint info
+        self._tokens: dict[str, tuple[str, str]] = {}
+        self._topics: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        self._snapshot: Optional[list[dict[str, Any]]] = None  # Rebuilt lazily after changes
+        self._lock = threading.Lock()
+        self._subscriber = None
+
+    def start(self) -> None:
+        """Subscribe to the domain's liveliness tokens.
+
+        Raises:
+            Exception: If the liveliness subscriber cannot be declared.
+        """
+        self._subscriber = self.domain.zenoh.liveliness.declare_subscriber(
+            f"{ADMIN_SPACE}/{self.domain_id}/**",
+            self._on_sample,
+            history=True,
+        )
+
+    def close(self) -> None:
+        """Stop watching the graph and clear the index."""
+        if self._subscriber is not None:
+            try:
+                self._subscriber.undeclare()
+            except Exception as e:
+                logger.warning(f"Error closing ROS2 graph subscriber (domain {self.domain_id}): {e}")
+            self._subscriber = None
+        with self._lock:
+            self._tokens.clear()
+            self._topics.clear()
+            self._snapshot = None
+
+    def topics(self, include_hidden: bool = False) -> list[dict[str, Any]]:
+        """Get the current topic graph.
+
+        Args:
+            include_hidden: Include hidden topics (names starting with "/_").
+
+        Returns:
+            List of dictionaries (sorted by topic) with 'topic', 'types',
+            'publishers' and 'subscribers'. Each endpoint has 'node_name',
+            'node_namespace', 'msg_type', 'type_hash' and 'qos'. The
+            entries are shared between callers and must not be modified.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = [self._describe(topic) for topic in sorted(self._topics)]
+            snapshot = self._snapshot
+        if include_hidden:
+            return snapshot
+        return [entry for entry in snapshot if not entry["topic"].startswith("/_")]
+
+    def get_topic(self, topic: str) -> Optional[dict[str, Any]]:
+        """Get the graph entry of a single topic, or None if nobody announces it."""
+        with self._lock:
+            if topic not in self._topics:
+                return None
+            return self._describe(topic)
+
+    def _describe(self, topic: str) -> dict[str, Any]:
+        """Build the graph entry of a topic (caller holds the lock)."""
+        endpoints = self._topics[topic]
+        publishers = list(endpoints.get(_KIND_PUBLISHER, {}).values())
+        subscribers = list(endpoints.get(_KIND_SUBSCRIPTION, {}).values())
+        return {
+            "topic": topic,
+            "types": sorted({endpoint["msg_type"] for endpoint in publishers + subscribers}),
+            "publishers": publishers,
+            "subscribers": subscribers,
+        }
+
+    def _on_sample(self, sample: Any) -> None:
+        """Apply a liveliness token change (called from the Zenoh thread)."""
+        try:
+            key = str(sample.key_expr)
+            with self._lock:
+                if sample.kind == zenoh.SampleKind.DELETE:
+                    self._remove_token(key)
+                else:
+                    self._add_token(key)
+        except Exception as e:
+            logger.warning(f"Error applying ROS2 graph update (domain {self.domain_id}): {e}")
+
+    def _add_token(self, key: str) -> None:
+        """Index a token (caller holds the lock)."""
+        if key in self._tokens:
+            return
+        parsed = _parse_endpoint_token(key)
+        if parsed is None:
+            return
+        kind, topic, endpoint = parsed
+        self._tokens[key] = (kind, topic)
+        self._topics.setdefault(topic, {}).setdefault(kind, {})[key] = endpoint
+        self._snapshot = None
+
+    def _remove_token(self, key: str) -> None:
+        """Remove a token from the index (caller holds the lock)."""
+        indexed = self._tokens.pop(key, None)
+        if indexed is None:
+            return
+        kind, topic = indexed
+        endpoints = self._topics[topic]
+        endpoints[kind].pop(key, None)
+        if not endpoints[kind]:
+            del endpoints[kind]
+        if not endpoints:
+            del self._topics[topic]
+        self._snapshot = None
@@ -0,0 +1,293 @@
+"""Image topics: compact metadata conversion and on-demand JPEG/PNG encoding.
+
+Converting a sensor_msgs/msg/Image like any other message turns its pixel
+buffer into a JSON list of byte values (several MB per frame for a camera),
+so image topics are converted to their metadata only, and the plugin keeps
+the serialized payload of every frame as it arrives.
+
+Pixels are encoded only when a client asks for them, in the requested
+format, quality and maximum size, on a small process-wide worker pool
+(Pillow releases the GIL while resizing and encoding). The latest result of
+each (container, topic, encoding) is kept, so clients watching the same
+camera with the same settings share one encode per frame.
+
+Raw encodings supported: rgb8, bgr8, rgba8, bgra8, mono8, 8UC1, 8UC3,
+8UC4, mono16, 16UC1 and 32FC1. 16-bit and float images (depth) are
+normalized to 8 bits over their value range for preview.
+sensor_msgs/msg/CompressedImage frames are passed through unchanged when
+they already match the requested format and size.
+"""
+
+import copy
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import numpy as np
+from PIL import Image
+
+from talos.plugins.ros2_message_converter import convert_message
+
+IMAGE_TYPE = "sensor_msgs/msg/Image"
+COMPRESSED_IMAGE_TYPE = "sensor_msgs/msg/CompressedImage"
+IMAGE_TYPES = frozenset((IMAGE_TYPE, COMPRESSED_IMAGE_TYPE))
+
+MEDIA_TYPES = {"jpeg": "image/jpeg", "png": "image/png"}
+DEFAULT_QUALITY = 80  # JPEG quality (1-95)
+MAX_QUALITY = 95  # Pillow: above 95 only grows the file
+MAX_DIMENSION = 8192  # pixels - upper bound of a requested width/height
+PNG_COMPRESS_LEVEL = 3  # zlib level: most of the size gain of level 6 at a fraction of the CPU
+ENCODE_WORKERS = 2  # default size of the process-wide encoding pool
+MAX_CACHED_IMAGES = 64  # encoded frames kept, one per (container, topic, encoding)
+
+# Raw encoding -> (numpy dtype, channels, reversed channel order)
+_RAW_ENCODINGS: dict[str, tuple[str, int, bool]] = {
+    "rgb8": ("u1", 3, False),
+    "bgr8": ("u1", 3, True),
+    "rgba8": ("u1", 4, False),
+    "bgra8": ("u1", 4, True),
+    "mono8": ("u1", 1, False),
+    "8UC1": ("u1", 1, False),
+    "8UC3": ("u1", 3, True),  # OpenCV order, as cv_bridge assumes
+    "8UC4": ("u1", 4, True),
+    "mono16": ("u2", 1, False),
+    "16UC1": ("u2", 1, False),
+    "32FC1": ("f4", 1, False),
+}
+
+
+class ImageEncoding:
+    """Requested output of an image: format, JPEG quality and maximum size.
+
+    Images are scaled down to fit max_width x max_height, keeping their
+    aspect ratio; they are never scaled up.
+
+    Attributes:
+        image_format: "jpeg" or "png"
+        quality: JPEG quality (ignored for PNG)
+        max_width: Maximum width in pixels, or None
+        max_height: Maximum height in pixels, or None
+    """
+
+    __slots__ = ("image_format", "quality", "max_width", "max_height")
+
+    def __init__(
+        self,
+        image_format: str = "jpeg",
+        quality: int = DEFAULT_QUALITY,
+        max_width: Optional[int] = None,
+        max_height: Optional[int] = None,
+    ):
+        """Initialize an image encoding.
+
+        Raises:
+            ValueError: If the format is unknown or a value is out of range.
+        """
+        image_format = image_format.lower()
+        if image_format == "jpg":
+            image_format = "jpeg"
+        if image_format not in MEDIA_TYPES:
+            raise ValueError(f"Image format must be one of {', '.join(MEDIA_TYPES)}, got '{image_format}'")
+        if not 1 <= quality <= MAX_QUALITY:
+            raise ValueError(f"Image quality must be between 1 and {MAX_QUALITY}, got {quality}")
+        for name, value in (("width", max_width), ("height", max_height)):
+            if value is not None and not 1 <= value <= MAX_DIMENSION:
+                raise ValueError(f"Image {name} must be between 1 and {MAX_DIMENSION}, got {value}")
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+        self.max_height = max_height
+
+    @property
+    def key(self) -> tuple[str, int, Optional[int], Optional[int]]:
+        """Hashable identity of the encoding (PNG ignores quality)."""
+        quality = self.quality if self.image_format == "jpeg" else 0
+        return (self.image_format, quality, self.max_width, self.max_height)
+
+    @property
+    def media_type(self) -> str:
+        """MIME type of the encoded image."""
+        return MEDIA_TYPES[self.image_format]
+
+    def fits(self, width: int, height: int) -> bool:
+        """Whether an image of this size needs no downscaling."""
+        return (self.max_width is None or width <= self.max_width) and (
+            self.max_height is None or height <= self.max_height
+        )
+
+
+# ============================================================================
+# Conversion
+# ============================================================================
+
+def convert_image_message(msg: Any) -> Any:
+    """Convert an Image or CompressedImage message to a dict without its pixel data.
+
+    The data field is replaced by data_size, its length in bytes.
+    """
+    # A shallow copy: the message may be shared with other containers and encoder threads
+    stripped = copy.copy(msg)
+    stripped.data = msg.data[:0]
+    result = convert_message(stripped)
+    if isinstance(result, dict):
+        result["data"] = None
+        result["data_size"] = len(msg.data)
+    return result
+
+
+def image_to_array(msg: Any) -> np.ndarray:
+    """Get the pixels of a sensor_msgs/msg/Image as an 8-bit array (H x W or H x W x C).
+
+    Raises:
+        ValueError: If the encoding is unsupported or the buffer is too small.
+    """
+    layout = _RAW_ENCODINGS.get(msg.encoding)
+    if layout is None:
+        raise ValueError(
+            f"Unsupported image encoding '{msg.encoding}' (supported: {', '.join(_RAW_ENCODINGS)})"
+        )
+    dtype_code, channels, reverse = layout
+    dtype = np.dtype(dtype_code).newbyteorder(">" if msg.is_bigendian else "<")
+    height, width, step = msg.height, msg.width, msg.step
+    row_bytes = width * channels * dtype.itemsize
+    buffer = np.frombuffer(msg.data, dtype=np.uint8)
+    if step < row_bytes or buffer.size < step * height:
+        raise ValueError(f"Image buffer of {buffer.size} bytes is too small for {width}x{height} {msg.encoding}")
+
+    # Rows may be padded to step bytes
+    rows = buffer[:step * height].reshape(height, step)[:, :row_bytes]
+    pixels = np.ascontiguousarray(rows).view(dtype).reshape(height, width, channels)
+    if reverse:
+        pixels = pixels[..., [2, 1, 0, 3][:channels]]
+    if dtype.itemsize > 1:
+        pixels = _normalize(pixels.astype(np.float32))
+    return pixels[..., 0] if channels == 1 else pixels
+
+
+def _normalize(values: np.ndarray) -> np.ndarray:
+    """Scale finite values linearly to 0-255 (NaN/inf become 0)."""
+    finite = np.isfinite(values)
+    if not finite.any():
+        return np.zeros(values.shape, dtype=np.uint8)
+    low = float(values[finite].min())
+    high = float(values[finite].max())
+    scale = 255.0 / (high - low) if high > low else 0.0
+    scaled = np.where(finite, (values - low) * scale, 0.0)
+    return scaled.astype(np.uint8)
+
+
+def encode_image(msg: Any, msg_type: str, encoding: ImageEncoding) -> tuple[bytes, int, int]:
+    """Encode an Image or CompressedImage message.
+
+    Args:
+        msg: Deserialized message.
+        msg_type: IMAGE_TYPE or COMPRESSED_IMAGE_TYPE.
+        encoding: Requested format, quality and maximum size.
+
+    Returns:
+        (encoded bytes, width, height) of the output image.
+
+    Raises:
+        ValueError: If the image cannot be decoded.
+    """
+    if msg_type == COMPRESSED_IMAGE_TYPE:
+        data = bytes(msg.data)
+        try:
+            image = Image.open(io.BytesIO(data))  # Reads the header only
+        except Exception as e:
+            raise ValueError(f"Cannot decode compressed image (format '{msg.format}'): {e}")
+        if image.format and image.format.lower() == encoding.image_format and encoding.fits(*image.size):
+            return data, image.width, image.height
+        if image.format == "JPEG" and not encoding.fits(*image.size):
+            # Let the JPEG decoder scale down by a power of two while decoding
+            image.draft("RGB", (encoding.max_width or image.width, encoding.max_height or image.height))
+    else:
+        pixels = image_to_array(msg)
+        image = Image.fromarray(pixels)  # L, RGB or RGBA from the array shape
+
+    if not encoding.fits(*image.size):
+        image.thumbnail(
+            (encoding.max_width or image.width, encoding.max_height or image.height),
+            Image.Resampling.BILINEAR,
+            reducing_gap=2.0,
+        )
+
+    output = io.BytesIO()
+    if encoding.image_format == "jpeg":
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(output, format="JPEG", quality=encoding.quality)
+    else:
+        image.save(output, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return output.getvalue(), image.width, image.height
+
+
+# ============================================================================
+# Worker Pool
+# ============================================================================
+
+class ImageEncoderPool:
+    """Process-wide worker pool for image encoding.
+
+    submit() runs an encode on a worker thread, off the event loop. The
+    future of the latest frame is kept per key, so a frame requested again
+    in the same encoding (by another client, or while still encoding) is
+    not encoded twice.
+    """
+
+    def __init__(self, workers: int = ENCODE_WORKERS):
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._results: OrderedDict[tuple, tuple[int, Future]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set_workers(self, workers: int) -> None:
+        """Set the number of encoding threads (takes effect for the next encode)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self.workers = workers
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def submit(self, key: tuple, seq: int, encode: Callable[[], Any]) -> Future:
+        """Get the result of encoding frame seq for key, starting the encode if needed.
+
+        Args:
+            key: Identity of the source and encoding, e.g. (container, topic, encoding.key).
+            seq: Sequence number of the frame.
+            encode: Function producing the result; run on a worker thread.
+
+        Returns:
+            Future of the encode's result.
+        """
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and cached[0] == seq:
+                self._results.move_to_end(key)
+                return cached[1]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="talos-image")
+            future = self._executor.submit(encode)
+            self._results[key] = (seq, future)
+            self._results.move_to_end(key)
+            while len(self._results) > MAX_CACHED_IMAGES:
+                self._results.popitem(last=False)
+            return future
+
+    def shutdown(self) -> None:
+        """Stop the workers and drop the kept results."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._results.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_image_encoder = ImageEncoderPool()
+
+
+def get_image_encoder() -> ImageEncoderPool:
+    """Get the process-wide image encoding pool."""
+    return _image_encoder
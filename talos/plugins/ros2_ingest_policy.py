@@ -0,0 +1,138 @@
+"""Per-topic ingest policies.
+
+A policy lets the subscriber callback discard messages before they are
+cached or buffered:
+
+- ``max_rate``: at most one message per 1/max_rate window is cached and
+  stored in history and time series. With ``keep="first"`` the first
+  message of the window is stored and the rest are dropped on arrival. With
+  ``keep="latest"`` each message only replaces the policy's held message
+  (no cache entry, lock or sequence number per message); the held message
+  is cached and stored once its window closes, when the next window opens
+  or, if the input stops, from the subscriber's flush timer. The cached
+  value then lags by up to one window. The callback and the flush timer
+  run on different threads, so both hold the policy's lock while they
+  open a window, hold a message or take and publish the held one.
+- ``drop_without_consumers``: messages are dropped entirely while no REST or
+  WebSocket client has read the topic within ``consumer_timeout`` seconds.
+
+Statistics (rate, bandwidth, drop counters) are recorded for every received
+message regardless of the policy.
+"""
+
+import threading
+from typing import Any, Callable, Literal, Optional
+
+IngestKeep = Literal["first", "latest"]
+
+
+class TopicIngestPolicy:
+    """Ingest policy and decimation window state for a single topic.
+
+    Attributes:
+        period: Minimum time between stored messages (1/max_rate), or None
+        keep_latest: Whether the latest message of each window is kept
+        drop_without_consumers: Whether messages are dropped while the topic is unread
+        consumer_timeout: Seconds after the last read during which the topic counts as consumed
+        pending: Held (msg, received_at, payload_size) of the current window (keep_latest only)
+        flush: Function caching and storing the held message, set by the subscriber
+            (caller holds lock)
+        lock: Orders window changes and the take-and-publish of the held message
+            between the subscriber callback and the flush timer
+    """
+
+    __slots__ = (
+        "period",
+        "keep_latest",
+        "drop_without_consumers",
+        "consumer_timeout",
+        "pending",
+        "flush",
+        "lock",
+        "_window_end",
+    )
+
+    def __init__(
+        self,
+        max_rate: Optional[float] = None,
+        keep: IngestKeep = "latest",
+        drop_without_consumers: bool = False,
+        consumer_timeout: float = 5.0,
+    ):
+        """Initialize a policy.
+
+        Args:
+            max_rate: Maximum rate (Hz) at which messages are stored. None disables decimation.
+            keep: Which message of each decimation window is kept: "first" or "latest".
+            drop_without_consumers: Drop messages while no client reads the topic.
+            consumer_timeout: Seconds after the last read before the topic counts as unread.
+
+        Raises:
+            ValueError: If max_rate or consumer_timeout is not positive, or keep is unknown.
+        """
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError(f"Ingest max_rate must be positive, got {max_rate}")
+        if consumer_timeout <= 0:
+            raise ValueError(f"Ingest consumer_timeout must be positive, got {consumer_timeout}")
+        if keep not in ("first", "latest"):
+            raise ValueError(f"Unknown ingest keep mode '{keep}'")
+
+        self.period = None if max_rate is None else 1.0 / max_rate
+        self.keep_latest = keep == "latest"
+        self.drop_without_consumers = drop_without_consumers
+        self.consumer_timeout = consumer_timeout
+        self.pending: Optional[tuple[Any, float, int]] = None
+        self.flush: Optional[Callable[[], None]] = None
+        self.lock = threading.Lock()
+        self._window_end = 0.0
+
+    def is_unconsumed(self, received_at: float, last_read: float) -> bool:
+        """Check whether a message should be dropped because nobody reads the topic.
+
+        Args:
+            received_at: Receive timestamp of the message.
+            last_read: Time of the last read of the topic (0.0 if never read).
+        """
+        return self.drop_without_consumers and received_at - last_read > self.consumer_timeout
+
+    def open_window(self, received_at: float) -> bool:
+        """Check whether a message starts a new decimation window.
+
+        Windows advance by one period at a time, so a steady input faster
+        than max_rate is stored at max_rate rather than slightly below it.
+
+        Args:
+            received_at: Receive timestamp of the message.
+
+        Returns:
+            True if the message opens a new window (or decimation is off),
+            False if it falls inside the current window.
+        """
+        if self.period is None:
+            return True
+        if received_at < self._window_end:
+            return False
+        self._window_end += self.period
+        if self._window_end <= received_at:
+            # First message, or the input paused for more than a period
+            self._window_end = received_at + self.period
+        return True
+
+    def hold(self, msg: Any, received_at: float, payload_size: int) -> None:
+        """Hold a message as the latest of the current window, replacing the previous one (caller holds lock)."""
+        self.pending = (msg, received_at, payload_size)
+
+    def take_pending(self) -> Optional[tuple[Any, float, int]]:
+        """Remove and return the held message, or None (caller holds lock)."""
+        held, self.pending = self.pending, None
+        return held
+
+    def is_pending_due(self, now: float) -> bool:
+        """Whether a message is held and its window has closed (caller holds lock)."""
+        return self.pending is not None and now >= self._window_end
+
+    def reset(self) -> None:
+        """Forget the current window and held message."""
+        with self.lock:
+            self.pending = None
+            self._window_end = 0.0
@@ -0,0 +1,537 @@
+"""Isolated ROS2 ingest: one ingest process per container.
+
+With isolated ingest, a container's ROS2TopicSubscriber runs in its own
+process, so Zenoh callbacks, deserialization and JSON encoding no longer
+compete with uvicorn for the API process's GIL. The ingest process
+forwards the JSON-encoded latest message of each topic into a
+SharedLatestTable, together with a periodic status snapshot. Like the
+in-process cache, it converts lazily: a dynamic topic's messages are only
+converted and encoded while clients read it (within READ_TIMEOUT), so the
+first read of an unread topic sees its newest message a publish interval
+later. Static topics are always forwarded.
+
+The API process uses ROS2IngestProcess in place of the plugin. It reads
+frames from the table, checking the slot's seq first. A frame is copied out
+of shared memory at most once, and all readers share that copy until the
+next frame arrives. Client reads are stamped back into the table so that
+ingest policies and lazy subscriptions work as in-process.
+
+start() only launches the process, so the API comes up whether the ingest
+process is slow to subscribe or not. A supervisor job on the shared timing
+wheel notices if the process dies and restarts it on a separate thread. The table is owned by the API
+process and survives restarts; until the new process publishes, readers
+keep seeing the last frames, which go stale like any other dynamic data.
+The new process numbers its messages above the last published seq, so
+seqs keep increasing and a new frame is never mistaken for an old one.
+
+Runtime topic changes, history, time series, diagnostics indexes and graph
+discovery are only available with in-process ingest.
+"""
+
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from talos.plugins.ros2_encoding import encode_json
+from talos.plugins.ros2_precision import FloatPrecision
+from talos.plugins.ros2_projection import FieldProjection
+from talos.plugins.ros2_scheduler import TimerHandle, get_scheduler
+from talos.plugins.ros2_shared_table import SharedLatestTable
+from talos.plugins.ros2_topic_subscriber import DYNAMIC_TOPIC_STALE_TIME, VIEW_CACHE_SIZE, ROS2TopicSubscriber
+
+logger = logging.getLogger(__name__)
+
+FRAME_CAPACITY = 1024 * 1024  # bytes - default maximum encoded frame size per topic
+PUBLISH_INTERVAL = 0.005  # seconds - how often the ingest process forwards new messages
+STATUS_INTERVAL = 1.0  # seconds - how often the ingest process publishes its status
+READ_TIMEOUT = 5.0  # seconds - dynamic topics unread for longer are not converted
+SUPERVISE_INTERVAL = 1.0  # seconds - how often the API process checks the ingest process
+RESTART_DELAY = 5.0  # seconds - minimum time between ingest process restarts
+STOP_TIMEOUT = 5.0  # seconds - wait for a graceful exit before terminating the process
+
+
+# ============================================================================
+# Ingest Process
+# ============================================================================
+
+
+def run_ingest_process(
+    table_name: str,
+    topics: list[str],
+    frame_capacity: int,
+    plugin_kwargs: dict[str, Any],
+    stop_event: Any,
+) -> None:
+    """Entry point of the ingest process.
+
+    Runs the container's plugin and forwards new messages, client reads and
+    status between it and the shared table until stop_event is set.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    table = SharedLatestTable.attach(table_name, topics, frame_capacity)
+    # After a restart, continue above the numbers the previous process published
+    seq_base = max((table.read_seq(index) for index in range(len(topics))), default=0)
+    plugin = ROS2TopicSubscriber(**plugin_kwargs, seq_base=seq_base)
+    container_name = plugin.container_name
+    dynamic = set(plugin.topics)
+    converters = {topic: plugin.get_topic_converter(topic) for topic in topics}
+    published: dict[str, int] = {}
+    reads_seen: dict[str, float] = {}
+    oversize: dict[str, int] = {}
+    try:
+        plugin.start()
+        next_status = 0.0
+        while not stop_event.is_set():
+            now = time.time()
+            for index, topic in enumerate(topics):
+                read_at = table.read_last_read(index)
+                if read_at > reads_seen.get(topic, 0.0):
+                    reads_seen[topic] = read_at
+                    plugin.record_read(topic, read_at)
+                if topic in dynamic and now - reads_seen.get(topic, 0.0) > READ_TIMEOUT:
+                    continue  # Nobody reads it; convert once a client does
+
+                entry = plugin.get_latest_entry(topic)
+                if entry is None or entry.seq == published.get(topic):
+                    continue
+                published[topic] = entry.seq
+                try:
+                    data_json = entry.get_data_json(converters[topic])
+                except Exception as e:
+                    logger.warning(f"[{container_name}] Failed to decode message of '{topic}': {e}")
+                    continue
+                if not table.write_frame(index, entry.seq, entry.received_at, data_json):
+                    oversize[topic] = oversize.get(topic, 0) + 1
+                    if oversize[topic] == 1:
+                        logger.warning(
+                            f"[{container_name}] Message of '{topic}' exceeds the shared frame capacity "
+                            f"of {frame_capacity} bytes and is not forwarded"
+                        )
+
+            if now >= next_status:
+                next_status = now + STATUS_INTERVAL
+                table.write_status(encode_json({
+                    "topics": plugin.get_all_topics_status(),
+                    "memory_used": plugin.get_memory_used(),
+                    "evicted_count": plugin.evicted_count,
+                    "oversize": oversize,
+                }))
+            stop_event.wait(PUBLISH_INTERVAL)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        plugin.stop()
+        table.close()
+
+
+# ============================================================================
+# API Process Side
+# ============================================================================
+
+
+class _SharedFrame:
+    """Frame copied out of the shared table, shared by all readers until the next one."""
+
+    __slots__ = ("seq", "received_at", "data_json", "_data", "_views")
+
+    def __init__(self, seq: int, received_at: float, data_json: bytes):
+        self.seq = seq
+        self.received_at = received_at
+        self.data_json = data_json
+        self._data: Any = None
+        self._views: dict[Any, bytes] = {}
+
+    def get_data(self) -> Any:
+        """Get the decoded frame, decoding it on first use (for per-request views)."""
+        if self._data is None:
+            self._data = json.loads(self.data_json)
+        return self._data
+
+    def get_view(self, key: Any, build: Callable[[], bytes]) -> bytes:
+        """Get an encoded per-request view of the frame, building it on first use."""
+        view = self._views.get(key)
+        if view is None:
+            view = build()
+            if len(self._views) < VIEW_CACHE_SIZE:
+                self._views = {**self._views, key: view}
+        return view
+
+
+class ROS2IngestProcess:
+    """Stand-in for ROS2TopicSubscriber whose ingest runs in a separate process.
+
+    Serves the read API of the plugin (latest data, seq, status) from the
+    shared table. get_topic_data() results carry 'data_json', 'received_at'
+    and 'seq' but no decoded 'data'.
+
+    Attributes:
+        container_name: Name of the container/robot
+        topics: Dictionary mapping dynamic topic names to message types
+        static_topics: Dictionary mapping static topic names to message types
+        domain_id: ROS2 domain ID
+        memory_budget: Memory budget of the ingest process's cache in bytes (None for no limit);
+            enforced in the ingest process, outside the API process's ros2_memory_budget_mb
+        graph: Always None (graph discovery needs in-process ingest)
+        is_running: Whether the ingest process is supervised (it may be restarting)
+        encodes_images: Always False (frames carry image metadata only)
+    """
+
+    encodes_images = False
+
+    def __init__(
+        self,
+        container_name: str,
+        topics: dict[str, str],
+        static_topics: Optional[dict[str, str]] = None,
+        frame_capacity: int = FRAME_CAPACITY,
+        **plugin_kwargs: Any,
+    ):
+        """Initialize isolated ingest for a container.
+
+        Args:
+            container_name: Name of the container/robot
+            topics: Dictionary mapping dynamic topic names to message types
+            static_topics: Optional dictionary mapping static topic names to message types
+            frame_capacity: Maximum encoded frame size per topic in bytes; larger
+                messages are not forwarded. Defaults to FRAME_CAPACITY.
+            **plugin_kwargs: Further ROS2TopicSubscriber arguments, passed to the
+                plugin in the ingest process.
+        """
+        self.container_name = container_name
+        self.topics = topics
+        self.static_topics = static_topics or {}
+        self.domain_id = plugin_kwargs.get("domain_id", 30)
+        memory_budget_mb = plugin_kwargs.get("memory_budget_mb")
+        self.memory_budget: Optional[int] = (
+            int(memory_budget_mb * 1024 * 1024) if memory_budget_mb is not None else None
+        )
+        self.graph = None
+        self.is_running = False
+        self.frame_capacity = frame_capacity
+        self._plugin_kwargs = {
+            "container_name": container_name,
+            "topics": topics,
+            "static_topics": self.static_topics,
+            **plugin_kwargs,
+        }
+        self._table: Optional[SharedLatestTable] = None
+        self._frames: dict[str, _SharedFrame] = {}
+        self._context = multiprocessing.get_context("spawn")
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._stop_event: Any = None
+        self._supervisor: Optional[TimerHandle] = None
+        self._started_at = 0.0
+        self._restarting = False  # A restart thread is running
+        self._lock = threading.Lock()  # Serializes process (re)starts with stop()
+
+    # ============================================================================
+    # Public Lifecycle Methods
+    # ============================================================================
+
+    def start(self) -> None:
+        """Create the shared table and launch the ingest process.
+
+        Returns without waiting for the process to subscribe.
+
+        Raises:
+            Exception: If the table or the process cannot be created.
+        """
+        if self.is_running:
+            logger.warning(f"[{self.container_name}] Plugin is already running")
+            return
+
+        self._table = SharedLatestTable.create(self.list_topics(), self.frame_capacity)
+        try:
+            with self._lock:
+                self._launch()
+        except Exception:
+            self._table.close()
+            self._table = None
+            raise
+        self.is_running = True
+        self._supervisor = get_scheduler().call_every(SUPERVISE_INTERVAL, self._supervise)
+        logger.info(
+            f"[{self.container_name}] Started isolated ingest process (pid {self._process.pid}) "
+            f"for {len(self.topics)} dynamic and {len(self.static_topics)} static topics"
+        )
+
+    def stop(self) -> None:
+        """Stop the ingest process and remove the shared table."""
+        if not self.is_running:
+            return
+        self.is_running = False
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            self._supervisor = None
+
+        with self._lock:
+            process = self._process
+            if process is not None:
+                self._stop_event.set()
+                process.join(STOP_TIMEOUT)
+                if process.is_alive():
+                    logger.warning(f"[{self.container_name}] Ingest process did not stop in time, terminating")
+                    process.terminate()
+                    process.join(STOP_TIMEOUT)
+                self._process = None
+
+        self._frames = {}
+        if self._table is not None:
+            self._table.close()
+            self._table = None
+        logger.info(f"[{self.container_name}] Isolated ingest stopped")
+
+    def add_topic(self, topic: str, msg_type: Optional[str] = None, static: bool = False) -> bool:
+        """Not supported: the shared table layout is fixed at start.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError("Runtime topic changes are not supported with isolated ingest")
+
+    def resolve_msg_type(self, topic: str) -> str:
+        """Not supported: graph discovery needs in-process ingest.
+
+        Raises:
+            LookupError: Always.
+        """
+        raise LookupError(
+            f"Cannot resolve the type of '{topic}': graph discovery is not available with isolated ingest"
+        )
+
+    def remove_topic(self, topic: str) -> None:
+        """Not supported: the shared table layout is fixed at start.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError("Runtime topic changes are not supported with isolated ingest")
+
+    # ============================================================================
+    # Public API Methods
+    # ============================================================================
+
+    def get_topic_data(self, topic: str) -> Optional[dict[str, Any]]:
+        """Get the latest data of a topic from the shared table.
+
+        Returns:
+            Dictionary with 'data_json', 'received_at' and 'seq' keys, or None
+            if no message is available or data is stale.
+        """
+        frame = self._read_frame(topic)
+        if frame is None:
+            return None
+        return {
+            "data_json": frame.data_json,
+            "received_at": frame.received_at,
+            "seq": frame.seq,
+        }
+
+    def get_topic_view(
+        self,
+        topic: str,
+        projection: Optional[FieldProjection] = None,
+        precision: Optional[FloatPrecision] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Get a per-request view of a topic's latest data, built from the decoded frame.
+
+        The encoded view is memoized on the frame until the next one arrives.
+        Without projection and precision this is get_topic_data().
+
+        Returns:
+            Dictionary with 'data_json' (the encoded view), 'received_at'
+            and 'seq' keys, or None if no message is available or data is stale.
+        """
+        if projection is None and precision is None:
+            return self.get_topic_data(topic)
+        frame = self._read_frame(topic)
+        if frame is None:
+            return None
+
+        def build() -> bytes:
+            data = frame.get_data()
+            if projection is not None:
+                data = projection.apply(data)
+            if precision is not None:
+                data = precision.apply(data)
+            return encode_json(data)
+
+        key = (
+            projection.key if projection is not None else None,
+            precision.key if precision is not None else None,
+        )
+        return {
+            "data_json": frame.get_view(key, build),
+            "received_at": frame.received_at,
+            "seq": frame.seq,
+        }
+
+    def get_topic_seq(self, topic: str) -> Optional[int]:
+        """Get the sequence number of a topic's latest message (None if unavailable or stale)."""
+        frame = self._read_frame(topic)
+        return None if frame is None else frame.seq
+
+    def get_topic_history(self, topic: str, *args: Any, **kwargs: Any) -> None:
+        """History is not available with isolated ingest."""
+        return None
+
+    def get_topic_timeseries(self, topic: str) -> None:
+        """Time series are not available with isolated ingest."""
+        return None
+
+    def get_topic_diagnostics(self, topic: str) -> None:
+        """Diagnostics indexes are not available with isolated ingest."""
+        return None
+
+    def encode_topic_image(self, topic: str, *args: Any, **kwargs: Any) -> None:
+        """Encoded images are not available with isolated ingest (frames carry metadata only)."""
+        return None
+
+    def list_topics(self) -> list[str]:
+        """Get list of all configured topic names (dynamic + static)."""
+        return list(self.topics.keys()) + list(self.static_topics.keys())
+
+    def get_msg_type(self, topic: str) -> Optional[str]:
+        """Get the message type of a topic."""
+        return self.topics.get(topic) or self.static_topics.get(topic)
+
+    def is_topic_available(self, topic: str) -> bool:
+        """Check whether fresh data is available for a topic."""
+        return self._read_frame(topic, mark_read=False) is not None
+
+    def get_all_topics_status(self) -> dict[str, dict[str, Any]]:
+        """Get status for all configured topics.
+
+        Statistics come from the ingest process's latest status snapshot
+        (at most STATUS_INTERVAL old). Availability is read from the table,
+        or taken from the snapshot for topics whose messages are not
+        forwarded because nobody reads them.
+        """
+        reported = self._read_status().get("topics", {})
+        status = {}
+        for topic in self.list_topics():
+            frame = self._read_frame(topic, mark_read=False)
+            now = time.time()
+            topic_status = dict(reported.get(topic) or {
+                "configured": True,
+                "msg_type": self.get_msg_type(topic),
+                "subscribed": False,
+                "stats": None,
+                "subscribe_latency_ms": None,
+                "subscribe_error": None,
+                "cached_bytes": 0,
+            })
+            if frame is not None:
+                topic_status.update({
+                    "available": True,
+                    "received_at": frame.received_at,
+                    "seconds_since_last_message": now - frame.received_at,
+                })
+            elif topic_status.get("received_at") is not None:
+                topic_status["seconds_since_last_message"] = now - topic_status["received_at"]
+            else:
+                topic_status["available"] = False
+            status[topic] = topic_status
+        return status
+
+    def get_memory_used(self) -> int:
+        """Get the estimated size of the ingest process's cached data in bytes."""
+        return self._read_status().get("memory_used", 0)
+
+    @property
+    def evicted_count(self) -> int:
+        """Number of topic evictions made by the ingest process to meet its memory budget."""
+        return self._read_status().get("evicted_count", 0)
+
+    # ============================================================================
+    # Private Helper Methods
+    # ============================================================================
+
+    def _launch(self) -> None:
+        """Start a new ingest process on the existing table (caller holds _lock)."""
+        self._stop_event = self._context.Event()
+        process = self._context.Process(
+            target=run_ingest_process,
+            args=(
+                self._table.name,
+                self._table.topics,
+                self.frame_capacity,
+                self._plugin_kwargs,
+                self._stop_event,
+            ),
+            name=f"{self.container_name}-ingest",
+            daemon=True,
+        )
+        process.start()
+        self._process = process
+        self._started_at = time.monotonic()
+        # Drop frames copied from the previous process; the table is re-read on the next access
+        self._frames = {}
+
+    def _supervise(self) -> None:
+        """Check whether the ingest process exited (runs on the timing wheel).
+
+        Spawning an interpreter is slow, so the restart runs on its own thread.
+        """
+        process = self._process
+        if not self.is_running or self._restarting or process is None or process.is_alive():
+            return
+        if time.monotonic() - self._started_at < RESTART_DELAY:
+            return
+        self._restarting = True
+        threading.Thread(target=self._restart, daemon=True, name=f"{self.container_name}-ingest-restart").start()
+
+    def _restart(self) -> None:
+        """Restart the exited ingest process (runs on its own thread)."""
+        try:
+            with self._lock:
+                process = self._process
+                # stop() may have run meanwhile
+                if not self.is_running or process is None or process.is_alive():
+                    return
+                logger.warning(
+                    f"[{self.container_name}] Ingest process exited (code {process.exitcode}), restarting"
+                )
+                try:
+                    self._launch()
+                except Exception as e:
+                    logger.error(f"[{self.container_name}] Failed to restart ingest process: {e}")
+        finally:
+            self._restarting = False
+
+    def _read_frame(self, topic: str, mark_read: bool = True) -> Optional[_SharedFrame]:
+        """Get a topic's latest frame unless it is stale, copying it out of the table only when it changed."""
+        table = self._table
+        index = table.slot_index(topic) if table is not None else None
+        if index is None:
+            return None
+        now = time.time()
+        if mark_read:
+            table.mark_read(index, now)
+
+        frame = self._frames.get(topic)
+        seq = table.read_seq(index)
+        if frame is None or frame.seq != seq:
+            latest = table.read_frame(index)
+            if latest is None:
+                return None
+            frame = _SharedFrame(*latest)
+            self._frames[topic] = frame
+
+        if topic in self.topics and now - frame.received_at > DYNAMIC_TOPIC_STALE_TIME:
+            return None
+        return frame
+
+    def _read_status(self) -> dict[str, Any]:
+        """Get the ingest process's latest status snapshot ({} before the first one)."""
+        table = self._table
+        status_json = table.read_status() if table is not None else None
+        if status_json is None:
+            return {}
+        try:
+            return json.loads(status_json)
+        except ValueError:
+            return {}
@@ -0,0 +1,130 @@
+"""Memory budgets for cached ROS2 topic data.
+
+Every cache entry carries an estimate of its size: the serialized payload
+size plus the memoized JSON encoding and decoded dict once a reader has
+built them. History buffers keep a running total of the payload sizes they
+hold; history queries convert past samples without memoizing the result on
+them, so that total stays accurate. A plugin's
+usage is the sum over its topics, and the process usage is the sum over all
+running plugins.
+
+Containers with isolated ingest cache their data in their own ingest
+process, which enforces their memory_budget_mb there. They are not part of
+the process usage or budget, which only cover the API process's caches.
+
+Budgets are enforced from the shared timing wheel every BUDGET_CHECK_INTERVAL
+seconds, so the ingest path never takes an extra lock. When a budget is
+exceeded, cached data of dynamic topics is evicted coldest first: topics
+that were never read go first, then those read least recently, larger ones
+first on ties. Static topics (e.g. /robot_description) are never evicted,
+since TRANSIENT_LOCAL data is not resent after the initial query.
+"""
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from talos.plugins.ros2_scheduler import TimerHandle, get_scheduler
+
+if TYPE_CHECKING:
+    from talos.plugins.ros2_topic_subscriber import ROS2TopicSubscriber
+
+logger = logging.getLogger(__name__)
+
+BUDGET_CHECK_INTERVAL = 1.0  # seconds - how often budgets are enforced
+
+
+def evict_coldest(caches: list["ROS2TopicSubscriber"], excess: int) -> int:
+    """Evict cached topic data, coldest first, until excess bytes are freed.
+
+    Args:
+        caches: Plugins to evict from.
+        excess: Number of bytes to free.
+
+    Returns:
+        Bytes actually freed (less than excess if only protected data is left).
+    """
+    candidates = [
+        (last_read, -nbytes, cache.container_name, topic, cache)
+        for cache in caches
+        for last_read, nbytes, topic in cache.get_eviction_candidates()
+    ]
+    candidates.sort(key=lambda candidate: candidate[:4])
+    freed = 0
+    for _, _, container_name, topic, cache in candidates:
+        if freed >= excess:
+            break
+        nbytes = cache.evict_topic(topic)
+        freed += nbytes
+        logger.debug(f"[{container_name}] Evicted cached data of '{topic}' ({nbytes} bytes) to meet memory budget")
+    return freed
+
+
+class ROS2MemoryBudget:
+    """Process-wide memory budget over all running plugins.
+
+    Each plugin registers itself while running. The periodic check first
+    enforces each plugin's own budget, then the process budget.
+
+    Attributes:
+        budget: Process-wide budget in bytes, or None for no limit
+    """
+
+    def __init__(self):
+        self.budget: Optional[int] = None
+        self._caches: list["ROS2TopicSubscriber"] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[TimerHandle] = None
+        self._over_budget = False
+
+    def set_budget(self, budget: Optional[int]) -> None:
+        """Set the process-wide budget in bytes (None for no limit)."""
+        self.budget = budget
+
+    def register(self, cache: "ROS2TopicSubscriber") -> None:
+        """Start enforcing budgets for a running plugin."""
+        with self._lock:
+            if cache in self._caches:
+                return
+            self._caches = [*self._caches, cache]
+            if self._timer is None:
+                self._timer = get_scheduler().call_every(BUDGET_CHECK_INTERVAL, self.enforce)
+
+    def unregister(self, cache: "ROS2TopicSubscriber") -> None:
+        """Stop enforcing budgets for a plugin."""
+        with self._lock:
+            self._caches = [registered for registered in self._caches if registered is not cache]
+            if not self._caches and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def get_memory_used(self) -> int:
+        """Estimated bytes of cached topic data over all running in-process plugins."""
+        return sum(cache.get_memory_used() for cache in self._caches)
+
+    def enforce(self) -> None:
+        """Evict cached data of plugins over their own budget, then over the process budget."""
+        caches = self._caches
+        for cache in caches:
+            cache.enforce_memory_budget()
+
+        if self.budget is None:
+            return
+        excess = self.get_memory_used() - self.budget
+        if excess > 0:
+            excess -= evict_coldest(caches, excess)
+        over_budget = excess > 0
+        if over_budget and not self._over_budget:
+            logger.warning(
+                f"Cached ROS2 data exceeds the process memory budget of {self.budget} bytes "
+                f"by {excess} bytes after evicting all dynamic topics (static topics are kept)"
+            )
+        self._over_budget = over_budget
+
+
+_memory_budget = ROS2MemoryBudget()
+
+
+def get_memory_budget() -> ROS2MemoryBudget:
+    """Get the process-wide memory budget."""
+    return _memory_budget
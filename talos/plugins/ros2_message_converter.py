@@ -0,0 +1,273 @@
+"""ROS2 message to dict conversion.
+
+Messages are converted with type-specialized converters: the first time a
+message of a given type is seen, its field layout is inspected once and a
+flattening function is generated for that type and cached for the life of
+the process. Later messages of the same type skip all per-field reflection
+(``__dict__`` iteration, private-name filtering and ndarray detection).
+
+The reflective converter is kept as the fallback for objects that cannot be
+compiled and for messages that do not match the layout a converter was
+generated from. Both paths produce the same JSON shape.
+"""
+
+import keyword
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Types returned as-is by the reflective converter for nested values
+_PRIMITIVE_TYPES = (str, int, float, bool)
+
+# Compiled converters keyed by ROS2 type string (e.g. "sensor_msgs/msg/JointState")
+_converters: dict[str, Callable[[Any], Any]] = {}
+_converters_lock = threading.RLock()
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+def convert_message(msg: Any, msg_type: Optional[str] = None) -> Any:
+    """Convert a ROS2 message object to a JSON-serializable dict.
+
+    Uses the compiled converter for the message type, generating it from
+    this message on first use. Falls back to reflective conversion if the
+    message cannot be compiled or does not match the compiled layout.
+
+    Args:
+        msg: ROS2 message object.
+        msg_type: ROS2 type string. Defaults to the type string carried by
+            the message class.
+
+    Returns:
+        Dictionary representation of the entire message.
+    """
+    if msg is None:
+        return None
+
+    try:
+        converter = get_message_converter(msg, msg_type)
+    except Exception as e:
+        logger.debug(f"Could not compile converter for {msg_type or type(msg).__name__}: {e}")
+        converter = None
+
+    if converter is not None:
+        try:
+            return converter(msg)
+        except Exception as e:
+            logger.debug(
+                f"Compiled converter failed for {msg_type or type(msg).__name__}: {e}, "
+                f"using reflective conversion"
+            )
+    return convert_message_to_dict(msg)
+
+
+def get_message_converter(
+    msg: Any, msg_type: Optional[str] = None
+) -> Optional[Callable[[Any], Any]]:
+    """Get the compiled converter for a message type, generating it if needed.
+
+    Args:
+        msg: Sample message used to discover the field layout on first use.
+        msg_type: ROS2 type string. Defaults to the type string carried by
+            the message class.
+
+    Returns:
+        Converter function, or None if the message has no inspectable fields.
+    """
+    key = msg_type or _type_key(type(msg))
+    converter = _converters.get(key)
+    if converter is not None:
+        return converter
+    if not hasattr(msg, '__dict__'):
+        return None
+
+    with _converters_lock:
+        converter = _converters.get(key)
+        if converter is None:
+            converter = _compile_converter(msg, nested=False)
+            _converters[key] = converter
+            logger.debug(f"Compiled message converter for {key}")
+        return converter
+
+
+# ============================================================================
+# Converter Generation
+# ============================================================================
+
+def _type_key(cls: type) -> str:
+    """Get the registry key for a message class.
+
+    rosbags message classes carry their ROS2 type string in ``__msgtype__``.
+    """
+    msgtype = getattr(cls, '__msgtype__', None)
+    if isinstance(msgtype, str):
+        return msgtype
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _get_nested_converter(sample: Any) -> Callable[[Any], Any]:
+    """Get the compiled converter for a nested message class."""
+    key = f"nested:{_type_key(type(sample))}"
+    converter = _converters.get(key)
+    if converter is not None:
+        return converter
+
+    with _converters_lock:
+        converter = _converters.get(key)
+        if converter is None:
+            converter = _compile_converter(sample, nested=True)
+            _converters[key] = converter
+        return converter
+
+
+def _compile_converter(sample: Any, nested: bool) -> Callable[[Any], Any]:
+    """Generate a flattening function for the field layout of a sample message.
+
+    The generated function builds the result dict with a single literal,
+    accessing each field directly and applying the conversion chosen for
+    that field's kind (ndarray, nested message, sequence or primitive).
+
+    Args:
+        sample: Message instance to take the field layout from.
+        nested: Whether the converter is used for nested values, which
+            stringify unknown objects instead of passing them through.
+
+    Returns:
+        Generated converter function.
+    """
+    namespace: dict[str, Any] = {
+        "_convert_sequence": _convert_sequence,
+        "_convert_nested_obj_to_dict": _convert_nested_obj_to_dict,
+    }
+    items = []
+    for index, (name, value) in enumerate(vars(sample).items()):
+        # Skip private attributes
+        if name.startswith('_'):
+            continue
+
+        if name.isidentifier() and not keyword.iskeyword(name):
+            access = f"msg.{name}"
+        else:
+            access = f"getattr(msg, {name!r})"
+
+        if hasattr(value, 'tolist') and hasattr(value, 'shape'):
+            # numpy ndarray: straight to a list
+            expr = f"{access}.tolist()"
+        elif isinstance(value, _PRIMITIVE_TYPES):
+            expr = access
+        elif isinstance(value, (list, tuple)):
+            expr = f"_convert_sequence({access})"
+        elif value is not None and hasattr(value, '__dict__'):
+            converter_name = f"_convert_{index}"
+            namespace[converter_name] = _get_nested_converter(value)
+            expr = f"{converter_name}({access})"
+        elif nested:
+            expr = f"_convert_nested_obj_to_dict({access})"
+        else:
+            expr = access
+        items.append(f"        {name!r}: {expr},")
+
+    source = "\n".join(["def convert(msg):", "    return {", *items, "    }"])
+    exec(compile(source, f"<converter {_type_key(type(sample))}>", "exec"), namespace)
+    return namespace["convert"]
+
+
+def _convert_sequence(seq: Any) -> list:
+    """Convert a message sequence field using its element type.
+
+    ROS2 sequences are homogeneous, so the first element decides how the
+    whole sequence is converted.
+    """
+    if not seq:
+        return []
+    first = seq[0]
+    if isinstance(first, _PRIMITIVE_TYPES):
+        return list(seq)
+    if hasattr(first, '__dict__') and not (hasattr(first, 'tolist') and hasattr(first, 'shape')):
+        converter = _get_nested_converter(first)
+        return [converter(item) for item in seq]
+    return [_convert_nested_obj_to_dict(item) for item in seq]
+
+
+# ============================================================================
+# Reflective Conversion (fallback)
+# ============================================================================
+
+def convert_message_to_dict(msg: Any) -> Any:
+    """Convert ROS2 message object to dictionary for JSON serialization.
+
+    Converts the entire message including all fields (data, header, etc.)
+    to preserve all information like timestamps.
+
+    Args:
+        msg: ROS2 message object.
+
+    Returns:
+        Dictionary representation of the entire message.
+    """
+    if msg is None:
+        return None
+
+    try:
+        if hasattr(msg, '__dict__'):
+            result = {}
+            for key, value in msg.__dict__.items():
+                # Skip private attributes
+                if key.startswith('_'):
+                    continue
+                # Recursively convert nested objects (including ndarray)
+                # Check for ndarray first, then other nested types
+                if hasattr(value, 'tolist') and hasattr(value, 'shape'):
+                    # numpy ndarray
+                    try:
+                        result[key] = value.tolist()
+                    except Exception:
+                        result[key] = str(value)
+                elif hasattr(value, '__dict__') or isinstance(value, (list, tuple)):
+                    result[key] = _convert_nested_obj_to_dict(value)
+                else:
+                    result[key] = value
+            return result
+        else:
+            return str(msg)
+    except Exception as e:
+        logger.warning(f"Failed to convert message to dict: {e}, using str()")
+        return str(msg)
+
+
+def _convert_nested_obj_to_dict(obj: Any) -> Any:
+    """Recursively convert nested objects to dictionaries.
+
+    Args:
+        obj: Object to convert.
+
+    Returns:
+        Dictionary or primitive value.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, _PRIMITIVE_TYPES):
+        return obj
+
+    # Handle numpy ndarray (common in ROS2 messages like joint_states, odom)
+    # Check for ndarray by checking for tolist method and shape attribute
+    if hasattr(obj, 'tolist') and hasattr(obj, 'shape'):
+        try:
+            return obj.tolist()  # Convert ndarray to list
+        except Exception:
+            return str(obj)
+
+    if isinstance(obj, (list, tuple)):
+        return [_convert_nested_obj_to_dict(item) for item in obj]
+    if hasattr(obj, '__dict__'):
+        result = {}
+        for key, value in obj.__dict__.items():
+            if key.startswith('_'):
+                continue
+            result[key] = _convert_nested_obj_to_dict(value)
+        return result
+    return str(obj)
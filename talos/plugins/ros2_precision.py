@@ -0,0 +1,100 @@
+"""Float precision reduction of converted ROS2 topic data.
+
+JSON encodes doubles with up to 17 significant digits, so float-heavy
+messages (joint states, trajectories) are mostly digits nobody reads.
+A FloatPrecision rounds every float of a converted message before it is
+encoded, either to a number of decimal places or to float32 precision
+(the shortest decimal that identifies the nearest float32, e.g.
+0.12345679 instead of 0.12345678901234567). Both may be combined.
+
+Float sequences are rounded as NumPy arrays in one pass; Python's float
+repr then emits the short form, which is what shrinks the payload.
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+
+MAX_DECIMALS = 15  # decimal places beyond this do not shorten a double
+
+
+class FloatPrecision:
+    """Rounding applied to all floats of converted topic data.
+
+    Attributes:
+        decimals: Decimal places kept, or None
+        float32: Whether values are rounded to float32 precision
+        key: Hashable identity of the setting (for caching views)
+    """
+
+    def __init__(self, decimals: Optional[int] = None, float32: bool = False):
+        """Initialize a precision setting.
+
+        Args:
+            decimals: Decimal places kept (0 to MAX_DECIMALS), or None.
+            float32: Round values to float32 precision.
+
+        Raises:
+            ValueError: If decimals is out of range.
+        """
+        if decimals is not None and not 0 <= decimals <= MAX_DECIMALS:
+            raise ValueError(f"Decimal places must be between 0 and {MAX_DECIMALS}, got {decimals}")
+        self.decimals = decimals
+        self.float32 = float32
+        self.key = (decimals, float32)
+
+    @classmethod
+    def parse(cls, spec: str) -> "FloatPrecision":
+        """Parse a request precision: a number of decimal places or "float32".
+
+        Raises:
+            ValueError: If the specification is neither.
+        """
+        spec = spec.strip()
+        if spec == "float32":
+            return cls(float32=True)
+        try:
+            decimals = int(spec)
+        except ValueError:
+            raise ValueError(f"Precision must be a number of decimal places or 'float32', got '{spec}'")
+        return cls(decimals=decimals)
+
+    def apply(self, value: Any) -> Any:
+        """Round the floats of a converted (JSON-serializable) value.
+
+        Args:
+            value: Converted message data; it is not modified.
+
+        Returns:
+            Copy of value with rounded floats (other values are shared).
+        """
+        if type(value) is float:
+            return self._round_scalar(value)
+        if isinstance(value, dict):
+            return {key: self.apply(item) for key, item in value.items()}
+        if isinstance(value, list):
+            # ROS2 sequences are homogeneous: a float first element means a float array
+            if value and type(value[0]) is float:
+                try:
+                    return self._round_array(np.asarray(value, dtype=np.float64))
+                except (TypeError, ValueError):
+                    pass
+            return [self.apply(item) for item in value]
+        return value
+
+    def _round_array(self, values: np.ndarray) -> list:
+        """Round a float64 array and convert it to a list."""
+        if self.float32:
+            # NumPy formats float32 with the shortest round-tripping digits
+            values = values.astype(np.float32).astype(str).astype(np.float64)
+        if self.decimals is not None:
+            values = np.round(values, self.decimals)
+        return values.tolist()
+
+    def _round_scalar(self, value: float) -> float:
+        """Round a single float."""
+        if self.float32:
+            value = float(str(np.float32(value)))
+        if self.decimals is not None:
+            value = round(value, self.decimals)
+        return value
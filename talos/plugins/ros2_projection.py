@@ -0,0 +1,182 @@
+"""Server-side field projection of ROS2 topic data.
+
+A projection selects a few fields of a message instead of the whole
+converted message, e.g. only ``position[0:7]`` of ``/joint_states``. It is
+given as comma-separated JSON-pointer-like paths::
+
+    /position[0:7],/name
+    /status/2/message
+    /status[0:4]/level
+
+Path segments are field names or array indices; a segment may be followed
+by ``[index]`` or ``[start:stop:step]`` (Python slicing, negative values
+allowed). Segments after a slice are applied to every sliced element. As
+in JSON pointer, ``~1`` and ``~0`` in field names stand for ``/`` and ``~``.
+
+Projections are compiled once per request or connection and applied to the
+message object itself, so only the selected fields are converted. They
+work the same on already converted data (snapshots and isolated ingest).
+The result maps each path, as given, to its value (None if missing).
+"""
+
+import re
+from typing import Any, Union
+
+from talos.plugins.ros2_message_converter import convert_message
+
+MAX_PROJECTION_PATHS = 64  # paths per projection
+
+_SEGMENT_PATTERN = re.compile(r"^([^\[\]]*)((?:\[[^\[\]]*\])*)$")
+_BRACKET_PATTERN = re.compile(r"\[([^\[\]]*)\]")
+_INDEX_PATTERN = re.compile(r"^-?\d+$")
+
+# Step kinds
+_FIELD = 0
+_INDEX = 1
+_SLICE = 2
+
+
+def _parse_int(text: str, path: str) -> Union[int, None]:
+    """Parse an optional slice bound."""
+    text = text.strip()
+    if not text:
+        return None
+    if not _INDEX_PATTERN.match(text):
+        raise ValueError(f"Invalid index '{text}' in field path '{path}'")
+    return int(text)
+
+
+def _compile_path(path: str) -> tuple[tuple[int, Any], ...]:
+    """Compile one path into (kind, argument) steps.
+
+    Raises:
+        ValueError: If the path is malformed.
+    """
+    if not path.startswith("/"):
+        raise ValueError(f"Field path '{path}' must start with '/'")
+    steps = []
+    for segment in path[1:].split("/"):
+        match = _SEGMENT_PATTERN.match(segment)
+        if match is None or segment == "":
+            raise ValueError(f"Invalid segment '{segment}' in field path '{path}'")
+        name, brackets = match.groups()
+        if name:
+            if _INDEX_PATTERN.match(name):
+                steps.append((_INDEX, int(name)))
+            else:
+                name = name.replace("~1", "/").replace("~0", "~")
+                if name.startswith("_"):
+                    raise ValueError(f"Private field '{name}' in field path '{path}'")
+                steps.append((_FIELD, name))
+        for bracket in _BRACKET_PATTERN.findall(brackets):
+            parts = bracket.split(":")
+            if len(parts) == 1:
+                index = _parse_int(parts[0], path)
+                if index is None:
+                    raise ValueError(f"Empty index in field path '{path}'")
+                steps.append((_INDEX, index))
+            elif len(parts) <= 3:
+                start, stop, step = (_parse_int(part, path) for part in (*parts, "")[:3])
+                if step == 0:
+                    raise ValueError(f"Slice step cannot be zero in field path '{path}'")
+                steps.append((_SLICE, slice(start, stop, step)))
+            else:
+                raise ValueError(f"Invalid slice '[{bracket}]' in field path '{path}'")
+    return tuple(steps)
+
+
+def _to_json(value: Any) -> Any:
+    """Convert an extracted value to its JSON-serializable form."""
+    if value is None or isinstance(value, (str, int, float, bool, dict)):
+        return value
+    if hasattr(value, "tolist") and hasattr(value, "shape"):
+        # numpy ndarray or scalar
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if hasattr(value, "__dict__"):
+        return convert_message(value)
+    return str(value)
+
+
+def _extract(value: Any, steps: tuple[tuple[int, Any], ...], start: int) -> Any:
+    """Apply steps[start:] to a message object or converted dict."""
+    for position in range(start, len(steps)):
+        if value is None:
+            return None
+        kind, argument = steps[position]
+        if kind == _FIELD:
+            if isinstance(value, dict):
+                value = value.get(argument)
+            elif hasattr(value, "__dict__"):
+                value = getattr(value, argument, None)
+                if callable(value):
+                    return None  # Methods are not message fields
+            else:
+                return None
+        elif kind == _INDEX:
+            try:
+                value = value[argument]
+            except (IndexError, KeyError, TypeError):
+                return None
+        else:
+            try:
+                items = value[argument]
+            except (KeyError, TypeError):
+                return None
+            if position + 1 == len(steps):
+                return _to_json(items)
+            return [_extract(item, steps, position + 1) for item in items]
+    return _to_json(value)
+
+
+class FieldProjection:
+    """Compiled set of field paths.
+
+    Attributes:
+        paths: Field paths in the order given
+        key: Hashable identity of the projection (for caching views)
+    """
+
+    def __init__(self, paths: list[str]):
+        """Compile field paths.
+
+        Args:
+            paths: JSON-pointer-like field paths.
+
+        Raises:
+            ValueError: If no path is given, there are too many, or one is malformed.
+        """
+        if not paths:
+            raise ValueError("Projection requires at least one field path")
+        if len(paths) > MAX_PROJECTION_PATHS:
+            raise ValueError(f"Projection has {len(paths)} field paths (maximum {MAX_PROJECTION_PATHS})")
+        self.paths = list(dict.fromkeys(paths))
+        self.key = tuple(self.paths)
+        self._steps = [(path, _compile_path(path)) for path in self.paths]
+
+    def apply(self, msg: Any) -> dict[str, Any]:
+        """Extract the projected fields.
+
+        Args:
+            msg: ROS2 message object, or its converted dict.
+
+        Returns:
+            Dictionary mapping each path to its JSON-serializable value.
+        """
+        return {path: _extract(msg, steps, 0) for path, steps in self._steps}
+
+
+def compile_projection(spec: str) -> FieldProjection:
+    """Compile a comma-separated list of field paths.
+
+    Args:
+        spec: Field paths, e.g. "/position[0:7],/name".
+
+    Returns:
+        Compiled projection.
+
+    Raises:
+        ValueError: If the specification is empty or malformed.
+    """
+    return FieldProjection([path.strip() for path in spec.split(",") if path.strip()])
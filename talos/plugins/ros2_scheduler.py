@@ -0,0 +1,145 @@
+"""Process-wide timer scheduler for ROS2 plugins.
+
+All plugins share one hashed timing wheel driven by a single thread, so the
+number of timer threads stays fixed however many containers are configured.
+The wheel is an array of buckets, one per tick. A timer is placed in the
+bucket of the tick it is due on (with a round count when it is more than one
+revolution away), so each tick only touches the timers of one bucket and
+expiring N timers costs O(N), independent of how many are scheduled.
+
+Callbacks run on the wheel thread and must be short; anything that can block
+for long belongs on its own thread.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TICK = 0.25  # seconds - timer resolution
+DEFAULT_WHEEL_SIZE = 128  # buckets - one revolution covers WHEEL_SIZE * TICK seconds
+
+
+class TimerHandle:
+    """A scheduled callback; cancel() prevents it from running (again)."""
+
+    __slots__ = ("callback", "interval", "rounds", "cancelled")
+
+    def __init__(self, callback: Callable[[], None], interval: Optional[float]):
+        self.callback = callback
+        self.interval = interval  # Repeat period for periodic timers, None for one-shot
+        self.rounds = 0
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the timer; it is dropped from the wheel when its bucket is reached."""
+        self.cancelled = True
+
+
+class TimingWheel:
+    """Hashed timing wheel with one worker thread.
+
+    The thread starts with the first timer and sleeps on a condition while
+    no timers are scheduled.
+    """
+
+    def __init__(self, tick: float = DEFAULT_TICK, size: int = DEFAULT_WHEEL_SIZE):
+        self.tick = tick
+        self.size = size
+        self._buckets: list[list[TimerHandle]] = [[] for _ in range(size)]
+        self._cursor = 0  # Bucket processed on the next tick
+        self._next_tick = 0.0  # time.monotonic() of the next tick
+        self._count = 0  # Timers in the wheel (including cancelled ones not yet dropped)
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Run a callback once after a delay.
+
+        Args:
+            delay: Seconds from now; rounded up to whole ticks (at least one).
+            callback: Function called without arguments on the wheel thread.
+
+        Returns:
+            Handle to cancel the timer.
+        """
+        handle = TimerHandle(callback, None)
+        self._insert(handle, delay)
+        return handle
+
+    def call_every(self, interval: float, callback: Callable[[], None]) -> TimerHandle:
+        """Run a callback every interval seconds until cancelled.
+
+        Args:
+            interval: Period in seconds; the first call is one interval from now.
+            callback: Function called without arguments on the wheel thread.
+
+        Returns:
+            Handle to cancel the timer.
+        """
+        handle = TimerHandle(callback, interval)
+        self._insert(handle, interval)
+        return handle
+
+    def _insert(self, handle: TimerHandle, delay: float) -> None:
+        """Place a timer in the bucket of the tick it is due on."""
+        ticks = max(1, math.ceil(delay / self.tick))
+        with self._cond:
+            handle.rounds = (ticks - 1) // self.size
+            self._buckets[(self._cursor + ticks - 1) % self.size].append(handle)
+            self._count += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="ros2-timing-wheel")
+                self._thread.start()
+            elif self._count == 1:
+                self._cond.notify()
+
+    def _run(self) -> None:
+        """Advance the wheel one bucket per tick and run the due callbacks."""
+        with self._cond:
+            self._next_tick = time.monotonic() + self.tick
+        while True:
+            with self._cond:
+                while self._count == 0:
+                    self._cond.wait()
+                    # Resume ticking from now; bucket positions stay relative to the cursor
+                    self._next_tick = time.monotonic() + self.tick
+                delay = self._next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            due = []
+            with self._cond:
+                index = self._cursor
+                bucket = self._buckets[index]
+                self._buckets[index] = []
+                self._cursor = (index + 1) % self.size
+                self._next_tick += self.tick
+                for handle in bucket:
+                    if handle.cancelled:
+                        self._count -= 1
+                    elif handle.rounds > 0:
+                        handle.rounds -= 1
+                        self._buckets[index].append(handle)
+                    else:
+                        self._count -= 1
+                        due.append(handle)
+
+            for handle in due:
+                try:
+                    handle.callback()
+                except Exception as e:
+                    logger.error(f"Error in scheduled callback {handle.callback!r}: {e}", exc_info=True)
+                if handle.interval is not None and not handle.cancelled:
+                    self._insert(handle, handle.interval)
+
+
+_scheduler = TimingWheel()
+
+
+def get_scheduler() -> TimingWheel:
+    """Get the process-wide timing wheel."""
+    return _scheduler
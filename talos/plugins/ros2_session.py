@@ -0,0 +1,206 @@
+"""Shared Zenoh sessions for ROS2 subscriptions.
+
+zenoh_ros2_sdk's ROS2Subscriber sets up a complete ROS2 participant per
+topic: it declares its own node, computes the message type hash from the
+message definition files, and binds to the SDK's process-wide session
+singleton. That singleton keeps the router address of whoever asked first,
+so containers on different routers would silently share one router.
+
+ROS2SessionManager keeps one Zenoh session per router and one
+ROS2DomainSession per (router, domain). All plugins share them. A
+ROS2DomainSession announces a single "talos" node, caches type hashes per
+message type, and lets each topic attach a lightweight subscription (a
+declare_subscriber plus its liveliness token) to that shared node.
+"""
+
+import logging
+import threading
+from typing import Any, Optional
+
+from zenoh_ros2_sdk import ZenohSession, get_registry
+from zenoh_ros2_sdk.entity import EndpointEntity, EntityKind, NodeEntity
+from zenoh_ros2_sdk.keyexpr import endpoint_liveliness_keyexpr, node_liveliness_keyexpr
+from zenoh_ros2_sdk.utils import get_type_hash, load_dependencies_recursive
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTER_IP = "127.0.0.1"
+DEFAULT_ROUTER_PORT = 7447
+TALOS_NODE_NAME = "talos"  # ROS2 node name announced for talos subscriptions
+
+
+class ROS2DomainSession:
+    """Shared Zenoh session and talos node of one (router, domain).
+
+    Attributes:
+        router: (router_ip, router_port) of the session
+        domain_id: ROS2 domain ID
+        zenoh: SDK session wrapper (Zenoh session, liveliness and type store)
+        node: Node entity that all talos subscriptions in the domain belong to
+    """
+
+    def __init__(self, zenoh_session: ZenohSession, router: tuple[str, int], domain_id: int):
+        self.router = router
+        self.domain_id = domain_id
+        self.zenoh = zenoh_session
+        self.node = NodeEntity(
+            domain_id=domain_id,
+            session_id=zenoh_session.session_id,
+            node_id=zenoh_session.get_next_node_id(),
+            node_name=TALOS_NODE_NAME,
+        )
+        self._node_token = zenoh_session.liveliness.declare_token(node_liveliness_keyexpr(self.node))
+        self._type_hashes: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> Any:
+        """The underlying zenoh.Session."""
+        return self.zenoh.session
+
+    def type_hash(self, msg_type: str) -> str:
+        """Register a message type and get its RIHS type hash (cached per type).
+
+        Args:
+            msg_type: ROS2 message type, e.g. "sensor_msgs/msg/JointState".
+
+        Returns:
+            Type hash string.
+
+        Raises:
+            ValueError: If the message definition is not available in the registry.
+        """
+        with self._lock:
+            cached = self._type_hashes.get(msg_type)
+        if cached is not None:
+            return cached
+
+        self.zenoh.register_message_type(None, msg_type)
+        registry = get_registry()
+        msg_file = registry.get_msg_file_path(msg_type)
+        if not msg_file or not msg_file.exists():
+            raise ValueError(f"Cannot compute type hash for {msg_type}: message definition not found")
+        msg_definition = msg_file.read_text()
+        try:
+            dependencies = load_dependencies_recursive(msg_type, msg_definition, registry)
+        except Exception as e:
+            logger.debug(f"Could not load dependencies for {msg_type}: {e}")
+            dependencies = None
+        type_hash = get_type_hash(msg_type, msg_definition=msg_definition, dependencies=dependencies)
+
+        with self._lock:
+            self._type_hashes[msg_type] = type_hash
+        return type_hash
+
+    def declare_endpoint_token(
+        self,
+        topic: str,
+        dds_type_name: str,
+        type_hash: str,
+        qos: str,
+    ) -> Any:
+        """Announce a subscription of the talos node in the ROS2 graph.
+
+        Returns:
+            Liveliness token; undeclare it when the subscription closes.
+        """
+        endpoint = EndpointEntity(
+            node=self.node,
+            entity_id=self.zenoh.get_next_entity_id(),
+            kind=EntityKind.SUBSCRIPTION,
+            name=topic,
+            dds_type_name=dds_type_name,
+            type_hash=type_hash,
+            qos=qos,
+            gid=self.zenoh.generate_gid(),
+        )
+        return self.zenoh.liveliness.declare_token(endpoint_liveliness_keyexpr(endpoint))
+
+    def deserialize(self, cdr_bytes: bytes, msg_type: str) -> Any:
+        """Deserialize a CDR payload of a registered message type."""
+        return self.zenoh.store.deserialize_cdr(cdr_bytes, msg_type)
+
+    def _close(self) -> None:
+        """Withdraw the talos node from the graph."""
+        try:
+            self._node_token.undeclare()
+        except Exception as e:
+            logger.debug(f"Error undeclaring node token (domain {self.domain_id}): {e}")
+
+
+class ROS2SessionManager:
+    """Reference-counted registry of shared sessions keyed by (router, domain)."""
+
+    def __init__(self):
+        self._sessions: dict[tuple[str, int], ZenohSession] = {}
+        self._domains: dict[tuple[str, int, int], ROS2DomainSession] = {}
+        self._refcounts: dict[tuple[str, int, int], int] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        domain_id: int,
+        router_ip: Optional[str] = None,
+        router_port: Optional[int] = None,
+    ) -> ROS2DomainSession:
+        """Get the shared session of a router and domain, opening it if needed.
+
+        Every acquire() must be paired with a release().
+
+        Args:
+            domain_id: ROS2 domain ID.
+            router_ip: Zenoh router IP (defaults to DEFAULT_ROUTER_IP).
+            router_port: Zenoh router port (defaults to DEFAULT_ROUTER_PORT).
+
+        Raises:
+            Exception: If the Zenoh session cannot be opened.
+        """
+        router = (
+            router_ip if router_ip is not None else DEFAULT_ROUTER_IP,
+            router_port if router_port is not None else DEFAULT_ROUTER_PORT,
+        )
+        key = (*router, domain_id)
+        with self._lock:
+            domain = self._domains.get(key)
+            if domain is None:
+                zenoh_session = self._sessions.get(router)
+                if zenoh_session is None:
+                    zenoh_session = ZenohSession(*router)
+                    self._sessions[router] = zenoh_session
+                    logger.info(f"Opened Zenoh session to {router[0]}:{router[1]}")
+                domain = ROS2DomainSession(zenoh_session, router, domain_id)
+                self._domains[key] = domain
+            self._refcounts[key] = self._refcounts.get(key, 0) + 1
+            return domain
+
+    def release(self, domain: ROS2DomainSession) -> None:
+        """Release a session obtained from acquire(); the last release closes it."""
+        key = (*domain.router, domain.domain_id)
+        with self._lock:
+            count = self._refcounts.get(key, 0) - 1
+            if count > 0:
+                self._refcounts[key] = count
+                return
+            self._refcounts.pop(key, None)
+            if self._domains.pop(key, None) is None:
+                return
+            domain._close()
+
+            if any(other.router == domain.router for other in self._domains.values()):
+                return
+            zenoh_session = self._sessions.pop(domain.router, None)
+        if zenoh_session is not None:
+            try:
+                # Close the Zenoh session directly: ZenohSession.close() also resets the SDK singleton
+                zenoh_session.session.close()
+                logger.info(f"Closed Zenoh session to {domain.router[0]}:{domain.router[1]}")
+            except Exception as e:
+                logger.warning(f"Error closing Zenoh session to {domain.router[0]}:{domain.router[1]}: {e}")
+
+
+_session_manager = ROS2SessionManager()
+
+
+def get_session_manager() -> ROS2SessionManager:
+    """Get the process-wide session manager."""
+    return _session_manager
@@ -0,0 +1,191 @@
+"""Shared-memory table of the latest encoded frame per topic.
+
+Used by isolated ingest: the ingest process writes the JSON-encoded latest
+message of each topic, and the API process reads it. The table is created
+by the API process, so it outlives ingest process restarts.
+
+Layout (little-endian, one shared memory block)::
+
+    slot 0 .. n-1:  header (SLOT_HEADER) + frame_capacity bytes of JSON
+    status:         header (STATUS_HEADER) + STATUS_CAPACITY bytes of JSON
+
+Each slot and the status area are guarded by a sequence lock: the single
+writer makes the version odd, writes, then makes it even again. Readers
+retry while the version is odd or changed during the read. A writer that
+died mid-write leaves the version odd, so writers force the parity rather
+than incrementing it, and the next write after a restart makes the slot
+readable again. The slot's seq
+field can be read on its own, so checking whether a topic changed costs no
+copy. The last_read field goes the other way: the API process stamps client
+reads into it so the ingest process can drive ingest policies and lazy
+subscriptions.
+"""
+
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+# version, seq, received_at, length, flags (written by ingest), last_read (written by the API)
+SLOT_HEADER = struct.Struct("<QQdIId")
+_FRAME_FIELDS = struct.Struct("<QQdII")
+# version, length
+STATUS_HEADER = struct.Struct("<QI4x")
+STATUS_CAPACITY = 256 * 1024  # bytes - status JSON written by the ingest process
+FLAG_OVERSIZE = 0x1  # the latest frame did not fit and was not written
+READ_RETRIES = 100  # seqlock read attempts before giving up on a busy slot
+
+_VERSION = struct.Struct("<Q")
+_SEQ_OFFSET = 8
+_LAST_READ_OFFSET = 32
+
+
+class SharedLatestTable:
+    """Fixed-size table of latest frames in shared memory.
+
+    Attributes:
+        topics: Topic names in slot order
+        frame_capacity: Maximum encoded frame size per topic in bytes
+        name: Shared memory block name (pass to attach() in the other process)
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, topics: list[str], frame_capacity: int, owner: bool):
+        self.topics = topics
+        self.frame_capacity = frame_capacity
+        self.name = shm.name
+        self._shm = shm
+        self._buf = shm.buf
+        self._owner = owner
+        self._stride = (SLOT_HEADER.size + frame_capacity + 7) & ~7
+        self._status_offset = self._stride * len(topics)
+        self._index = {topic: index for index, topic in enumerate(topics)}
+
+    @classmethod
+    def size_for(cls, topic_count: int, frame_capacity: int) -> int:
+        """Size in bytes of a table for topic_count topics."""
+        stride = (SLOT_HEADER.size + frame_capacity + 7) & ~7
+        return stride * topic_count + STATUS_HEADER.size + STATUS_CAPACITY
+
+    @classmethod
+    def create(cls, topics: list[str], frame_capacity: int) -> "SharedLatestTable":
+        """Create a zeroed table; the creator unlinks it in close()."""
+        # New blocks are zero-filled: no frames, no status, never read
+        shm = shared_memory.SharedMemory(create=True, size=cls.size_for(len(topics), frame_capacity))
+        return cls(shm, topics, frame_capacity, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, topics: list[str], frame_capacity: int) -> "SharedLatestTable":
+        """Attach to a table created by another process."""
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 always registers the block with the resource tracker; spawned
+            # children share the creator's tracker, so the duplicate registration is harmless
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, topics, frame_capacity, owner=False)
+
+    def close(self) -> None:
+        """Detach from the table (and remove it if this process created it)."""
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    # ============================================================================
+    # Frames
+    # ============================================================================
+
+    def slot_index(self, topic: str) -> Optional[int]:
+        """Slot index of a topic, or None if the table has no slot for it."""
+        return self._index.get(topic)
+
+    def read_seq(self, index: int) -> int:
+        """Sequence number of a slot's latest frame (0 if none was written)."""
+        return struct.unpack_from("<Q", self._buf, self._stride * index + _SEQ_OFFSET)[0]
+
+    def read_frame(self, index: int) -> Optional[tuple[int, float, bytes]]:
+        """Read a slot's latest frame.
+
+        Returns:
+            Tuple of (seq, received_at, data_json), or None if no frame was
+            written yet or the latest frame was oversize.
+        """
+        offset = self._stride * index
+        data_offset = offset + SLOT_HEADER.size
+        for _ in range(READ_RETRIES):
+            version, seq, received_at, length, flags, _ = SLOT_HEADER.unpack_from(self._buf, offset)
+            if version & 1:
+                time.sleep(0)
+                continue
+            data = bytes(self._buf[data_offset:data_offset + length]) if seq and not flags & FLAG_OVERSIZE else None
+            if _VERSION.unpack_from(self._buf, offset)[0] == version:
+                return None if data is None else (seq, received_at, data)
+        return None
+
+    def write_frame(self, index: int, seq: int, received_at: float, data_json: bytes) -> bool:
+        """Write a slot's latest frame (single writer only).
+
+        Returns:
+            False if the frame exceeds frame_capacity; the slot is then
+            marked oversize and readers see no data until a frame fits.
+        """
+        offset = self._stride * index
+        # Force parity: a version left odd by a crashed writer must not stay odd
+        odd = _VERSION.unpack_from(self._buf, offset)[0] | 1
+        fits = len(data_json) <= self.frame_capacity
+        _VERSION.pack_into(self._buf, offset, odd)
+        if fits:
+            data_offset = offset + SLOT_HEADER.size
+            self._buf[data_offset:data_offset + len(data_json)] = data_json
+        # last_read belongs to the API process and is left untouched
+        _FRAME_FIELDS.pack_into(
+            self._buf, offset,
+            odd, seq, received_at, len(data_json) if fits else 0, 0 if fits else FLAG_OVERSIZE,
+        )
+        _VERSION.pack_into(self._buf, offset, odd + 1)
+        return fits
+
+    # ============================================================================
+    # Reads (API process -> ingest process)
+    # ============================================================================
+
+    def mark_read(self, index: int, read_at: float) -> None:
+        """Stamp a client read of a slot's topic."""
+        struct.pack_into("<d", self._buf, self._stride * index + _LAST_READ_OFFSET, read_at)
+
+    def read_last_read(self, index: int) -> float:
+        """Time of the latest client read of a slot's topic (0.0 if never read)."""
+        return struct.unpack_from("<d", self._buf, self._stride * index + _LAST_READ_OFFSET)[0]
+
+    # ============================================================================
+    # Status (ingest process -> API process)
+    # ============================================================================
+
+    def write_status(self, status_json: bytes) -> bool:
+        """Write the status JSON (single writer only); False if it exceeds STATUS_CAPACITY."""
+        if len(status_json) > STATUS_CAPACITY:
+            return False
+        offset = self._status_offset
+        odd = _VERSION.unpack_from(self._buf, offset)[0] | 1
+        _VERSION.pack_into(self._buf, offset, odd)
+        data_offset = offset + STATUS_HEADER.size
+        self._buf[data_offset:data_offset + len(status_json)] = status_json
+        STATUS_HEADER.pack_into(self._buf, offset, odd + 1, len(status_json))
+        return True
+
+    def read_status(self) -> Optional[bytes]:
+        """Read the status JSON, or None if none was written yet."""
+        offset = self._status_offset
+        data_offset = offset + STATUS_HEADER.size
+        for _ in range(READ_RETRIES):
+            version, length = STATUS_HEADER.unpack_from(self._buf, offset)
+            if version & 1:
+                time.sleep(0)
+                continue
+            data = bytes(self._buf[data_offset:data_offset + length])
+            if _VERSION.unpack_from(self._buf, offset)[0] == version:
+                return data if version else None
+        return None
@@ -0,0 +1,103 @@
+"""On-disk snapshots of static topic data.
+
+Static topics such as /robot_description are published once with
+TRANSIENT_LOCAL durability. After a restart, talos has no data for them
+until that sample is fetched again. Snapshots keep the last message of each
+static topic on disk, so the cache can be warmed at startup.
+
+One file per (container, domain, topic)::
+
+    <root>/<container>/domain_<domain_id>/<quoted topic>.snap
+
+Binary format (little-endian)::
+
+    magic "TLSS" | version u8 | received_at f64 | msg_type length u16 |
+    msg_type (UTF-8) | zlib-compressed JSON of the converted message
+
+Files are written to a temporary name and renamed into place, so readers
+never see a partial snapshot.
+"""
+
+import logging
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"TLSS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+_HEADER = struct.Struct("<4sBdH")
+
+
+def snapshot_path(root: str, container_name: str, domain_id: int, topic: str) -> Path:
+    """Get the snapshot file of a topic."""
+    return Path(root) / quote(container_name, safe="") / f"domain_{domain_id}" / (quote(topic, safe="") + SNAPSHOT_SUFFIX)
+
+
+def save_snapshot(path: Path, msg_type: str, received_at: float, data_json: bytes) -> None:
+    """Write a snapshot atomically.
+
+    Args:
+        path: Snapshot file (parent directories are created).
+        msg_type: Message type of the topic.
+        received_at: Receive time of the message.
+        data_json: JSON encoding of the converted message.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    msg_type_bytes = msg_type.encode("utf-8")
+    body = b"".join((
+        _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, received_at, len(msg_type_bytes)),
+        msg_type_bytes,
+        zlib.compress(data_json),
+    ))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_snapshot(path: Path) -> Optional[tuple[str, float, bytes]]:
+    """Read a snapshot.
+
+    Args:
+        path: Snapshot file.
+
+    Returns:
+        Tuple of (msg_type, received_at, data_json), or None if the file
+        does not exist or is not a valid snapshot.
+    """
+    try:
+        body = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Cannot read snapshot {path}: {e}")
+        return None
+
+    try:
+        magic, version, received_at, msg_type_length = _HEADER.unpack_from(body)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("unknown format")
+        offset = _HEADER.size
+        msg_type = body[offset:offset + msg_type_length].decode("utf-8")
+        data_json = zlib.decompress(body[offset + msg_type_length:])
+    except (struct.error, ValueError, zlib.error) as e:
+        logger.warning(f"Ignoring invalid snapshot {path}: {e}")
+        return None
+    return msg_type, received_at, data_json
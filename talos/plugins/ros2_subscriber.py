@@ -0,0 +1,380 @@
+"""Lightweight ROS2 topic subscription on a shared domain session.
+
+Unlike zenoh_ros2_sdk's ROS2Subscriber, which creates a node and resolves
+the message type on its own for every topic, a ROS2SampleSubscriber only
+declares a Zenoh subscriber and one liveliness token on a ROS2DomainSession
+shared by all topics of the same router and domain. The wire behaviour is
+the same: the same data key expression, the same subscription token format,
+and TRANSIENT_LOCAL history queried from rmw_zenoh's AdvancedPublisher
+caches.
+
+The callback also receives the serialized payload size of each sample,
+which talos uses for bandwidth statistics. In raw mode the callback gets
+the serialized CDR payload itself, and deserialization is left to the
+reader (see ROS2DomainSession.deserialize).
+
+Plugins do not create ROS2SampleSubscribers directly but go through the
+ROS2SubscriptionRegistry, which shares one subscription per (router,
+domain, topic, type) among all containers that list the topic. Each
+sample is received and deserialized once and fanned out to every
+container's callback.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from zenoh_ros2_sdk.keyexpr import ADMIN_SPACE, topic_keyexpr
+from zenoh_ros2_sdk.qos import DEFAULT_QOS_PROFILE, QosDurability, QosProfile
+from zenoh_ros2_sdk.utils import mangle_name, ros2_to_dds_type
+
+from talos.plugins.ros2_session import ROS2DomainSession
+
+logger = logging.getLogger(__name__)
+
+HISTORY_QUERY_TIMEOUT = 2.0  # seconds - TRANSIENT_LOCAL publisher discovery and cache queries
+
+
+class ROS2SampleSubscriber:
+    """Subscription of one topic on a shared ROS2DomainSession.
+
+    The callback is called as ``callback(msg, payload_size)`` from a Zenoh
+    thread; in raw mode msg is the serialized CDR payload (bytes).
+
+    Attributes:
+        topic: Topic name
+        msg_type: Message type string
+        keyexpr: Zenoh data key expression of the topic
+    """
+
+    def __init__(
+        self,
+        domain: ROS2DomainSession,
+        topic: str,
+        msg_type: str,
+        callback: Callable[[Any, int], None],
+        qos: Optional[QosProfile] = None,
+        raw: bool = False,
+    ):
+        """Declare the subscription.
+
+        Args:
+            domain: Shared session of the router and domain.
+            topic: Topic name.
+            msg_type: Message type string.
+            callback: Function called with (msg, payload_size) per received message.
+            qos: QoS announced in the liveliness token. TRANSIENT_LOCAL durability
+                also fetches the publishers' cached samples (up to history_depth).
+            raw: Deliver serialized payloads instead of deserialized messages.
+
+        Raises:
+            ValueError: If the message type cannot be resolved.
+            Exception: If the Zenoh subscriber cannot be declared.
+        """
+        self.domain = domain
+        self.topic = topic
+        self.msg_type = msg_type
+        self._callback = callback
+        self._raw = raw
+        qos = qos or DEFAULT_QOS_PROFILE
+
+        self._type_hash = domain.type_hash(msg_type)
+        self._dds_type_name = ros2_to_dds_type(msg_type)
+        self.keyexpr = topic_keyexpr(domain.domain_id, topic, self._dds_type_name, self._type_hash)
+
+        self._token = domain.declare_endpoint_token(topic, self._dds_type_name, self._type_hash, qos.encode())
+        try:
+            self._sub = domain.session.declare_subscriber(self.keyexpr, self._process_sample)
+        except Exception:
+            self._token.undeclare()
+            raise
+
+        if qos.durability == QosDurability.TRANSIENT_LOCAL:
+            self._query_historical_data(qos.history_depth)
+
+    def close(self) -> None:
+        """Undeclare the subscription and its liveliness token (idempotent)."""
+        for resource in (self._sub, self._token):
+            if resource is None:
+                continue
+            try:
+                resource.undeclare()
+            except Exception as e:
+                logger.debug(f"Error undeclaring subscription resource for '{self.topic}': {e}")
+        self._sub = None
+        self._token = None
+
+    def _process_sample(self, sample: Any, callback: Optional[Callable[[Any, int], None]] = None) -> None:
+        """Deserialize a Zenoh sample (unless raw) and deliver it with its payload size."""
+        try:
+            cdr_bytes = sample.payload.to_bytes()
+            if not cdr_bytes:
+                raise ValueError("Received empty payload")
+            msg = cdr_bytes if self._raw else self.domain.deserialize(cdr_bytes, self.msg_type)
+        except Exception as e:
+            logger.error(f"Error deserializing message on topic '{self.topic}': {e}")
+            return
+        (callback or self._callback)(msg, len(cdr_bytes))
+
+    def query_historical_data(self, max_samples: int, callback: Callable[[Any, int], None]) -> None:
+        """Fetch cached samples from TRANSIENT_LOCAL publishers and deliver them to callback only.
+
+        Used when a TRANSIENT_LOCAL listener joins a subscription that
+        already exists, so that the other listeners do not see the samples twice.
+        """
+        self._query_historical_data(max_samples, callback)
+
+    def _query_historical_data(self, max_samples: int, callback: Optional[Callable[[Any, int], None]] = None) -> None:
+        """Fetch cached samples from TRANSIENT_LOCAL publishers.
+
+        rmw_zenoh's AdvancedPublisher caches samples at
+        ``<keyexpr>/@adv/pub/<zenoh_id>/<entity_id>/_``; each publisher
+        announced for this topic and type is queried for them.
+        """
+        pattern = (
+            f"{ADMIN_SPACE}/{self.domain.domain_id}/*/*/*/MP/*/*/*/"
+            f"{mangle_name(self.topic)}/{self._dds_type_name}/{self._type_hash}/*"
+        )
+        publishers = set()
+        try:
+            for reply in self.domain.zenoh.liveliness.get(pattern, timeout=HISTORY_QUERY_TIMEOUT):
+                if reply.ok is not None:
+                    publishers.add(str(reply.ok.key_expr).split("/")[2])
+        except Exception as e:
+            logger.warning(f"Failed to discover publishers for '{self.topic}': {e}")
+            return
+
+        for zenoh_id in publishers:
+            selector = f"{self.keyexpr}/@adv/pub/{zenoh_id}/**?_anyke;_max={max_samples}"
+            try:
+                for reply in self.domain.session.get(selector, timeout=HISTORY_QUERY_TIMEOUT):
+                    if reply.ok is not None:
+                        self._process_sample(reply.ok, callback)
+                    elif reply.err is not None:
+                        logger.warning(f"Query error for '{self.topic}': {reply.err}")
+            except Exception as e:
+                logger.warning(f"Failed to query cached samples of '{self.topic}' from {zenoh_id}: {e}")
+
+
+class _Listener:
+    """A container's callback on a shared subscription."""
+
+    __slots__ = ("callback", "raw")
+
+    def __init__(self, callback: Callable[[Any, int], None], raw: bool):
+        self.callback = callback
+        self.raw = raw
+
+
+class ROS2SharedSubscription:
+    """One subscription of a topic, fanned out to every listener.
+
+    The underlying ROS2SampleSubscriber always receives serialized payloads.
+    A sample is deserialized at most once, and only if a listener wants
+    deserialized messages; raw listeners (lazy_deserialize) get the payload
+    itself. Listeners therefore share the same message objects and must not
+    modify them.
+
+    Attributes:
+        domain: Shared session of the router and domain
+        topic: Topic name
+        msg_type: Message type string
+    """
+
+    def __init__(self, domain: ROS2DomainSession, topic: str, msg_type: str):
+        self.domain = domain
+        self.topic = topic
+        self.msg_type = msg_type
+        self.closed = False
+        self.lock = threading.Lock()  # Serializes joins and leaves of this subscription
+        self._listeners: list[_Listener] = []  # Copy-on-write, read lock-free by the Zenoh thread
+        self._subscriber: Optional[ROS2SampleSubscriber] = None
+
+    @property
+    def listener_count(self) -> int:
+        """Number of containers sharing this subscription."""
+        return len(self._listeners)
+
+    def add_listener(self, listener: _Listener, qos: Optional[QosProfile]) -> None:
+        """Attach a listener, declaring the subscription for the first one (call with lock held).
+
+        Raises:
+            ValueError: If the message type cannot be resolved.
+            Exception: If the Zenoh subscriber cannot be declared.
+        """
+        qos = qos or DEFAULT_QOS_PROFILE
+        self._listeners = [*self._listeners, listener]
+        if self._subscriber is None:
+            try:
+                # TRANSIENT_LOCAL history is delivered from the constructor, so the listener is attached first
+                self._subscriber = ROS2SampleSubscriber(
+                    self.domain, self.topic, self.msg_type, self._dispatch, qos=qos, raw=True,
+                )
+            except Exception:
+                self._listeners = [other for other in self._listeners if other is not listener]
+                raise
+        elif qos.durability == QosDurability.TRANSIENT_LOCAL:
+            # Late joiner: fetch the publishers' cached samples for this listener only
+            self._subscriber.query_historical_data(
+                qos.history_depth,
+                lambda cdr_bytes, payload_size: self._deliver((listener,), cdr_bytes, payload_size),
+            )
+
+    def remove_listener(self, listener: _Listener) -> bool:
+        """Detach a listener (call with lock held).
+
+        Returns:
+            True if it was the last listener and the subscription was closed.
+        """
+        self._listeners = [other for other in self._listeners if other is not listener]
+        if self._listeners:
+            return False
+        if self._subscriber is not None:
+            self._subscriber.close()
+            self._subscriber = None
+        self.closed = True
+        return True
+
+    def _dispatch(self, cdr_bytes: bytes, payload_size: int) -> None:
+        """Deliver a received sample to all listeners."""
+        self._deliver(self._listeners, cdr_bytes, payload_size)
+
+    def _deliver(self, listeners: Any, cdr_bytes: bytes, payload_size: int) -> None:
+        """Deliver a serialized sample, deserializing it once for the non-raw listeners.
+
+        If deserialization fails, only the non-raw listeners miss the sample;
+        raw listeners still receive its CDR bytes.
+        """
+        msg = None
+        failed = False
+        for listener in listeners:
+            if not listener.raw:
+                if failed:
+                    continue
+                if msg is None:
+                    try:
+                        msg = self.domain.deserialize(cdr_bytes, self.msg_type)
+                    except Exception as e:
+                        logger.error(f"Error deserializing message on topic '{self.topic}': {e}")
+                        failed = True
+                        continue
+            try:
+                listener.callback(cdr_bytes if listener.raw else msg, payload_size)
+            except Exception as e:
+                # One container's failure must not starve the others
+                logger.error(f"Error delivering message on topic '{self.topic}': {e}", exc_info=True)
+
+
+class ROS2SubscriptionHandle:
+    """A container's membership in a shared subscription; close() leaves it.
+
+    Attributes:
+        topic: Topic name
+        msg_type: Message type string
+    """
+
+    def __init__(self, registry: "ROS2SubscriptionRegistry", shared: ROS2SharedSubscription, listener: _Listener):
+        self.topic = shared.topic
+        self.msg_type = shared.msg_type
+        self._registry = registry
+        self._shared = shared
+        self._listener: Optional[_Listener] = listener
+
+    @property
+    def shared_count(self) -> int:
+        """Number of containers receiving this subscription (including this one)."""
+        return self._shared.listener_count
+
+    def close(self) -> None:
+        """Leave the subscription; the last container to leave undeclares it (idempotent)."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            self._registry._release(self._shared, listener)
+
+
+class ROS2SubscriptionRegistry:
+    """Reference-counted subscriptions keyed by (router, domain, topic, type).
+
+    Containers that list the same topic on the same router and domain share
+    one Zenoh subscription, one liveliness token and one deserialization
+    per sample. Each container keeps its own callback and therefore its own
+    cache, statistics and status.
+    """
+
+    def __init__(self):
+        self._subscriptions: dict[tuple[str, int, int, str, str], ROS2SharedSubscription] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self,
+        domain: ROS2DomainSession,
+        topic: str,
+        msg_type: str,
+        callback: Callable[[Any, int], None],
+        qos: Optional[QosProfile] = None,
+        raw: bool = False,
+    ) -> ROS2SubscriptionHandle:
+        """Join the shared subscription of a topic, declaring it if needed.
+
+        Args:
+            domain: Shared session of the router and domain.
+            topic: Topic name.
+            msg_type: Message type string.
+            callback: Function called with (msg, payload_size) per received message.
+            qos: QoS of the subscription. The first subscriber's QoS is announced;
+                later TRANSIENT_LOCAL subscribers still get the publishers' cached samples.
+            raw: Deliver serialized payloads instead of deserialized messages.
+
+        Returns:
+            Handle to close when the container no longer needs the topic.
+
+        Raises:
+            ValueError: If the message type cannot be resolved.
+            Exception: If the Zenoh subscriber cannot be declared.
+        """
+        key = (*domain.router, domain.domain_id, topic, msg_type)
+        listener = _Listener(callback, raw)
+        while True:
+            with self._lock:
+                shared = self._subscriptions.get(key)
+                if shared is None:
+                    shared = ROS2SharedSubscription(domain, topic, msg_type)
+                    self._subscriptions[key] = shared
+            # Declaring may take seconds (TRANSIENT_LOCAL queries); only this key waits for it
+            with shared.lock:
+                if shared.closed:
+                    continue  # The last listener left meanwhile; start over with a fresh subscription
+                try:
+                    shared.add_listener(listener, qos)
+                except Exception:
+                    if not shared.listener_count:
+                        shared.closed = True
+                        self._forget(key, shared)
+                    raise
+            if shared.listener_count > 1:
+                logger.debug(
+                    f"Sharing subscription of '{topic}' (domain {domain.domain_id}) "
+                    f"among {shared.listener_count} containers"
+                )
+            return ROS2SubscriptionHandle(self, shared, listener)
+
+    def _release(self, shared: ROS2SharedSubscription, listener: _Listener) -> None:
+        """Detach a listener, dropping the subscription after the last one."""
+        with shared.lock:
+            if not shared.remove_listener(listener):
+                return
+        self._forget((*shared.domain.router, shared.domain.domain_id, shared.topic, shared.msg_type), shared)
+
+    def _forget(self, key: tuple[str, int, int, str, str], shared: ROS2SharedSubscription) -> None:
+        """Remove a closed subscription from the registry (unless it was already replaced)."""
+        with self._lock:
+            if self._subscriptions.get(key) is shared:
+                del self._subscriptions[key]
+
+
+_subscription_registry = ROS2SubscriptionRegistry()
+
+
+def get_subscription_registry() -> ROS2SubscriptionRegistry:
+    """Get the process-wide subscription registry."""
+    return _subscription_registry
@@ -0,0 +1,464 @@
+"""TF buffer: time-indexed transform tree of a container's /tf and /tf_static.
+
+The 3D viewer needs link poses, which are chains of transforms published
+on /tf (high rate) and /tf_static (latched). ROS2TFBuffer subscribes to
+both topics and keeps a TransformBuffer, so clients can look up one
+transform instead of streaming /tf.
+
+TransformBuffer keeps, per child frame, its parent and the transforms
+received within cache_time seconds (static frames keep one). A lookup
+between two frames walks both up to their common ancestor. Transforms
+between samples are interpolated (linear translation, slerp rotation), as
+tf2 does. Two caches keep lookups cheap:
+
+- chain cache: the frame path of each (target, source) pair, reused until
+  the tree topology changes (a new frame or a new parent);
+- latest cache: the latest transform of each pair, reused until a
+  transform of a frame on its chain changes. Each frame counts its
+  updates, so /tf traffic on other branches of the tree (e.g. a moving
+  arm) does not invalidate lookups along a static or slower branch.
+
+Transforms are (x, y, z, qx, qy, qz, qw) tuples; lookup(target, source)
+returns the pose of source in target, i.e. it maps source coordinates
+into target coordinates.
+"""
+
+import bisect
+import logging
+import math
+import threading
+import time
+from typing import Any, Optional
+
+from zenoh_ros2_sdk.qos import QosDurability, QosProfile
+
+from talos.plugins.ros2_session import ROS2DomainSession, get_session_manager
+from talos.plugins.ros2_subscriber import ROS2SubscriptionHandle, get_subscription_registry
+
+logger = logging.getLogger(__name__)
+
+TF_MESSAGE_TYPE = "tf2_msgs/msg/TFMessage"
+DEFAULT_CACHE_TIME = 10.0  # seconds - history kept per dynamic frame (tf2 default)
+MAX_CHAIN_LENGTH = 1000  # frames - guards against parent loops in malformed trees
+
+Transform = tuple[float, float, float, float, float, float, float]
+IDENTITY: Transform = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+
+
+class TFLookupError(Exception):
+    """A transform cannot be looked up (unknown frame or disconnected trees)."""
+
+
+class TFExtrapolationError(TFLookupError):
+    """The requested time is outside the buffered transforms of a frame."""
+
+
+# ============================================================================
+# Transform Math
+# ============================================================================
+
+def _quat_multiply(a: tuple, b: tuple) -> tuple[float, float, float, float]:
+    """Hamilton product of two (x, y, z, w) quaternions."""
+    ax, ay, az, aw = a
+    bx, by, bz, bw = b
+    return (
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+        aw * bw - ax * bx - ay * by - az * bz,
+    )
+
+
+def _quat_rotate(q: tuple, v: tuple) -> tuple[float, float, float]:
+    """Rotate a vector by a unit quaternion."""
+    qx, qy, qz, qw = q
+    vx, vy, vz = v
+    # v' = v + w * t + q_vec x t, with t = 2 * (q_vec x v)
+    tx = 2.0 * (qy * vz - qz * vy)
+    ty = 2.0 * (qz * vx - qx * vz)
+    tz = 2.0 * (qx * vy - qy * vx)
+    return (
+        vx + qw * tx + (qy * tz - qz * ty),
+        vy + qw * ty + (qz * tx - qx * tz),
+        vz + qw * tz + (qx * ty - qy * tx),
+    )
+
+
+def compose(a: Transform, b: Transform) -> Transform:
+    """Compose transforms: the result maps b's child frame into a's parent frame."""
+    x, y, z = _quat_rotate(a[3:], b[:3])
+    return (a[0] + x, a[1] + y, a[2] + z, *_quat_multiply(a[3:], b[3:]))
+
+
+def invert(a: Transform) -> Transform:
+    """Invert a transform."""
+    q = (-a[3], -a[4], -a[5], a[6])
+    x, y, z = _quat_rotate(q, a[:3])
+    return (-x, -y, -z, *q)
+
+
+def interpolate(a: Transform, b: Transform, ratio: float) -> Transform:
+    """Interpolate between transforms: lerp translation, slerp rotation."""
+    translation = tuple(a[i] + (b[i] - a[i]) * ratio for i in range(3))
+    qa, qb = a[3:], b[3:]
+    dot = sum(qa[i] * qb[i] for i in range(4))
+    if dot < 0.0:
+        # Take the short way around
+        qb = tuple(-value for value in qb)
+        dot = -dot
+    if dot > 0.9995:
+        # Nearly parallel: normalized lerp avoids dividing by sin(~0)
+        q = tuple(qa[i] + (qb[i] - qa[i]) * ratio for i in range(4))
+    else:
+        theta = math.acos(dot)
+        sin_theta = math.sin(theta)
+        wa = math.sin((1.0 - ratio) * theta) / sin_theta
+        wb = math.sin(ratio * theta) / sin_theta
+        q = tuple(wa * qa[i] + wb * qb[i] for i in range(4))
+    norm = math.sqrt(sum(value * value for value in q)) or 1.0
+    return (*translation, *(value / norm for value in q))
+
+
+# ============================================================================
+# Transform Buffer
+# ============================================================================
+
+class _FrameHistory:
+    """Transforms of one child frame relative to its parent, ordered by stamp."""
+
+    __slots__ = ("parent", "static", "stamps", "transforms", "version")
+
+    def __init__(self, parent: str, static: bool):
+        self.parent = parent
+        self.static = static
+        self.stamps: list[float] = []
+        self.transforms: list[Transform] = []
+        self.version = 0  # Bumped on every insert
+
+    def insert(self, stamp: float, transform: Transform, cache_time: float) -> None:
+        """Add a transform, dropping those older than cache_time before the newest."""
+        self.version += 1
+        if self.static:
+            self.stamps = [stamp]
+            self.transforms = [transform]
+            return
+        if not self.stamps or stamp > self.stamps[-1]:
+            self.stamps.append(stamp)
+            self.transforms.append(transform)
+        else:
+            index = bisect.bisect_left(self.stamps, stamp)
+            if index < len(self.stamps) and self.stamps[index] == stamp:
+                self.transforms[index] = transform
+                return
+            self.stamps.insert(index, stamp)
+            self.transforms.insert(index, transform)
+        expired = bisect.bisect_left(self.stamps, self.stamps[-1] - cache_time)
+        if expired:
+            del self.stamps[:expired]
+            del self.transforms[:expired]
+
+    @property
+    def latest(self) -> float:
+        """Stamp of the newest transform."""
+        return self.stamps[-1]
+
+    def at(self, stamp: Optional[float], child: str) -> Transform:
+        """Get the transform at a time (None for the newest), interpolating between samples.
+
+        Raises:
+            TFExtrapolationError: If stamp is outside the buffered range.
+        """
+        if self.static or stamp is None:
+            return self.transforms[-1]
+        stamps = self.stamps
+        if stamp > stamps[-1] or stamp < stamps[0]:
+            raise TFExtrapolationError(
+                f"Lookup of '{child}' at {stamp:.6f} is outside its buffered range "
+                f"[{stamps[0]:.6f}, {stamps[-1]:.6f}]"
+            )
+        index = bisect.bisect_left(stamps, stamp)
+        if stamps[index] == stamp:
+            return self.transforms[index]
+        before, after = stamps[index - 1], stamps[index]
+        return interpolate(self.transforms[index - 1], self.transforms[index], (stamp - before) / (after - before))
+
+
+class TransformBuffer:
+    """Time-indexed transform tree with interpolation and lookup caches.
+
+    Attributes:
+        cache_time: Seconds of history kept per dynamic frame
+    """
+
+    def __init__(self, cache_time: float = DEFAULT_CACHE_TIME):
+        self.cache_time = cache_time
+        self._frames: dict[str, _FrameHistory] = {}
+        self._topology_version = 0  # Bumped when a frame or parent link is added or changed
+        self._chains: dict[tuple[str, str], tuple[int, list[str], list[str]]] = {}
+        # (topology version, versions of the chain's frames, stamp, transform) per pair
+        self._latest: dict[tuple[str, str], tuple[int, tuple[int, ...], float, Transform]] = {}
+        self._lock = threading.Lock()
+
+    def set_transform(self, parent: str, child: str, stamp: float, transform: Transform, static: bool) -> None:
+        """Add a transform of child relative to parent.
+
+        A frame whose parent changes starts a new history.
+        """
+        with self._lock:
+            history = self._frames.get(child)
+            if history is None or history.parent != parent or history.static != static:
+                history = _FrameHistory(parent, static)
+                self._frames[child] = history
+                self._topology_version += 1
+            history.insert(stamp, transform, self.cache_time)
+
+    def lookup(self, target: str, source: str, stamp: Optional[float] = None) -> tuple[float, Transform]:
+        """Get the transform mapping source coordinates into target coordinates.
+
+        Args:
+            target: Target frame.
+            source: Source frame.
+            stamp: Time of the transform (seconds), or None for the latest time
+                at which every transform of the chain is available.
+
+        Returns:
+            Tuple of (stamp, transform); stamp is 0.0 for chains of static transforms.
+
+        Raises:
+            TFLookupError: If a frame is unknown or the frames are not connected.
+            TFExtrapolationError: If stamp is outside the buffered range of a frame.
+        """
+        key = (target, source)
+        with self._lock:
+            source_chain, target_chain = self._get_chain(target, source)
+            if stamp is None:
+                versions = tuple(self._frames[frame].version for frame in (*source_chain, *target_chain))
+                cached = self._latest.get(key)
+                if cached is not None and cached[0] == self._topology_version and cached[1] == versions:
+                    return cached[2], cached[3]
+
+            at = stamp
+            if stamp is None:
+                # Latest common time of the dynamic transforms (static ones hold at any time)
+                latest = [
+                    self._frames[frame].latest
+                    for frame in (*source_chain, *target_chain)
+                    if not self._frames[frame].static
+                ]
+                at = min(latest) if latest else None
+
+            ancestor_from_source = self._chain_transform(source_chain, at)
+            ancestor_from_target = self._chain_transform(target_chain, at)
+            lookup_stamp = at if at is not None else 0.0
+            result = compose(invert(ancestor_from_target), ancestor_from_source)
+
+            if stamp is None:
+                self._latest[key] = (self._topology_version, versions, lookup_stamp, result)
+            return lookup_stamp, result
+
+    def get_frames(self) -> list[dict[str, Any]]:
+        """Get all known child frames with their parent, whether static, and newest stamp."""
+        with self._lock:
+            return [
+                {
+                    "frame": frame,
+                    "parent": history.parent,
+                    "static": history.static,
+                    "latest": history.latest,
+                    "oldest": history.stamps[0],
+                }
+                for frame, history in sorted(self._frames.items())
+            ]
+
+    def clear(self) -> None:
+        """Remove all transforms."""
+        with self._lock:
+            self._frames.clear()
+            self._chains.clear()
+            self._latest.clear()
+            self._topology_version += 1
+
+    def _get_chain(self, target: str, source: str) -> tuple[list[str], list[str]]:
+        """Get the child frames from source and from target up to their common ancestor (lock held).
+
+        Raises:
+            TFLookupError: If a frame is unknown or the frames are not connected.
+        """
+        key = (target, source)
+        cached = self._chains.get(key)
+        if cached is not None and cached[0] == self._topology_version:
+            return cached[1], cached[2]
+
+        source_path = self._path_to_root(source)
+        target_path = self._path_to_root(target)
+        target_index = {frame: index for index, frame in enumerate(target_path)}
+        for source_index, frame in enumerate(source_path):
+            if frame in target_index:
+                # Each path lists the frames below the ancestor; their edges lead up to it
+                source_chain = source_path[:source_index]
+                target_chain = target_path[:target_index[frame]]
+                break
+        else:
+            raise TFLookupError(
+                f"Frames '{target}' and '{source}' are not connected "
+                f"(roots '{target_path[-1]}' and '{source_path[-1]}')"
+            )
+        self._chains[key] = (self._topology_version, source_chain, target_chain)
+        return source_chain, target_chain
+
+    def _path_to_root(self, frame: str) -> list[str]:
+        """List a frame and its ancestors up to the root (lock held)."""
+        if frame not in self._frames and not any(history.parent == frame for history in self._frames.values()):
+            raise TFLookupError(f"Frame '{frame}' does not exist")
+        path = [frame]
+        history = self._frames.get(frame)
+        while history is not None:
+            if len(path) > MAX_CHAIN_LENGTH:
+                raise TFLookupError(f"Frame '{frame}' has a parent loop")
+            path.append(history.parent)
+            history = self._frames.get(history.parent)
+        return path
+
+    def _chain_transform(self, chain: list[str], stamp: Optional[float]) -> Transform:
+        """Compose the transforms from the end of a chain's edges down to its first frame (lock held)."""
+        result = IDENTITY
+        for frame in reversed(chain):
+            result = compose(result, self._frames[frame].at(stamp, frame))
+        return result
+
+
+# ============================================================================
+# Plugin
+# ============================================================================
+
+def _frame_id(frame: str) -> str:
+    """Normalize a frame ID (tf2 ignores a leading slash)."""
+    return frame[1:] if frame.startswith("/") else frame
+
+
+class ROS2TFBuffer:
+    """TF buffer plugin of a container: /tf and /tf_static into a TransformBuffer.
+
+    Subscriptions go through the shared subscription registry, so a /tf
+    topic that is also configured as a regular topic is received once.
+
+    Attributes:
+        container_name: Name of the container/robot
+        domain_id: ROS2 domain ID
+        router_ip: Optional Zenoh router IP address
+        router_port: Optional Zenoh router port
+        topic: Dynamic transform topic
+        static_topic: Static transform topic (subscribed with TRANSIENT_LOCAL durability)
+        buffer: Transform tree
+        message_count: Number of TF messages received
+        is_running: Whether the plugin is subscribed
+    """
+
+    def __init__(
+        self,
+        container_name: str,
+        domain_id: int = 30,
+        router_ip: Optional[str] = None,
+        router_port: Optional[int] = None,
+        cache_time: float = DEFAULT_CACHE_TIME,
+        topic: str = "/tf",
+        static_topic: str = "/tf_static",
+    ):
+        """Initialize the TF buffer of a container.
+
+        Args:
+            container_name: Name of the container/robot
+            domain_id: ROS2 domain ID. Defaults to 30.
+            router_ip: Optional Zenoh router IP address.
+            router_port: Optional Zenoh router port.
+            cache_time: Seconds of transform history kept per dynamic frame.
+            topic: Dynamic transform topic. Defaults to "/tf".
+            static_topic: Static transform topic. Defaults to "/tf_static".
+        """
+        self.container_name = container_name
+        self.domain_id = domain_id
+        self.router_ip = router_ip
+        self.router_port = router_port
+        self.topic = topic
+        self.static_topic = static_topic
+        self.buffer = TransformBuffer(cache_time)
+        self.message_count = 0
+        self.is_running = False
+        self._session: Optional[ROS2DomainSession] = None
+        self._subscribers: list[ROS2SubscriptionHandle] = []
+
+    def start(self) -> None:
+        """Subscribe to the transform topics.
+
+        Raises:
+            Exception: If the session or a subscription cannot be created.
+        """
+        if self.is_running:
+            return
+        started_at = time.monotonic()
+        self._session = get_session_manager().acquire(self.domain_id, self.router_ip, self.router_port)
+        try:
+            registry = get_subscription_registry()
+            self._subscribers.append(registry.subscribe(
+                self._session, self.static_topic, TF_MESSAGE_TYPE, self._make_callback(static=True),
+                qos=QosProfile(durability=QosDurability.TRANSIENT_LOCAL, history_depth=1),
+            ))
+            self._subscribers.append(registry.subscribe(
+                self._session, self.topic, TF_MESSAGE_TYPE, self._make_callback(static=False),
+            ))
+        except Exception:
+            self._cleanup()
+            raise
+        self.is_running = True
+        logger.info(
+            f"[{self.container_name}] TF buffer subscribed to '{self.topic}' and '{self.static_topic}' "
+            f"in {(time.monotonic() - started_at) * 1000:.0f} ms"
+        )
+
+    def stop(self) -> None:
+        """Unsubscribe and drop all transforms."""
+        if not self.is_running:
+            return
+        self.is_running = False
+        self._cleanup()
+        self.buffer.clear()
+        logger.info(f"[{self.container_name}] TF buffer stopped")
+
+    def lookup(self, target: str, source: str, stamp: Optional[float] = None) -> tuple[float, Transform]:
+        """Look up the transform mapping source coordinates into target coordinates.
+
+        See TransformBuffer.lookup().
+        """
+        return self.buffer.lookup(_frame_id(target), _frame_id(source), stamp)
+
+    def _make_callback(self, static: bool):
+        """Build the ingest callback of a transform topic."""
+        buffer = self.buffer
+
+        def callback(msg: Any, payload_size: int) -> None:
+            self.message_count += 1
+            for transform in msg.transforms:
+                stamp = transform.header.stamp
+                translation = transform.transform.translation
+                rotation = transform.transform.rotation
+                buffer.set_transform(
+                    _frame_id(transform.header.frame_id),
+                    _frame_id(transform.child_frame_id),
+                    stamp.sec + stamp.nanosec * 1e-9,
+                    (translation.x, translation.y, translation.z, rotation.x, rotation.y, rotation.z, rotation.w),
+                    static,
+                )
+
+        return callback
+
+    def _cleanup(self) -> None:
+        """Close the subscriptions and release the session."""
+        subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            try:
+                subscriber.close()
+            except Exception as e:
+                logger.warning(f"[{self.container_name}] Error closing TF subscription '{subscriber.topic}': {e}")
+        if self._session is not None:
+            get_session_manager().release(self._session)
+            self._session = None
@@ -0,0 +1,126 @@
+"""Fixed-capacity per-topic message history.
+
+Each history buffer is a ring buffer of receive timestamps and cache entries
+for one topic. Memory stays bounded by the configured capacity no matter
+how long the stream runs, and time-window queries use binary search over
+the (monotonically appended) receive timestamps.
+"""
+
+import threading
+from typing import Any, Optional
+
+
+class TopicHistoryBuffer:
+    """Ring buffer of the most recent samples for a single topic.
+
+    Attributes:
+        capacity: Maximum number of samples kept
+        nbytes: Total size of the samples held, as reported by append()
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize an empty history buffer.
+
+        Args:
+            capacity: Maximum number of samples kept. Must be positive.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"History capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._timestamps: list[float] = [0.0] * capacity
+        self._items: list[Any] = [None] * capacity
+        self._sizes: list[int] = [0] * capacity
+        self.nbytes = 0
+        self._start = 0  # Physical index of the oldest sample
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, received_at: float, item: Any, nbytes: int = 0) -> None:
+        """Append a sample, overwriting the oldest one when full.
+
+        Args:
+            received_at: Receive timestamp of the sample.
+            item: Sample payload (typically a TopicCacheEntry).
+            nbytes: Size of the sample, added to nbytes while it is held.
+        """
+        with self._lock:
+            if self._size < self.capacity:
+                index = (self._start + self._size) % self.capacity
+                self._size += 1
+            else:
+                index = self._start
+                self._start = (self._start + 1) % self.capacity
+            self._timestamps[index] = received_at
+            self._items[index] = item
+            self.nbytes += nbytes - self._sizes[index]
+            self._sizes[index] = nbytes
+
+    def query(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> list[tuple[float, Any]]:
+        """Get samples received within a time window, oldest first.
+
+        Args:
+            since: Inclusive lower bound on receive time. None for no bound.
+            until: Inclusive upper bound on receive time. None for no bound.
+            limit: Maximum number of samples returned. When the window holds
+                more, the most recent ones are returned.
+
+        Returns:
+            List of (received_at, item) tuples in receive order.
+        """
+        with self._lock:
+            lo = 0 if since is None else self._bisect_left(since)
+            hi = self._size if until is None else self._bisect_right(until)
+            if limit is not None and hi - lo > limit:
+                lo = max(hi - limit, lo)
+
+            samples = []
+            for logical in range(lo, hi):
+                index = (self._start + logical) % self.capacity
+                samples.append((self._timestamps[index], self._items[index]))
+            return samples
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        with self._lock:
+            self._items = [None] * self.capacity
+            self._sizes = [0] * self.capacity
+            self.nbytes = 0
+            self._start = 0
+            self._size = 0
+
+    def _timestamp_at(self, logical: int) -> float:
+        """Get the timestamp of the sample at a logical (oldest-first) index."""
+        return self._timestamps[(self._start + logical) % self.capacity]
+
+    def _bisect_left(self, value: float) -> int:
+        """First logical index whose timestamp is >= value."""
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamp_at(mid) < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _bisect_right(self, value: float) -> int:
+        """First logical index whose timestamp is > value."""
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamp_at(mid) <= value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
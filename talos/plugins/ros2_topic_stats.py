@@ -0,0 +1,175 @@
+"""Per-topic ingest statistics.
+
+Statistics are updated from the subscriber callback with O(1) work per
+message:
+
+- message count and total payload bytes
+- counts of messages dropped by the topic's ingest policy
+- EWMA of the inter-arrival time (reported as rate) and of its deviation
+  (reported as jitter), plus EWMA payload size (reported as bandwidth)
+- min/max/p99 inter-arrival time over a sliding window, using a fixed
+  log-scale histogram that is rotated every STATS_WINDOW seconds
+"""
+
+import math
+from typing import Any, Optional
+
+STATS_WINDOW = 10.0  # seconds - window for min/max/p99 (covers the last 1-2 windows)
+EWMA_ALPHA = 0.1  # smoothing factor for rate, jitter and payload size
+
+# Inter-arrival histogram: log-scale bins from 10 us to 100 s
+_HIST_MIN = 1e-5  # seconds
+_HIST_BINS_PER_DECADE = 10
+_HIST_DECADES = 7
+_HIST_BINS = _HIST_BINS_PER_DECADE * _HIST_DECADES
+_HIST_LOG_MIN = math.log10(_HIST_MIN)
+
+
+def _bin_upper_edge(index: int) -> float:
+    """Upper edge (seconds) of an inter-arrival histogram bin."""
+    return 10 ** (_HIST_LOG_MIN + (index + 1) / _HIST_BINS_PER_DECADE)
+
+
+class TopicStats:
+    """Running ingest statistics for a single topic."""
+
+    __slots__ = (
+        "message_count",
+        "payload_bytes_total",
+        "dropped_rate_limited",
+        "dropped_no_consumers",
+        "last_received_at",
+        "_ewma_interval",
+        "_ewma_deviation",
+        "_ewma_payload",
+        "_window_start",
+        "_hist_current",
+        "_hist_previous",
+        "_min_current",
+        "_min_previous",
+        "_max_current",
+        "_max_previous",
+    )
+
+    def __init__(self):
+        self.message_count = 0
+        self.payload_bytes_total = 0
+        self.dropped_rate_limited = 0  # Incremented by the ingest callback
+        self.dropped_no_consumers = 0  # Incremented by the ingest callback
+        self.last_received_at: Optional[float] = None
+        self._ewma_interval: Optional[float] = None
+        self._ewma_deviation = 0.0
+        self._ewma_payload: Optional[float] = None
+        self._window_start: Optional[float] = None
+        self._hist_current = [0] * _HIST_BINS
+        self._hist_previous = [0] * _HIST_BINS
+        self._min_current = math.inf
+        self._min_previous = math.inf
+        self._max_current = 0.0
+        self._max_previous = 0.0
+
+    def record(self, received_at: float, payload_size: int) -> None:
+        """Record a received message.
+
+        Args:
+            received_at: Receive timestamp (time.time()).
+            payload_size: Serialized payload size in bytes (0 if unknown).
+        """
+        self.message_count += 1
+        self.payload_bytes_total += payload_size
+        if self._ewma_payload is None:
+            self._ewma_payload = float(payload_size)
+        else:
+            self._ewma_payload += EWMA_ALPHA * (payload_size - self._ewma_payload)
+
+        last = self.last_received_at
+        self.last_received_at = received_at
+        if last is None:
+            self._window_start = received_at
+            return
+
+        interval = max(received_at - last, 0.0)
+        if self._ewma_interval is None:
+            self._ewma_interval = interval
+        else:
+            deviation = interval - self._ewma_interval
+            self._ewma_interval += EWMA_ALPHA * deviation
+            self._ewma_deviation += EWMA_ALPHA * (abs(deviation) - self._ewma_deviation)
+
+        if received_at - self._window_start >= STATS_WINDOW:
+            self._rotate(received_at)
+
+        if interval > 0.0:
+            index = int((math.log10(interval) - _HIST_LOG_MIN) * _HIST_BINS_PER_DECADE)
+            index = min(max(index, 0), _HIST_BINS - 1)
+        else:
+            index = 0
+        self._hist_current[index] += 1
+        if interval < self._min_current:
+            self._min_current = interval
+        if interval > self._max_current:
+            self._max_current = interval
+
+    def snapshot(self, now: float) -> dict[str, Any]:
+        """Get the current statistics.
+
+        Args:
+            now: Current time (time.time()), used to decay the rate once
+                messages stop arriving.
+
+        Returns:
+            Dictionary with message_count, rate_hz, bandwidth_bps,
+            payload_bytes_total, avg_payload_bytes, the ingest drop counters
+            and the inter-arrival min/max/p99/jitter in milliseconds (None
+            until known).
+        """
+        rate_hz = None
+        bandwidth_bps = None
+        if self._ewma_interval is not None and self.last_received_at is not None:
+            # A silent topic's rate decays with the time since its last message
+            interval = max(self._ewma_interval, now - self.last_received_at)
+            if interval > 0.0:
+                rate_hz = 1.0 / interval
+                bandwidth_bps = self._ewma_payload * rate_hz
+
+        window_count = sum(self._hist_current) + sum(self._hist_previous)
+        min_interval = min(self._min_current, self._min_previous)
+        max_interval = max(self._max_current, self._max_previous)
+
+        return {
+            "message_count": self.message_count,
+            "rate_hz": rate_hz,
+            "bandwidth_bps": bandwidth_bps,
+            "payload_bytes_total": self.payload_bytes_total,
+            "avg_payload_bytes": self._ewma_payload,
+            "dropped_rate_limited": self.dropped_rate_limited,
+            "dropped_no_consumers": self.dropped_no_consumers,
+            "interval_min_ms": min_interval * 1000.0 if window_count else None,
+            "interval_max_ms": max_interval * 1000.0 if window_count else None,
+            "interval_p99_ms": self._percentile(0.99, window_count),
+            "jitter_ms": self._ewma_deviation * 1000.0 if self._ewma_interval is not None else None,
+        }
+
+    def _rotate(self, now: float) -> None:
+        """Start a new histogram window, keeping the previous one for queries."""
+        self._hist_previous = self._hist_current
+        self._hist_current = [0] * _HIST_BINS
+        self._min_previous = self._min_current
+        self._max_previous = self._max_current
+        self._min_current = math.inf
+        self._max_current = 0.0
+        self._window_start = now
+
+    def _percentile(self, fraction: float, total: int) -> Optional[float]:
+        """Approximate an inter-arrival percentile (ms) from the window histograms."""
+        if total == 0:
+            return None
+        threshold = fraction * total
+        cumulative = 0
+        for index in range(_HIST_BINS):
+            cumulative += self._hist_current[index] + self._hist_previous[index]
+            if cumulative >= threshold:
+                # Bin edges are coarse; never report beyond the observed maximum
+                upper = _bin_upper_edge(index)
+                return min(upper, max(self._max_current, self._max_previous)) * 1000.0
+        return None
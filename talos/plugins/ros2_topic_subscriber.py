@@ -1,23 +1,264 @@
 """ROS2 topic subscriber for a specific container.
 
 This subscriber manages multiple ROS2 topic subscriptions for a single container.
-Each topic is subscribed independently and cached for API access.
+Each topic is subscribed on a Zenoh session shared per router and domain
+and cached for API access.
 """
 
 import asyncio
+import functools
+import itertools
+import json
 import logging
 import threading
 import time
-from typing import Any, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterator, Optional
 
-from zenoh_ros2_sdk import ROS2Subscriber
 from zenoh_ros2_sdk.qos import QosProfile, QosDurability
 
+from talos.plugins.ros2_diagnostics import DIAGNOSTIC_ARRAY_TYPE, DiagnosticsIndex
+from talos.plugins.ros2_encoding import encode_json
+from talos.plugins.ros2_graph import ROS2GraphIndex
+from talos.plugins.ros2_image import (
+    IMAGE_TYPES,
+    ImageEncoding,
+    convert_image_message,
+    encode_image,
+    get_image_encoder,
+)
+from talos.plugins.ros2_ingest_policy import TopicIngestPolicy
+from talos.plugins.ros2_memory import evict_coldest, get_memory_budget
+from talos.plugins.ros2_message_converter import convert_message
+from talos.plugins.ros2_precision import FloatPrecision
+from talos.plugins.ros2_projection import FieldProjection
+from talos.plugins.ros2_scheduler import TimerHandle, get_scheduler
+from talos.plugins.ros2_session import ROS2DomainSession, get_session_manager
+from talos.plugins.ros2_snapshot import load_snapshot, save_snapshot, snapshot_path
+from talos.plugins.ros2_subscriber import ROS2SubscriptionHandle, get_subscription_registry
+from talos.plugins.ros2_topic_history import TopicHistoryBuffer
+from talos.plugins.ros2_topic_stats import TopicStats
+from talos.plugins.ros2_topic_timeseries import TopicTimeSeries
+
 logger = logging.getLogger(__name__)
 
 # Constants
 STATUS_CHECK_INTERVAL = 10  # seconds - reduced frequency for status checks
 DYNAMIC_TOPIC_STALE_TIME = 3.0  # seconds - time after which dynamic topic cache is considered stale and cleared
+LAZY_SUBSCRIBE_RETRY_DELAY = 5.0  # seconds - wait before retrying a failed on-demand subscription
+SUBSCRIBE_WORKERS = 8  # default number of subscribers created concurrently in start()
+SUBSCRIBE_TIMEOUT = 10.0  # seconds - default per-topic limit for creating a subscriber in start()
+WINDOW_FLUSH_INTERVAL = 0.25  # seconds - check for held keep="latest" messages whose input stopped
+VIEW_CACHE_SIZE = 8  # per-request views (projection/precision combinations) memoized per message
+
+
+class TopicCacheEntry:
+    """Latest received message for a topic.
+
+    Entries are created once per received message and never modified
+    afterwards, except for the memoized conversion result. The message is
+    converted to a dict and encoded to JSON the first time a reader asks for
+    it, and every reader of the same entry shares that result until a new
+    message replaces the entry. Conversion never runs under a lock; if two
+    readers race on a fresh entry both produce the same result. Per-request
+    views (projections, precisions) are memoized the same way, up to
+    VIEW_CACHE_SIZE per entry.
+
+    Attributes:
+        raw_message: ROS2 message object as delivered by the subscriber, or
+            its serialized CDR payload with lazy_deserialize
+        received_at: Receive timestamp (time.time())
+        seq: Per-topic sequence number of this message (starts at 1)
+        payload_size: Serialized payload size in bytes
+        from_snapshot: Whether the entry was loaded from an on-disk snapshot
+            (no raw message; the converted data is pre-built)
+    """
+
+    __slots__ = (
+        "raw_message", "received_at", "seq", "payload_size", "from_snapshot", "_data", "_data_json", "_views",
+    )
+
+    def __init__(self, raw_message: Any, received_at: float, seq: int, payload_size: int = 0):
+        self.raw_message = raw_message
+        self.received_at = received_at
+        self.seq = seq
+        self.payload_size = payload_size
+        self.from_snapshot = False
+        self._data: Any = None
+        self._data_json: Optional[bytes] = None
+        self._views: Optional[dict[Any, bytes]] = None
+
+    @classmethod
+    def from_snapshot_data(cls, data_json: bytes, received_at: float, seq: int) -> "TopicCacheEntry":
+        """Create an entry from snapshot JSON; conversion is already done."""
+        entry = cls(None, received_at, seq)
+        entry.from_snapshot = True
+        entry._data = json.loads(data_json)
+        entry._data_json = data_json
+        return entry
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the entry.
+
+        The payload size, plus the memoized JSON encoding and the decoded
+        dict once built (the dict is estimated at the size of its encoding),
+        plus the memoized views.
+        """
+        data_json = self._data_json
+        views = self._views
+        return (
+            self.payload_size
+            + (2 * len(data_json) if data_json is not None else 0)
+            + (sum(len(view) for view in views.values()) if views is not None else 0)
+        )
+
+    def peek_data(self) -> Any:
+        """Get the converted message dict if it was already built, else None."""
+        return self._data
+
+    def get_data(self, convert: Callable[[Any], Any]) -> Any:
+        """Get the converted message dict, building it on first use.
+
+        Args:
+            convert: Function converting the raw message to a JSON-serializable object.
+
+        Returns:
+            JSON-serializable representation of the message.
+        """
+        self._build(convert)
+        return self._data
+
+    def get_view(self, key: Any, build: Callable[[], bytes]) -> bytes:
+        """Get an encoded per-request view of the message, building it on first use.
+
+        Args:
+            key: Hashable identity of the view (projection and precision keys).
+            build: Function returning the encoded view.
+
+        Returns:
+            Encoded JSON bytes of the view.
+        """
+        views = self._views
+        view = views.get(key) if views is not None else None
+        if view is None:
+            view = build()
+            if views is None or len(views) < VIEW_CACHE_SIZE:
+                # Copy and replace, so nbytes can iterate the views without a lock
+                self._views = {**(views or {}), key: view}
+        return view
+
+    def convert_unshared(self, convert: Callable[[Any], Any]) -> tuple[Any, bytes]:
+        """Get the converted dict and its JSON encoding without memoizing them.
+
+        Reuses the memoized result if a reader already built it. History
+        queries use this, so converting past samples does not grow entries
+        whose memory is charged at their payload size.
+
+        Args:
+            convert: Function converting the raw message to a JSON-serializable object.
+
+        Returns:
+            Tuple of (data, data_json).
+        """
+        data_json = self._data_json
+        if data_json is not None:
+            return self._data, data_json
+        data = convert(self.raw_message)
+        return data, encode_json(data)
+
+    def get_data_json(self, convert: Callable[[Any], Any]) -> bytes:
+        """Get the message encoded as JSON bytes, building it on first use.
+
+        Args:
+            convert: Function converting the raw message to a JSON-serializable object.
+
+        Returns:
+            Encoded JSON bytes of the converted message.
+        """
+        self._build(convert)
+        return self._data_json
+
+    def _build(self, convert: Callable[[Any], Any]) -> None:
+        """Convert and encode the raw message once."""
+        if self._data_json is not None:
+            return
+        data = convert(self.raw_message)
+        self._data = data
+        # Published last: a non-None _data_json implies _data is set
+        self._data_json = encode_json(data)
+
+
+class TopicSlot:
+    """Cache slot holding the current entry of one topic.
+
+    Writers replace the entry with a single attribute store and readers load
+    it with a single attribute read, so neither needs a lock. The slot lock
+    only serializes writers with conditional clears (stale sweeps), so a
+    sweep never drops an entry that was swapped in after it was inspected.
+
+    The slot also numbers the topic's messages, drawing from a counter shared
+    by all slots of the plugin. Sequence numbers therefore keep increasing
+    across cache clears and when a topic is removed and added again, so a
+    changed number always means a different message (a topic's numbers are
+    increasing but not consecutive). last_read records when a client last read the topic,
+    which ingest policies use to detect topics nobody is consuming.
+
+    Dynamic slots have at most one expiry timer at a time. swap() reports
+    when a timer has to be armed (the first entry since the last expiry),
+    and expire() either clears the entry or tells the timer when to fire
+    again, so a steady stream of messages costs one timer per stale period
+    rather than one per message.
+    """
+
+    __slots__ = ("entry", "seqs", "last_read", "_expiry_armed", "_lock")
+
+    def __init__(self, seqs: Iterator[int]):
+        self.entry: Optional[TopicCacheEntry] = None
+        self.seqs = seqs
+        self.last_read = 0.0
+        self._expiry_armed = False
+        self._lock = threading.Lock()
+
+    def swap(self, entry: TopicCacheEntry) -> bool:
+        """Publish a new entry.
+
+        Returns:
+            True if no expiry timer is armed for the slot; the caller should
+            arm one (the slot counts it as armed from now on).
+        """
+        with self._lock:
+            self.entry = entry
+            arm = not self._expiry_armed
+            self._expiry_armed = True
+            return arm
+
+    def expire(self, cutoff: float) -> Optional[float]:
+        """Expiry timer callback: remove the entry if it was received before a cutoff.
+
+        Returns:
+            Receive time of the current entry if it is still fresh (the
+            timer must be re-armed for it), or None if the slot is empty now
+            (the timer is disarmed).
+        """
+        with self._lock:
+            entry = self.entry
+            if entry is not None and entry.received_at >= cutoff:
+                return entry.received_at
+            self.entry = None
+            self._expiry_armed = False
+            return None
+
+    def clear(self) -> bool:
+        """Remove the current entry.
+
+        Returns:
+            True if an entry was removed.
+        """
+        with self._lock:
+            cleared = self.entry is not None
+            self.entry = None
+            return cleared
 
 
 class ROS2TopicSubscriber:
@@ -32,12 +273,33 @@ class ROS2TopicSubscriber:
         domain_id: ROS2 domain ID
         router_ip: Optional Zenoh router IP address
         router_port: Optional Zenoh router port
-        subscribers: Dictionary of active ROS2Subscriber instances
-        msg_cache: Dictionary of cached latest messages per topic
-        lock: Thread lock for safe access to cached data
+        session: Shared Zenoh session of the router and domain (while running)
+        subscribers: Dictionary of active subscription handles (shared with other containers on the same domain)
+        slots: Dictionary of per-topic cache slots holding the latest message entry
+        history_size: Default history size for dynamic topics (also used for topics added at runtime;
+            image topics only keep history with an explicit history_sizes entry)
+        histories: Dictionary of per-topic history ring buffers (dynamic topics with history enabled)
+        timeseries: Dictionary of per-topic numeric column stores (dynamic topics with time series enabled)
+        topic_stats: Dictionary of per-topic ingest statistics
+        ingest_policies: Dictionary of per-topic ingest policies (dynamic topics with a policy configured)
+        precisions: Dictionary of per-topic float precision applied at conversion
+        diagnostics: Dictionary of per-topic diagnostic status indexes (dynamic DiagnosticArray topics)
+        lazy_subscribe: Whether dynamic topics are subscribed on first read and dropped when idle
+        idle_timeout: Seconds without reads after which a lazily subscribed topic is unsubscribed
+        graph: Live topic graph of the domain (None if discovery is disabled or failed to start)
+        subscribe_latencies: Seconds the last successful subscriber creation took, per topic
+        subscribe_errors: Error of the last failed (or timed-out) subscriber creation, per topic
+        memory_budget: Limit in bytes on the estimated size of cached data (None for no limit)
+        evicted_count: Number of topic evictions made to meet memory budgets
+        lazy_deserialize: Whether messages are cached as serialized payloads until first read
+        snapshot_dir: Directory of static topic snapshots (None if disabled)
+        seq_base: Value that sequence numbers start after
         is_running: Whether the plugin is currently running
+        encodes_images: Whether encode_topic_image() can serve frames of image topics
     """
 
+    encodes_images = True
+
     def __init__(
         self,
         container_name: str,
@@ -46,6 +308,21 @@ class ROS2TopicSubscriber:
         domain_id: int = 30,
         router_ip: Optional[str] = None,
         router_port: Optional[int] = None,
+        history_size: int = 0,
+        history_sizes: Optional[dict[str, int]] = None,
+        timeseries: Optional[dict[str, dict[str, Any]]] = None,
+        ingest: Optional[dict[str, dict[str, Any]]] = None,
+        lazy_subscribe: bool = False,
+        idle_timeout: float = 60.0,
+        discovery: bool = True,
+        subscribe_workers: int = SUBSCRIBE_WORKERS,
+        subscribe_timeout: float = SUBSCRIBE_TIMEOUT,
+        memory_budget_mb: Optional[float] = None,
+        lazy_deserialize: bool = False,
+        snapshot_dir: Optional[str] = None,
+        precision: Optional[dict[str, dict[str, Any]]] = None,
+        diagnostics_index: bool = True,
+        seq_base: int = 0,
     ):
         """Initialize ROS2 plugin for a container.
 
@@ -58,6 +335,50 @@ class ROS2TopicSubscriber:
             domain_id: ROS2 domain ID. Defaults to 30.
             router_ip: Optional Zenoh router IP address.
             router_port: Optional Zenoh router port.
+            history_size: Number of recent messages kept per dynamic topic for
+                history queries. 0 disables history. Defaults to 0.
+            history_sizes: Optional per-topic overrides of history_size. Image
+                topics, which keep each frame's raw payload, only keep
+                history when listed here.
+                Example: {"/joint_states": 2500}
+            timeseries: Optional mapping of dynamic topic names to time-series
+                options (fields, capacity, dtype) for numeric column storage.
+                Example: {"/joint_states": {"fields": ["position"], "capacity": 30000}}
+            ingest: Optional mapping of dynamic topic names to ingest policy
+                options (max_rate, keep, drop_without_consumers, consumer_timeout).
+                Example: {"/joint_states": {"max_rate": 50, "keep": "latest"}}
+            lazy_subscribe: Subscribe dynamic topics only when a client first
+                reads them, and unsubscribe them after idle_timeout seconds
+                without reads. Static topics are always subscribed. Defaults to False.
+            idle_timeout: Idle period (seconds) before a lazily subscribed
+                topic is unsubscribed. Checked every STATUS_CHECK_INTERVAL. Defaults to 60.
+            discovery: Watch the domain's ROS2 graph (topics, types, publishers)
+                through Zenoh liveliness tokens. Defaults to True.
+            subscribe_workers: Number of subscribers created concurrently by
+                start(). Defaults to SUBSCRIBE_WORKERS.
+            subscribe_timeout: Seconds start() waits for each topic's subscriber
+                before reporting it as failed. Defaults to SUBSCRIBE_TIMEOUT.
+            memory_budget_mb: Optional limit (MiB) on the estimated size of the
+                plugin's cached data; above it, dynamic topics are evicted
+                coldest first. None disables the limit.
+            lazy_deserialize: Cache serialized CDR payloads and deserialize a
+                message only when a reader first asks for it (the result is
+                cached with the entry). Topics with time series are still
+                deserialized on arrival. Defaults to False.
+            snapshot_dir: Directory for on-disk snapshots of static topics. The
+                last message of each static topic is saved there and loaded
+                at startup (marked from_snapshot until live data arrives).
+                None disables snapshots.
+            precision: Optional mapping of topic names to float precision
+                options (decimals, float32) applied when messages are converted.
+                Example: {"/joint_states": {"decimals": 4}}
+            diagnostics_index: Index the statuses of dynamic DiagnosticArray
+                topics (by hardware_id and name) as they arrive, for status,
+                level and change queries. Such topics are then always
+                deserialized on arrival. Defaults to True.
+            seq_base: Sequence numbers start after this value. A restarted
+                isolated ingest process passes the last number it published,
+                so numbers keep increasing across restarts. Defaults to 0.
         """
         self.container_name = container_name
         self.topics = topics  # Dynamic topics
@@ -66,11 +387,78 @@ class ROS2TopicSubscriber:
         self.router_ip = router_ip
         self.router_port = router_port
 
-        self.subscribers: dict[str, ROS2Subscriber] = {}
-        self.msg_cache: dict[str, Any] = {}
-        self.lock = threading.Lock()
+        self.session: Optional[ROS2DomainSession] = None
+        self.subscribers: dict[str, ROS2SubscriptionHandle] = {}
+        self.seq_base = seq_base
+        # One counter for all slots, so a re-added topic never repeats a number
+        self._seqs = itertools.count(seq_base + 1)
+        self.slots: dict[str, TopicSlot] = {
+            topic: TopicSlot(self._seqs) for topic in list(self.topics) + list(self.static_topics)
+        }
+        self.history_size = history_size
+        self.histories: dict[str, TopicHistoryBuffer] = {}
+        history_sizes = history_sizes or {}
+        for topic, msg_type in self.topics.items():
+            # Image frames are megabytes each: no history unless asked for per topic
+            size = history_sizes.get(topic, 0 if msg_type in IMAGE_TYPES else history_size)
+            if size > 0:
+                self.histories[topic] = TopicHistoryBuffer(size)
+        self.timeseries: dict[str, TopicTimeSeries] = {}
+        for topic, options in (timeseries or {}).items():
+            if topic not in self.topics:
+                logger.warning(
+                    f"[{container_name}] Ignoring time series for '{topic}': not a configured dynamic topic"
+                )
+                continue
+            self.timeseries[topic] = TopicTimeSeries(**options)
+        self.ingest_policies: dict[str, TopicIngestPolicy] = {}
+        for topic, options in (ingest or {}).items():
+            if topic not in self.topics:
+                logger.warning(
+                    f"[{container_name}] Ignoring ingest policy for '{topic}': not a configured dynamic topic"
+                )
+                continue
+            self.ingest_policies[topic] = TopicIngestPolicy(**options)
+        self.topic_stats: dict[str, TopicStats] = {
+            topic: TopicStats() for topic in self.list_topics()
+        }
+        self.lazy_subscribe = lazy_subscribe
+        self.idle_timeout = idle_timeout
+        self.discovery = discovery
+        self.graph: Optional[ROS2GraphIndex] = None
+        self.subscribe_workers = subscribe_workers
+        self.subscribe_timeout = subscribe_timeout
+        self.subscribe_latencies: dict[str, float] = {}
+        self.subscribe_errors: dict[str, str] = {}
+        self.memory_budget: Optional[int] = (
+            int(memory_budget_mb * 1024 * 1024) if memory_budget_mb is not None else None
+        )
+        self.evicted_count = 0
+        self._over_budget = False
+        self.lazy_deserialize = lazy_deserialize
+        self.snapshot_dir = snapshot_dir
+        self.precisions: dict[str, FloatPrecision] = {}
+        for topic, options in (precision or {}).items():
+            if topic not in self.slots:
+                logger.warning(f"[{container_name}] Ignoring precision for '{topic}': not a configured topic")
+                continue
+            self.precisions[topic] = FloatPrecision(**options)
+        self.diagnostics_index = diagnostics_index
+        self.diagnostics: dict[str, DiagnosticsIndex] = {
+            topic: DiagnosticsIndex()
+            for topic, msg_type in self.topics.items()
+            if diagnostics_index and msg_type == DIAGNOSTIC_ARRAY_TYPE
+        }
         self.is_running = False
-        self._status_thread: Optional[threading.Thread] = None
+        self._status_timer: Optional[TimerHandle] = None
+        self._window_timer: Optional[TimerHandle] = None
+        self._status_check_count = 0
+        self._stale_cleared = 0  # Stale entries cleared since the last status check (timing wheel thread only)
+        # Guards subscribers and runtime topic changes; topic dicts are replaced, never mutated,
+        # so lock-free readers and iterations always see a consistent snapshot
+        self._subscribe_lock = threading.Lock()
+        self._pending_subscriptions: set[str] = set()
+        self._subscribe_failed_at: dict[str, float] = {}
 
         logger.info(
             f"[{container_name}] Initializing ROS2 plugin: "
@@ -84,6 +472,10 @@ class ROS2TopicSubscriber:
     def start(self) -> None:
         """Start subscribing to all configured topics (dynamic + static).
 
+        Subscribers are created concurrently (up to subscribe_workers at a
+        time), each within subscribe_timeout. With lazy_subscribe, only static
+        topics are subscribed here; dynamic topics are subscribed when first read.
+
         Raises:
             RuntimeError: If plugin fails to start or no subscribers are created.
         """
@@ -97,57 +489,44 @@ class ROS2TopicSubscriber:
             logger.info(
                 f"[{self.container_name}] Starting ROS2 plugin: domain_id={self.domain_id}"
             )
+            # All topics share one session and node per (router, domain), also across plugins
+            self.session = get_session_manager().acquire(self.domain_id, self.router_ip, self.router_port)
 
-            failed_topics = []
-            # Subscribe to dynamic topics
-            for topic, msg_type in self.topics.items():
-                try:
-                    self._create_subscriber(topic, msg_type)
-                except Exception as e:
-                    logger.error(
-                        f"[{self.container_name}] Failed to subscribe to dynamic topic '{topic}': {e}"
-                    )
-                    failed_topics.append(topic)
-                    # Continue with other topics even if one fails
-
-            # Subscribe to static topics
-            for topic, msg_type in self.static_topics.items():
-                try:
-                    self._create_subscriber(topic, msg_type)
-                except Exception as e:
-                    logger.error(
-                        f"[{self.container_name}] Failed to subscribe to static topic '{topic}': {e}"
-                    )
-                    failed_topics.append(topic)
-                    # Continue with other topics even if one fails
+            # Serve static topics from their snapshots until the live samples arrive
+            for topic in self.static_topics:
+                self._load_snapshot(topic)
 
+            # Subscribe to dynamic topics (on demand in lazy mode) and static topics concurrently
+            eager_topics = {} if self.lazy_subscribe else self.topics
+            failed_topics = self._subscribe_concurrently({**eager_topics, **self.static_topics})
             if failed_topics:
                 logger.warning(
                     f"[{self.container_name}] Failed to subscribe to {len(failed_topics)} topic(s): {failed_topics}"
                 )
 
-            # Only require at least one subscriber if there are any topics configured
+            # Only require at least one subscriber if there are any topics to subscribe now
             total_topics = len(self.topics) + len(self.static_topics)
-            if not self.subscribers and total_topics > 0:
+            if not self.subscribers and len(eager_topics) + len(self.static_topics) > 0:
                 raise RuntimeError(
                     f"Failed to create any subscribers for container '{self.container_name}'"
                 )
 
             self.is_running = True
+            if self.discovery:
+                self._start_graph()
             logger.info(
                 f"[{self.container_name}] Plugin started: "
                 f"{len(self.subscribers)}/{total_topics} topics active "
                 f"({len(self.topics)} dynamic, {len(self.static_topics)} static)"
+                + (", dynamic topics subscribed on demand" if self.lazy_subscribe else "")
             )
 
-            # Start periodic status check thread
-            self._status_thread = threading.Thread(
-                target=self._periodic_status_check,
-                daemon=True,
-                name=f"{self.container_name}-status-check"
-            )
-            self._status_thread.start()
-            logger.debug(f"[{self.container_name}] Started periodic status check thread")
+            # Periodic status checks run on the process-wide timing wheel
+            self._status_check_count = 0
+            self._status_timer = get_scheduler().call_every(STATUS_CHECK_INTERVAL, self._status_check)
+            if any(policy.keep_latest and policy.period is not None for policy in self.ingest_policies.values()):
+                self._window_timer = get_scheduler().call_every(WINDOW_FLUSH_INTERVAL, self._flush_ingest_windows)
+            get_memory_budget().register(self)
 
         except Exception as e:
             logger.error(
@@ -156,6 +535,7 @@ class ROS2TopicSubscriber:
             )
             self.is_running = False
             self._cleanup_subscribers()
+            self._release_session()
             raise
 
     def stop(self) -> None:
@@ -168,18 +548,30 @@ class ROS2TopicSubscriber:
         try:
             self.is_running = False
 
-            # Wait for status thread to finish (with timeout)
-            if self._status_thread and self._status_thread.is_alive():
-                self._status_thread.join(timeout=2.0)
-                if self._status_thread.is_alive():
-                    logger.warning(
-                        f"[{self.container_name}] Status check thread did not stop in time"
-                    )
+            if self._status_timer is not None:
+                self._status_timer.cancel()
+                self._status_timer = None
+            if self._window_timer is not None:
+                self._window_timer.cancel()
+                self._window_timer = None
+            get_memory_budget().unregister(self)
 
             self._cleanup_subscribers()
-
-            with self.lock:
-                self.msg_cache.clear()
+            if self.graph is not None:
+                self.graph.close()
+                self.graph = None
+            self._release_session()
+
+            for slot in self.slots.values():
+                slot.clear()
+            for history in self.histories.values():
+                history.clear()
+            for series in self.timeseries.values():
+                series.clear()
+            for index in self.diagnostics.values():
+                index.clear()
+            for policy in self.ingest_policies.values():
+                policy.reset()
 
             logger.info(f"[{self.container_name}] Plugin stopped")
 
@@ -189,6 +581,114 @@ class ROS2TopicSubscriber:
                 exc_info=True
             )
 
+    # ============================================================================
+    # Public Runtime Subscription Methods
+    # ============================================================================
+
+    def add_topic(self, topic: str, msg_type: Optional[str] = None, static: bool = False) -> bool:
+        """Add a topic to a running plugin and subscribe to it.
+
+        Other subscriptions and cached data are not affected. Runtime topics
+        are not written back to config.yml. New dynamic topics use the
+        plugin-wide history_size, except image topics, which keep no history.
+
+        Args:
+            topic: Topic name.
+            msg_type: Message type string, or None to take it from the topic graph
+                (see resolve_msg_type()).
+            static: Subscribe with TRANSIENT_LOCAL durability and never treat
+                the data as stale (like static_topics in the configuration).
+
+        Returns:
+            True if the topic is subscribed now, False if the subscription is
+            deferred (plugin not running, or dynamic topic in lazy mode).
+
+        Raises:
+            ValueError: If the topic is already configured.
+            LookupError: If msg_type is None and cannot be resolved.
+            Exception: If subscriber creation fails (the topic is not added).
+        """
+        if msg_type is None:
+            msg_type = self.resolve_msg_type(topic)
+        with self._subscribe_lock:
+            if topic in self.topics or topic in self.static_topics:
+                raise ValueError(f"Topic '{topic}' is already configured")
+            self.slots = {**self.slots, topic: TopicSlot(self._seqs)}
+            self.topic_stats = {**self.topic_stats, topic: TopicStats()}
+            if static:
+                self.static_topics = {**self.static_topics, topic: msg_type}
+            else:
+                if self.history_size > 0 and msg_type not in IMAGE_TYPES:
+                    self.histories = {**self.histories, topic: TopicHistoryBuffer(self.history_size)}
+                if self.diagnostics_index and msg_type == DIAGNOSTIC_ARRAY_TYPE:
+                    self.diagnostics = {**self.diagnostics, topic: DiagnosticsIndex()}
+                self.topics = {**self.topics, topic: msg_type}
+
+        logger.info(
+            f"[{self.container_name}] Added {'static' if static else 'dynamic'} topic '{topic}' "
+            f"(type: {msg_type})"
+        )
+        if static:
+            self._load_snapshot(topic)
+        if not self.is_running or (self.lazy_subscribe and not static):
+            return False
+
+        try:
+            self._create_subscriber(topic, msg_type)
+        except Exception as e:
+            logger.error(
+                f"[{self.container_name}] Failed to subscribe to added topic '{topic}': {e}"
+            )
+            with self._subscribe_lock:
+                self._forget_topic(topic)
+            raise
+        return True
+
+    def resolve_msg_type(self, topic: str) -> str:
+        """Get the message type of a topic from the live topic graph.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            The single message type the topic's endpoints announce.
+
+        Raises:
+            LookupError: If discovery is disabled, nobody announces the topic,
+                or its endpoints disagree on the type.
+        """
+        graph = self.graph
+        if graph is None:
+            raise LookupError(f"Cannot resolve the type of '{topic}': graph discovery is not running")
+        entry = graph.get_topic(topic)
+        if entry is None:
+            raise LookupError(f"Topic '{topic}' is not announced by any publisher or subscriber")
+        types = entry["types"]
+        if len(types) != 1:
+            raise LookupError(f"Topic '{topic}' is announced with several types: {', '.join(types)}")
+        return types[0]
+
+    def remove_topic(self, topic: str) -> None:
+        """Unsubscribe a topic and remove it with its cached data.
+
+        Other subscriptions and cached data are not affected.
+
+        Args:
+            topic: Topic name.
+
+        Raises:
+            KeyError: If the topic is not configured.
+        """
+        with self._subscribe_lock:
+            if topic not in self.topics and topic not in self.static_topics:
+                raise KeyError(f"Topic '{topic}' is not configured")
+            subscriber = self.subscribers.pop(topic, None)
+            self._forget_topic(topic)
+
+        if subscriber is not None:
+            self._close_subscriber(topic, subscriber)
+        logger.info(f"[{self.container_name}] Removed topic '{topic}'")
+
     # ============================================================================
     # Public API Methods
     # ============================================================================
@@ -196,48 +696,322 @@ class ROS2TopicSubscriber:
     def get_topic_data(self, topic: str) -> Optional[dict[str, Any]]:
         """Get the latest cached data for a specific topic.
 
-        For dynamic topics, checks if the data is stale and clears it if so.
-        Static topics are never considered stale.
+        For dynamic topics, data older than DYNAMIC_TOPIC_STALE_TIME is treated
+        as missing. Static topics are never considered stale. Reads take no
+        lock and never modify the cache.
+
+        The message is converted and JSON-encoded once per received message;
+        subsequent calls return the shared result until a new message arrives.
 
         Args:
             topic: Topic name.
 
         Returns:
-            Cached data dictionary with 'data' and 'received_at' keys,
-            or None if no message has been received yet or if data is stale.
-        """
-        with self.lock:
-            cached = self.msg_cache.get(topic)
-            if cached is None:
-                return None
-
-            # Check if topic is stale (only for dynamic topics)
-            is_dynamic_topic = topic in self.topics
-            if is_dynamic_topic:
-                received_at = cached.get("received_at")
-                if received_at is not None:
-                    current_time = time.time()
-                    age = current_time - received_at
-                    if age > DYNAMIC_TOPIC_STALE_TIME:
-                        # Data is stale, clear it
-                        del self.msg_cache[topic]
-                        logger.debug(
-                            f"[{self.container_name}] Cleared stale cache for dynamic topic '{topic}' "
-                            f"(age: {age:.1f}s > {DYNAMIC_TOPIC_STALE_TIME}s)"
-                        )
-                        return None
-
-            # Convert raw_message to dict for JSON serialization
-            raw_message = cached.get("raw_message")
-            if raw_message is not None:
-                # Convert entire message to dict (no extraction, send as-is)
-                data = self._convert_message_to_dict(raw_message)
-                return {
-                    "data": data,
-                    "received_at": cached.get("received_at"),
-                }
+            Cached data dictionary with 'data', 'data_json', 'received_at',
+            'seq' and 'from_snapshot' keys, or None if no message has been
+            received yet or if data is stale.
+        """
+        now = time.time()
+        self._mark_read(topic, now)
+        cached = self._get_fresh_entry(topic, now)
+        if cached is None:
+            return None
+
+        # The entry builds its result only once, shared by all readers
+        if cached.raw_message is None and not cached.from_snapshot:
+            return None
+        convert = self.get_topic_converter(topic)
+        try:
+            return {
+                "data": cached.get_data(convert),
+                "data_json": cached.get_data_json(convert),
+                "received_at": cached.received_at,
+                "seq": cached.seq,
+                "from_snapshot": cached.from_snapshot,
+            }
+        except Exception as e:
+            # Only raw payloads (lazy_deserialize) are decoded here; in-process messages are already objects
+            logger.warning(f"[{self.container_name}] Failed to decode cached message of '{topic}': {e}")
+            return None
+
+    def get_topic_view(
+        self,
+        topic: str,
+        projection: Optional[FieldProjection] = None,
+        precision: Optional[FloatPrecision] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Get a per-request view of a topic's latest cached message.
+
+        With a projection, the fields are taken from the message itself, so
+        only they are converted (the shared full conversion is reused if a
+        reader already built it). The request precision is applied on top of
+        the topic's configured one. The encoded view is memoized on the
+        entry, so repeated requests for the same message, projection and
+        precision share it. Without projection and precision this is
+        get_topic_data().
+
+        Args:
+            topic: Topic name.
+            projection: Compiled field projection, or None for the whole message.
+            precision: Float precision of this request, or None.
+
+        Returns:
+            Dictionary with 'data_json' (the encoded view), 'received_at',
+            'seq' and 'from_snapshot' keys, or None if no fresh data is available.
+        """
+        if projection is None and precision is None:
+            return self.get_topic_data(topic)
+        now = time.time()
+        self._mark_read(topic, now)
+        cached = self._get_fresh_entry(topic, now)
+        if cached is None:
+            return None
+        if cached.raw_message is None and not cached.from_snapshot:
+            return None
+
+        def build() -> bytes:
+            if projection is None:
+                data = cached.get_data(self.get_topic_converter(topic))
+            else:
+                source = cached.peek_data()
+                if source is None and self.get_msg_type(topic) in IMAGE_TYPES:
+                    # Projections of image topics see the metadata, as full reads do
+                    source = cached.get_data(self.get_topic_converter(topic))
+                if source is None:
+                    source = cached.raw_message
+                    if self._keeps_raw_payload(topic):
+                        source = self._deserialize_payload(topic, source)
+                data = projection.apply(source)
+                topic_precision = self.precisions.get(topic)
+                if topic_precision is not None:
+                    data = topic_precision.apply(data)
+            if precision is not None:
+                data = precision.apply(data)
+            return encode_json(data)
+
+        key = (
+            projection.key if projection is not None else None,
+            precision.key if precision is not None else None,
+        )
+        try:
+            data_json = cached.get_view(key, build)
+        except Exception as e:
+            logger.warning(f"[{self.container_name}] Failed to build view of cached message of '{topic}': {e}")
+            return None
+        return {
+            "data_json": data_json,
+            "received_at": cached.received_at,
+            "seq": cached.seq,
+            "from_snapshot": cached.from_snapshot,
+        }
+
+    def get_topic_seq(self, topic: str) -> Optional[int]:
+        """Get the sequence number of a topic's latest cached message.
+
+        This is a cheap change check: it does not convert the message, so
+        pollers can compare it with the last number they sent and only call
+        get_topic_data() when it differs.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            Sequence number, or None if no message is available or data is stale.
+        """
+        now = time.time()
+        self._mark_read(topic, now)
+        cached = self._get_fresh_entry(topic, now)
+        return None if cached is None else cached.seq
+
+    def get_latest_entry(self, topic: str) -> Optional[TopicCacheEntry]:
+        """Get the latest fresh cache entry of a topic without counting it as a client read.
+
+        Isolated ingest uses this to forward entries to the API process.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            The current entry, or None if no message is available or data is stale.
+        """
+        return self._get_fresh_entry(topic, time.time())
+
+    def get_topic_converter(self, topic: str) -> Callable[[Any], Any]:
+        """Get the function turning a topic's cached raw_message into its JSON-serializable form.
+
+        With lazy_deserialize, cached messages of topics without time series
+        are serialized CDR payloads, and the converter deserializes them first
+        (image topics are always cached that way). Image messages are
+        converted without their pixel data. The topic's configured float
+        precision is applied to the result.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            Converter taking a TopicCacheEntry.raw_message.
+        """
+        msg_type = self.get_msg_type(topic)
+        if msg_type in IMAGE_TYPES:
+            convert = convert_image_message
+        else:
+            convert = functools.partial(convert_message, msg_type=msg_type)
+        precision = self.precisions.get(topic)
+        if precision is not None:
+            convert_full = convert
+
+            def convert(msg: Any) -> Any:
+                return precision.apply(convert_full(msg))
+
+        if not self._keeps_raw_payload(topic):
+            return convert
+
+        def deserialize_and_convert(cdr_bytes: bytes) -> Any:
+            return convert(self._deserialize_payload(topic, cdr_bytes))
+
+        return deserialize_and_convert
+
+    def encode_topic_image(self, topic: str, encoding: ImageEncoding) -> Optional[Future]:
+        """Encode the latest image of an image topic on the image worker pool.
+
+        The frame is deserialized and encoded on a worker thread. Clients
+        asking for the same frame in the same encoding share one encode.
+
+        Args:
+            topic: Topic name (sensor_msgs/msg/Image or CompressedImage).
+            encoding: Requested format, quality and maximum size.
+
+        Returns:
+            Future resolving to a dictionary with 'image' (encoded bytes),
+            'media_type', 'width', 'height', 'received_at' and 'seq' keys, or
+            None if the topic is not an image topic or has no fresh message.
+            The future raises ValueError if the frame cannot be decoded.
+        """
+        msg_type = self.get_msg_type(topic)
+        if msg_type not in IMAGE_TYPES:
+            return None
+        now = time.time()
+        self._mark_read(topic, now)
+        cached = self._get_fresh_entry(topic, now)
+        if cached is None or cached.raw_message is None:
             return None
 
+        def encode() -> dict[str, Any]:
+            msg = cached.raw_message
+            if self._keeps_raw_payload(topic):
+                msg = self._deserialize_payload(topic, msg)
+            image, width, height = encode_image(msg, msg_type, encoding)
+            return {
+                "image": image,
+                "media_type": encoding.media_type,
+                "width": width,
+                "height": height,
+                "received_at": cached.received_at,
+                "seq": cached.seq,
+            }
+
+        return get_image_encoder().submit((self.container_name, topic, encoding.key), cached.seq, encode)
+
+    def _deserialize_payload(self, topic: str, cdr_bytes: bytes) -> Any:
+        """Deserialize a cached CDR payload of a topic (lazy_deserialize).
+
+        Raises:
+            RuntimeError: If the plugin is not running.
+            Exception: If the payload cannot be deserialized.
+        """
+        session = self.session
+        if session is None:
+            raise RuntimeError("Plugin has no Zenoh session (not running)")
+        return session.deserialize(cdr_bytes, self.get_msg_type(topic))
+
+    def record_read(self, topic: str, read_at: float) -> None:
+        """Record a client read made outside this plugin (the API process, with isolated ingest).
+
+        Args:
+            topic: Topic name.
+            read_at: Time of the read (time.time()).
+        """
+        self._mark_read(topic, read_at)
+
+    def get_topic_history(
+        self,
+        topic: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[list[dict[str, Any]]]:
+        """Get buffered messages of a topic received within a time window.
+
+        History is kept regardless of staleness, so recent samples remain
+        queryable after the publisher stops.
+
+        Args:
+            topic: Topic name.
+            since: Inclusive lower bound on receive time (time.time() seconds).
+            until: Inclusive upper bound on receive time (time.time() seconds).
+            limit: Maximum number of samples; the most recent are returned.
+
+        History samples are charged at their payload size, so their
+        conversions are not memoized (except for the topic's current entry,
+        whose memoized result is charged to the cache slot).
+
+        Returns:
+            List of sample dictionaries (oldest first) with the same keys as
+            get_topic_data(), or None if history is not enabled for the topic.
+        """
+        history = self.histories.get(topic)
+        if history is None:
+            return None
+        self._mark_read(topic, time.time())
+
+        convert = self.get_topic_converter(topic)
+        slot = self.slots.get(topic)
+        current = slot.entry if slot is not None else None
+        samples = []
+        for received_at, entry in history.query(since, until, limit):
+            try:
+                if entry is current:
+                    data, data_json = entry.get_data(convert), entry.get_data_json(convert)
+                else:
+                    data, data_json = entry.convert_unshared(convert)
+                samples.append({
+                    "data": data,
+                    "data_json": data_json,
+                    "received_at": received_at,
+                    "seq": entry.seq,
+                })
+            except Exception as e:
+                logger.warning(f"[{self.container_name}] Skipping undecodable history sample of '{topic}': {e}")
+        return samples
+
+    def get_topic_diagnostics(self, topic: str) -> Optional[DiagnosticsIndex]:
+        """Get the diagnostic status index of a topic.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            DiagnosticsIndex, or None if the topic is not an indexed DiagnosticArray topic.
+        """
+        index = self.diagnostics.get(topic)
+        if index is not None:
+            self._mark_read(topic, time.time())
+        return index
+
+    def get_topic_timeseries(self, topic: str) -> Optional[TopicTimeSeries]:
+        """Get the numeric time-series store of a topic.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            TopicTimeSeries, or None if time series is not enabled for the topic.
+        """
+        series = self.timeseries.get(topic)
+        if series is not None:
+            self._mark_read(topic, time.time())
+        return series
+
     def list_topics(self) -> list[str]:
         """Get list of configured topics (both dynamic and static).
 
@@ -247,6 +1021,19 @@ class ROS2TopicSubscriber:
         all_topics = list(self.topics.keys()) + list(self.static_topics.keys())
         return all_topics
 
+    def get_msg_type(self, topic: str) -> Optional[str]:
+        """Get the configured message type for a topic (dynamic or static).
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            Message type string, or None if the topic is not configured.
+        """
+        if topic in self.topics:
+            return self.topics[topic]
+        return self.static_topics.get(topic)
+
     def is_topic_available(self, topic: str) -> bool:
         """Check if a topic is configured and has cached data.
 
@@ -258,31 +1045,7 @@ class ROS2TopicSubscriber:
         Returns:
             True if topic is configured and has non-stale cached data, False otherwise.
         """
-        with self.lock:
-            # Check if topic is configured (dynamic or static)
-            if topic not in self.topics and topic not in self.static_topics:
-                return False
-
-            if topic not in self.msg_cache:
-                return False
-
-            cached = self.msg_cache.get(topic)
-            if cached is None:
-                return False
-
-            # Check if dynamic topic is stale
-            is_dynamic_topic = topic in self.topics
-            if is_dynamic_topic:
-                received_at = cached.get("received_at")
-                if received_at is not None:
-                    current_time = time.time()
-                    age = current_time - received_at
-                    if age > DYNAMIC_TOPIC_STALE_TIME:
-                        # Data is stale, clear it
-                        del self.msg_cache[topic]
-                        return False
-
-            return True
+        return self._get_fresh_entry(topic, time.time()) is not None
 
     def clear_topic_cache(self, topic: str) -> None:
         """Clear cached data for a specific topic.
@@ -290,22 +1053,19 @@ class ROS2TopicSubscriber:
         Args:
             topic: Topic name to clear from cache.
         """
-        with self.lock:
-            if topic in self.msg_cache:
-                del self.msg_cache[topic]
-                logger.info(
-                    f"[{self.container_name}] Cleared cache for topic '{topic}'"
-                )
+        slot = self.slots.get(topic)
+        if slot is not None and slot.clear():
+            logger.info(
+                f"[{self.container_name}] Cleared cache for topic '{topic}'"
+            )
 
     def clear_all_cache(self) -> None:
         """Clear all cached topic data."""
-        with self.lock:
-            cleared_count = len(self.msg_cache)
-            self.msg_cache.clear()
-            if cleared_count > 0:
-                logger.info(
-                    f"[{self.container_name}] Cleared cache for {cleared_count} topic(s)"
-                )
+        cleared_count = sum(1 for slot in self.slots.values() if slot.clear())
+        if cleared_count > 0:
+            logger.info(
+                f"[{self.container_name}] Cleared cache for {cleared_count} topic(s)"
+            )
 
     def get_all_topics_status(self) -> dict[str, dict[str, Any]]:
         """Get status for all configured topics (both dynamic and static).
@@ -319,150 +1079,515 @@ class ROS2TopicSubscriber:
             - subscribed: bool - whether subscriber is active
             - received_at: float - timestamp of last message (if available)
             - seconds_since_last_message: float - seconds since last message (if available)
+            - stats: dict - ingest statistics (rate, jitter, bandwidth, message count)
+            - subscribe_latency_ms: float - duration of the last subscriber creation (if any)
+            - subscribe_error: str - error of the last failed subscriber creation (if any)
+            - cached_bytes: int - estimated size of the topic's cached data and history
+            - from_snapshot: bool - whether the cached data was loaded from a snapshot
+            - shared_by: int - containers receiving the topic through the same subscription (0 if not subscribed)
         """
         current_time = time.time()
-        with self.lock:
-            status = {}
-            # Process dynamic topics
-            for topic in self.topics.keys():
-                cached = self.msg_cache.get(topic)
-                available = False
-                received_at = None
-                seconds_since_last_message = None
-
-                if cached is not None:
-                    received_at = cached.get("received_at")
-                    if received_at is not None and received_at > 0:
-                        seconds_since_received = current_time - received_at
-                        # Check if data is stale
-                        if seconds_since_received <= DYNAMIC_TOPIC_STALE_TIME:
-                            available = True
-                            seconds_since_last_message = seconds_since_received
-                        else:
-                            # Data is stale, clear it
-                            del self.msg_cache[topic]
-                            available = False
-                    else:
-                        # Old cache entry without timestamp (backward compatibility)
-                        available = True
-
-                status[topic] = {
-                    "configured": True,
-                    "available": available,
-                    "msg_type": self.topics[topic],
-                    "subscribed": topic in self.subscribers,
-                    "received_at": received_at,
-                    "seconds_since_last_message": seconds_since_last_message,
-                }
-
-            # Process static topics
-            for topic in self.static_topics.keys():
-                cached = self.msg_cache.get(topic)
-                available = False
-                received_at = None
-                seconds_since_last_message = None
-
-                if cached is not None:
-                    received_at = cached.get("received_at")
-                    if received_at is not None and received_at > 0:
-                        seconds_since_received = current_time - received_at
-                        available = True
-                        seconds_since_last_message = seconds_since_received
-                    else:
-                        # Old cache entry without timestamp (backward compatibility)
-                        available = True
-
-                status[topic] = {
-                    "configured": True,
-                    "available": available,
-                    "msg_type": self.static_topics[topic],
-                    "subscribed": topic in self.subscribers,
-                    "received_at": received_at,
-                    "seconds_since_last_message": seconds_since_last_message,
-                }
-            return status
+        status = {}
+        for topic in self.list_topics():
+            cached = self._get_fresh_entry(topic, current_time)
+            stats = self.topic_stats.get(topic)
+            latency = self.subscribe_latencies.get(topic)
+            received_at = None
+            seconds_since_last_message = None
+            if cached is not None:
+                received_at = cached.received_at
+                seconds_since_last_message = current_time - received_at
+
+            subscriber = self.subscribers.get(topic)
+            status[topic] = {
+                "configured": True,
+                "available": cached is not None,
+                "msg_type": self.get_msg_type(topic),
+                "subscribed": subscriber is not None,
+                "received_at": received_at,
+                "seconds_since_last_message": seconds_since_last_message,
+                "stats": stats.snapshot(current_time) if stats is not None else None,
+                "subscribe_latency_ms": latency * 1000 if latency is not None else None,
+                "subscribe_error": self.subscribe_errors.get(topic),
+                "cached_bytes": self.get_topic_memory_used(topic),
+                "from_snapshot": cached is not None and cached.from_snapshot,
+                "shared_by": subscriber.shared_count if subscriber is not None else 0,
+            }
+        return status
+
+    # ============================================================================
+    # Public Memory Budget Methods
+    # ============================================================================
+
+    def get_topic_memory_used(self, topic: str) -> int:
+        """Get the estimated size of a topic's cached entry and history in bytes."""
+        slot = self.slots.get(topic)
+        entry = slot.entry if slot is not None else None
+        history = self.histories.get(topic)
+        return (entry.nbytes if entry is not None else 0) + (history.nbytes if history is not None else 0)
+
+    def get_memory_used(self) -> int:
+        """Get the estimated size of all cached topic data in bytes."""
+        return sum(self.get_topic_memory_used(topic) for topic in self.slots)
+
+    def get_eviction_candidates(self) -> list[tuple[float, int, str]]:
+        """Get the dynamic topics holding cached data, for budget enforcement.
+
+        Returns:
+            List of (last_read, nbytes, topic). Static topics are never included.
+        """
+        candidates = []
+        for topic in self.topics:
+            nbytes = self.get_topic_memory_used(topic)
+            slot = self.slots.get(topic)
+            if nbytes > 0 and slot is not None:
+                candidates.append((slot.last_read, nbytes, topic))
+        return candidates
+
+    def evict_topic(self, topic: str) -> int:
+        """Drop the cached entry and history of a dynamic topic.
+
+        The subscription stays active, so the cache refills with the next message.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            Estimated number of bytes freed (0 for static or unknown topics).
+        """
+        if topic not in self.topics:
+            return 0
+        nbytes = self.get_topic_memory_used(topic)
+        slot = self.slots.get(topic)
+        if slot is not None:
+            slot.clear()
+        history = self.histories.get(topic)
+        if history is not None:
+            history.clear()
+        policy = self.ingest_policies.get(topic)
+        if policy is not None:
+            policy.reset()
+        self.evicted_count += 1
+        return nbytes
+
+    def enforce_memory_budget(self) -> None:
+        """Evict dynamic topics, coldest first, until the plugin fits its memory budget."""
+        if self.memory_budget is None:
+            return
+        excess = self.get_memory_used() - self.memory_budget
+        if excess > 0:
+            excess -= evict_coldest([self], excess)
+        over_budget = excess > 0
+        if over_budget and not self._over_budget:
+            logger.warning(
+                f"[{self.container_name}] Cached data exceeds the memory budget of {self.memory_budget} bytes "
+                f"by {excess} bytes after evicting all dynamic topics (static topics are kept)"
+            )
+        self._over_budget = over_budget
 
     # ============================================================================
     # Private Helper Methods
     # ============================================================================
 
-    def _convert_message_to_dict(self, msg: Any) -> Any:
-        """Convert ROS2 message object to dictionary for JSON serialization.
+    def _get_fresh_entry(self, topic: str, now: float) -> Optional[TopicCacheEntry]:
+        """Get the current cache entry of a topic unless it is stale.
 
-        Converts the entire message including all fields (data, header, etc.)
-        to preserve all information like timestamps.
+        Dynamic topic entries older than DYNAMIC_TOPIC_STALE_TIME are treated
+        as missing; removing them is left to the expiry timers.
 
         Args:
-            msg: ROS2 message object.
+            topic: Topic name.
+            now: Current time (time.time()).
 
         Returns:
-            Dictionary representation of the entire message.
+            The current entry, or None if the topic is unknown, has no data or is stale.
         """
-        if msg is None:
+        slot = self.slots.get(topic)
+        if slot is None:
+            return None
+        entry = slot.entry
+        if entry is None:
+            return None
+        if topic in self.topics and now - entry.received_at > DYNAMIC_TOPIC_STALE_TIME:
             return None
+        return entry
 
+    def _release_session(self) -> None:
+        """Release the shared session acquired by start()."""
+        if self.session is not None:
+            get_session_manager().release(self.session)
+            self.session = None
+
+    def _start_graph(self) -> None:
+        """Start watching the ROS2 graph; failures only disable discovery."""
+        graph = ROS2GraphIndex(self.session)
         try:
-            if hasattr(msg, '__dict__'):
-                result = {}
-                for key, value in msg.__dict__.items():
-                    # Skip private attributes
-                    if key.startswith('_'):
-                        continue
-                    # Recursively convert nested objects (including ndarray)
-                    # Check for ndarray first, then other nested types
-                    if hasattr(value, 'tolist') and hasattr(value, 'shape'):
-                        # numpy ndarray
-                        try:
-                            result[key] = value.tolist()
-                        except Exception:
-                            result[key] = str(value)
-                    elif hasattr(value, '__dict__') or isinstance(value, (list, tuple)):
-                        result[key] = self._convert_nested_obj_to_dict(value)
-                    else:
-                        result[key] = value
-                return result
-            else:
-                return str(msg)
+            graph.start()
         except Exception as e:
-            logger.warning(f"Failed to convert message to dict: {e}, using str()")
-            return str(msg)
+            logger.warning(
+                f"[{self.container_name}] ROS2 graph discovery unavailable: {e}"
+            )
+            return
+        self.graph = graph
+        logger.debug(f"[{self.container_name}] Watching ROS2 graph for domain_id={self.domain_id}")
+
+    def _forget_topic(self, topic: str) -> None:
+        """Drop a topic from configuration and all per-topic state (caller holds _subscribe_lock)."""
+        def without(mapping: dict) -> dict:
+            return {key: value for key, value in mapping.items() if key != topic}
+
+        self.topics = without(self.topics)
+        self.static_topics = without(self.static_topics)
+        self.slots = without(self.slots)
+        self.histories = without(self.histories)
+        self.timeseries = without(self.timeseries)
+        self.diagnostics = without(self.diagnostics)
+        self.ingest_policies = without(self.ingest_policies)
+        self.topic_stats = without(self.topic_stats)
+        self._subscribe_failed_at.pop(topic, None)
+        self.subscribe_latencies.pop(topic, None)
+        self.subscribe_errors.pop(topic, None)
+
+    def _load_snapshot(self, topic: str) -> None:
+        """Fill an empty static topic slot from its snapshot, if there is one."""
+        if self.snapshot_dir is None:
+            return
+        slot = self.slots.get(topic)
+        if slot is None or slot.entry is not None:
+            return
+        snapshot = load_snapshot(snapshot_path(self.snapshot_dir, self.container_name, self.domain_id, topic))
+        if snapshot is None:
+            return
+        msg_type, received_at, data_json = snapshot
+        if msg_type != self.get_msg_type(topic):
+            logger.info(
+                f"[{self.container_name}] Ignoring snapshot of '{topic}': type {msg_type} "
+                f"does not match configured {self.get_msg_type(topic)}"
+            )
+            return
+        try:
+            slot.swap(TopicCacheEntry.from_snapshot_data(data_json, received_at, next(slot.seqs)))
+        except ValueError as e:
+            logger.warning(f"[{self.container_name}] Ignoring corrupt snapshot of '{topic}': {e}")
+            return
+        logger.info(
+            f"[{self.container_name}] Loaded snapshot of static topic '{topic}' "
+            f"({len(data_json)} bytes, received at {received_at:.3f})"
+        )
 
-    def _convert_nested_obj_to_dict(self, obj: Any) -> Any:
-        """Recursively convert nested objects to dictionaries.
+    def _save_snapshot(self, topic: str, entry: TopicCacheEntry) -> None:
+        """Persist a static topic message (called from the ingest callback; static topics are rare)."""
+        try:
+            save_snapshot(
+                snapshot_path(self.snapshot_dir, self.container_name, self.domain_id, topic),
+                self.get_msg_type(topic),
+                entry.received_at,
+                entry.get_data_json(self.get_topic_converter(topic)),
+            )
+            logger.debug(f"[{self.container_name}] Saved snapshot of static topic '{topic}'")
+        except Exception as e:
+            logger.warning(f"[{self.container_name}] Failed to save snapshot of '{topic}': {e}")
+
+    def _keeps_raw_payload(self, topic: str) -> bool:
+        """Whether a topic's messages are cached as serialized payloads.
+
+        This is the case with lazy_deserialize, and always for image topics,
+        whose frames are only decoded when a client asks for an encoded image.
+        Time-series and diagnostics topics are always deserialized on arrival,
+        since every message's field values or statuses are indexed.
+        """
+        if topic in self.timeseries or topic in self.diagnostics:
+            return False
+        return self.lazy_deserialize or self.get_msg_type(topic) in IMAGE_TYPES
+
+    def _mark_read(self, topic: str, now: float) -> None:
+        """Record that a client read a topic.
+
+        Read times drive ingest policies and idle teardown. In lazy mode the
+        first read of an unsubscribed dynamic topic also starts its subscription.
+        """
+        slot = self.slots.get(topic)
+        if slot is None:
+            return
+        slot.last_read = now
+        if self.lazy_subscribe and topic not in self.subscribers and topic in self.topics:
+            self._subscribe_on_demand(topic, now)
+
+    def _subscribe_on_demand(self, topic: str, now: float) -> None:
+        """Subscribe a dynamic topic in the background (lazy mode).
+
+        Subscribing can block on the Zenoh router, so it runs on its own
+        thread and the triggering read returns immediately (without data).
+        """
+        with self._subscribe_lock:
+            if (
+                not self.is_running
+                or topic in self.subscribers
+                or topic in self._pending_subscriptions
+                or now - self._subscribe_failed_at.get(topic, 0.0) < LAZY_SUBSCRIBE_RETRY_DELAY
+            ):
+                return
+            self._pending_subscriptions.add(topic)
+
+        threading.Thread(
+            target=self._run_on_demand_subscribe,
+            args=(topic,),
+            daemon=True,
+            name=f"{self.container_name}-subscribe",
+        ).start()
+
+    def _run_on_demand_subscribe(self, topic: str) -> None:
+        """Create an on-demand subscription (runs on its own thread)."""
+        try:
+            self._create_subscriber(topic, self.topics[topic])
+        except Exception as e:
+            logger.error(
+                f"[{self.container_name}] Failed to subscribe to dynamic topic '{topic}' on demand: {e}"
+            )
+            with self._subscribe_lock:
+                self._subscribe_failed_at[topic] = time.time()
+        finally:
+            with self._subscribe_lock:
+                self._pending_subscriptions.discard(topic)
+                # The plugin may have stopped, or the topic been removed, meanwhile
+                orphan = None
+                if not self.is_running or topic not in self.topics:
+                    orphan = self.subscribers.pop(topic, None)
+            if orphan is not None:
+                self._close_subscriber(topic, orphan)
+
+    def _unsubscribe_idle_topics(self, now: float) -> None:
+        """Unsubscribe lazily subscribed dynamic topics without recent reads.
+
+        Runs on the timing wheel, so it only detaches the subscribers; the
+        Zenoh undeclares run on their own thread.
+        """
+        idle = []
+        for topic in self.topics:
+            slot = self.slots.get(topic)
+            if slot is None or now - slot.last_read <= self.idle_timeout:
+                continue
+            with self._subscribe_lock:
+                subscriber = self.subscribers.pop(topic, None)
+            if subscriber is not None:
+                idle.append((topic, slot, subscriber))
+
+        if idle:
+            threading.Thread(
+                target=self._run_idle_unsubscribe,
+                args=(idle,),
+                daemon=True,
+                name=f"{self.container_name}-unsubscribe",
+            ).start()
+
+    def _run_idle_unsubscribe(self, idle: list[tuple[str, TopicSlot, Any]]) -> None:
+        """Close the subscribers of idle topics and clear their data (runs on its own thread)."""
+        for topic, slot, subscriber in idle:
+            self._close_subscriber(topic, subscriber)
+            with self._subscribe_lock:
+                # A read may have subscribed the topic again meanwhile
+                resubscribed = topic in self.subscribers or topic in self._pending_subscriptions
+            if not resubscribed:
+                slot.clear()
+                policy = self.ingest_policies.get(topic)
+                if policy is not None:
+                    policy.reset()
+            logger.info(
+                f"[{self.container_name}] Unsubscribed idle topic '{topic}' "
+                f"(no reads in {self.idle_timeout}s)"
+            )
+
+    def _make_message_callback(self, topic: str) -> Callable[[Any, int], None]:
+        """Build the ingest callback for a topic.
+
+        Everything the callback needs is resolved here once, so handling a
+        message only stamps it, updates statistics, swaps the topic's cache
+        slot and appends to the topic's own history/time-series buffers.
+        No plugin-wide lock is taken. If the topic has an ingest policy,
+        messages it rejects are counted and dropped before any of that work;
+        with keep="latest", messages inside a window are only held by the
+        policy, and the held one is published once its window closes.
 
         Args:
-            obj: Object to convert.
+            topic: Topic name.
 
         Returns:
-            Dictionary or primitive value.
-        """
-        if obj is None:
-            return None
-        if isinstance(obj, (str, int, float, bool)):
-            return obj
+            Callback taking (msg, payload_size).
 
-        # Handle numpy ndarray (common in ROS2 messages like joint_states, odom)
-        # Check for ndarray by checking for tolist method and shape attribute
-        if hasattr(obj, 'tolist') and hasattr(obj, 'shape'):
+        Raises:
+            KeyError: If the topic is not configured (removed meanwhile); its
+                slot and statistics are created with the topic.
+        """
+        slot = self.slots[topic]
+        history = self.histories.get(topic)
+        series = self.timeseries.get(topic)
+        diagnostics = self.diagnostics.get(topic)
+        stats = self.topic_stats[topic]
+        policy = self.ingest_policies.get(topic)
+        expires = topic in self.topics  # Static topics are never stale
+        persist = self.snapshot_dir is not None and topic in self.static_topics
+
+        def publish(msg: Any, received_at: float, payload_size: int) -> TopicCacheEntry:
+            # Conversion is deferred until a reader asks for the data
+            entry = TopicCacheEntry(msg, received_at, next(slot.seqs), payload_size)
+            if slot.swap(entry) and expires:
+                self._schedule_expiry(topic, slot, received_at)
+            return entry
+
+        def store(entry: TopicCacheEntry) -> None:
+            if persist:
+                self._save_snapshot(topic, entry)
+            if history is not None:
+                history.append(entry.received_at, entry, entry.payload_size)
+            if series is not None:
+                series.append(entry.received_at, entry.raw_message)
+            if diagnostics is not None:
+                diagnostics.update(entry.received_at, entry.raw_message)
+
+        def flush() -> None:
+            # Caller holds policy.lock
+            held = policy.take_pending()
+            if held is not None:
+                store(publish(*held))
+
+        if policy is not None:
+            policy.flush = flush
+
+        def msg_callback(msg: Any, payload_size: int):
+            """Handle incoming ROS2 message for this topic.
+
+            Args:
+                msg: ROS2 message object.
+                payload_size: Serialized payload size in bytes.
+            """
             try:
-                return obj.tolist()  # Convert ndarray to list
-            except Exception:
-                return str(obj)
-
-        if isinstance(obj, (list, tuple)):
-            return [self._convert_nested_obj_to_dict(item) for item in obj]
-        if hasattr(obj, '__dict__'):
-            result = {}
-            for key, value in obj.__dict__.items():
-                if key.startswith('_'):
-                    continue
-                result[key] = self._convert_nested_obj_to_dict(value)
-            return result
-        return str(obj)
+                # Use current time as received_at (stale check)
+                received_at = time.time()
+                stats.record(received_at, payload_size)
+
+                if policy is None:
+                    store(publish(msg, received_at, payload_size))
+                    return
+
+                if policy.is_unconsumed(received_at, slot.last_read):
+                    stats.dropped_no_consumers += 1
+                    return
+
+                if policy.keep_latest and policy.period is not None:
+                    # The flush timer takes and publishes held messages too
+                    with policy.lock:
+                        if policy.open_window(received_at):
+                            # Publish the latest message of the window that just closed
+                            flush()
+                        else:
+                            # Replaces the held message, which is then never stored
+                            stats.dropped_rate_limited += 1
+                        policy.hold(msg, received_at, payload_size)
+                    return
+
+                if not policy.open_window(received_at):
+                    # Inside the current decimation window
+                    stats.dropped_rate_limited += 1
+                    return
+                store(publish(msg, received_at, payload_size))
+
+            except Exception as e:
+                logger.error(
+                    f"[{self.container_name}] Error processing message for '{topic}': {e}",
+                    exc_info=True
+                )
+
+        return msg_callback
+
+    def _subscribe_concurrently(self, topics: dict[str, str]) -> list[str]:
+        """Create subscribers for several topics on a bounded worker pool.
+
+        Each topic gets subscribe_timeout seconds from the moment a worker
+        picks it up. A topic that exceeds it is reported as failed, but its
+        creation keeps running in the background and the topic becomes
+        active if it eventually succeeds. Topics still queued when no worker
+        has made progress for subscribe_timeout are reported the same way.
+
+        Args:
+            topics: Dictionary mapping topic names to message types.
+
+        Returns:
+            Names of the topics that failed or timed out.
+        """
+        if not topics:
+            return []
+
+        started_at: dict[str, float] = {}
+
+        def subscribe(topic: str, msg_type: str) -> None:
+            started_at[topic] = time.monotonic()
+            self._create_subscriber(topic, msg_type)
+
+        failed_topics = []
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.subscribe_workers, len(topics)),
+            thread_name_prefix=f"{self.container_name}-subscribe",
+        )
+        try:
+            pending = {
+                executor.submit(subscribe, topic, msg_type): topic
+                for topic, msg_type in topics.items()
+            }
+            last_progress = time.monotonic()
+            while pending:
+                now = time.monotonic()
+                deadlines = [
+                    started_at[topic] + self.subscribe_timeout
+                    for topic in pending.values() if topic in started_at
+                ]
+                deadline = min(deadlines, default=last_progress + self.subscribe_timeout)
+                done, _ = wait(pending, timeout=max(deadline - now, 0.0), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    topic = pending.pop(future)
+                    last_progress = time.monotonic()
+                    error = future.exception()
+                    if error is not None:
+                        logger.error(
+                            f"[{self.container_name}] Failed to subscribe to "
+                            f"{'static' if topic in self.static_topics else 'dynamic'} topic '{topic}': {error}"
+                        )
+                        failed_topics.append(topic)
+
+                now = time.monotonic()
+                stalled = now - last_progress >= self.subscribe_timeout
+                for future, topic in list(pending.items()):
+                    if topic in started_at:
+                        timed_out = now - started_at[topic] >= self.subscribe_timeout
+                    else:
+                        timed_out = stalled
+                    if not timed_out:
+                        continue
+                    del pending[future]
+                    self.subscribe_errors[topic] = f"Timed out after {self.subscribe_timeout}s"
+                    logger.error(
+                        f"[{self.container_name}] Subscribing to '{topic}' timed out after "
+                        f"{self.subscribe_timeout}s (still trying in the background)"
+                    )
+                    failed_topics.append(topic)
+        finally:
+            # Timed-out creations finish in the background
+            executor.shutdown(wait=False)
+
+        if self.subscribe_latencies and logger.isEnabledFor(logging.DEBUG):
+            slowest = sorted(self.subscribe_latencies.items(), key=lambda item: item[1], reverse=True)[:5]
+            logger.debug(
+                f"[{self.container_name}] Slowest subscriptions: "
+                + ", ".join(f"{topic}={latency * 1000:.0f}ms" for topic, latency in slowest)
+            )
+        return failed_topics
 
     def _create_subscriber(self, topic: str, msg_type: str) -> None:
         """Create and start a subscriber for a specific topic.
 
+        The subscribe latency (or the error) is recorded per topic and shown
+        in the topic status.
+
         Args:
             topic: Topic name.
             msg_type: Message type string.
@@ -470,134 +1595,145 @@ class ROS2TopicSubscriber:
         Raises:
             Exception: If subscriber creation fails.
         """
-        try:
-            # Create callback function that captures the topic name
-            def msg_callback(msg: Any):
-                """Handle incoming ROS2 message for this topic.
-
-                Args:
-                    msg: ROS2 message object.
-                """
-                try:
-                    # Use current time as received_at (stale check)
-                    received_at = time.time()
-
-                    with self.lock:
-                        # Store only raw_message to save memory
-                        self.msg_cache[topic] = {
-                            "raw_message": msg,
-                            "received_at": received_at,
-                        }
-
-                except Exception as e:
-                    logger.error(
-                        f"[{self.container_name}] Error processing message for '{topic}': {e}",
-                        exc_info=True
-                    )
+        msg_callback = self._make_message_callback(topic)
+
+        session = self.session
+        if session is None:
+            raise RuntimeError("Plugin has no Zenoh session (not running)")
+
+        # Build subscriber kwargs; containers subscribing the same topic on this session share one subscription
+        subscriber_kwargs = {
+            "domain": session,
+            "topic": topic,
+            "msg_type": msg_type,
+            "callback": msg_callback,
+            "raw": self._keeps_raw_payload(topic),
+        }
+
+        # Apply TRANSIENT_LOCAL QoS for static topics (typically robot_description)
+        if topic in self.static_topics:
+            subscriber_kwargs["qos"] = QosProfile(
+                durability=QosDurability.TRANSIENT_LOCAL,
+                history_depth=1,
+            )
 
-            # Build subscriber kwargs
-            # Note: ROS2Subscriber defaults to router_ip=127.0.0.1, router_port=7447
-            subscriber_kwargs = {
-                "topic": topic,
-                "msg_type": msg_type,
-                "callback": msg_callback,
-                "domain_id": self.domain_id,
-            }
+        logger.debug(
+            f"[{self.container_name}] Creating subscriber for '{topic}' "
+            f"(type: {msg_type}, domain_id: {self.domain_id})"
+        )
 
-            # Only set router_ip/router_port if explicitly configured
-            if self.router_ip is not None:
-                subscriber_kwargs["router_ip"] = self.router_ip
-                logger.debug(f"[{self.container_name}] Using router IP: {self.router_ip}")
+        started_at = time.monotonic()
+        try:
+            subscriber = get_subscription_registry().subscribe(**subscriber_kwargs)
+        except Exception as e:
+            # Error is logged by the caller
+            self.subscribe_errors[topic] = str(e)
+            raise
+        latency = time.monotonic() - started_at
 
-            if self.router_port is not None:
-                subscriber_kwargs["router_port"] = self.router_port
-                logger.debug(f"[{self.container_name}] Using router port: {self.router_port}")
+        with self._subscribe_lock:
+            # The plugin may have been stopped while the subscription was created
+            stale = self.session is not session or topic not in self.slots
+            if not stale:
+                self.subscribers[topic] = subscriber
+                self.subscribe_latencies[topic] = latency
+                self.subscribe_errors.pop(topic, None)
+        if stale:
+            self._close_subscriber(topic, subscriber)
+            raise RuntimeError(f"Plugin stopped while subscribing to '{topic}'")
 
-            # Apply TRANSIENT_LOCAL QoS for static topics (typically robot_description)
-            if topic in self.static_topics:
-                subscriber_kwargs["qos"] = QosProfile(
-                    durability=QosDurability.TRANSIENT_LOCAL,
-                    history_depth=1,
-                )
+        logger.info(
+            f"[{self.container_name}] Subscribed to '{topic}' in {latency * 1000:.0f} ms (type: {msg_type})"
+        )
 
-            logger.info(
-                f"[{self.container_name}] Creating subscriber for '{topic}' "
-                f"(type: {msg_type}, domain_id: {self.domain_id})"
+    def _cleanup_subscribers(self) -> None:
+        """Clean up all subscribers."""
+        with self._subscribe_lock:
+            subscribers = list(self.subscribers.items())
+            self.subscribers.clear()
+        for topic, subscriber in subscribers:
+            self._close_subscriber(topic, subscriber)
+
+    def _close_subscriber(self, topic: str, subscriber: ROS2SubscriptionHandle) -> None:
+        """Close a single subscriber, logging errors."""
+        try:
+            subscriber.close()
+            logger.debug(f"[{self.container_name}] Closed subscriber for '{topic}'")
+        except Exception as e:
+            logger.warning(
+                f"[{self.container_name}] Error closing subscriber for '{topic}': {e}"
             )
 
+    def _flush_ingest_windows(self) -> None:
+        """Publish held keep="latest" messages whose window closed without a successor (timing wheel)."""
+        now = time.time()
+        for topic, policy in self.ingest_policies.items():
+            flush = policy.flush
+            if flush is None:
+                continue
             try:
-                subscriber = ROS2Subscriber(**subscriber_kwargs)
-                self.subscribers[topic] = subscriber
+                # Under the lock, so a callback cannot open a window or publish in between
+                with policy.lock:
+                    if policy.is_pending_due(now):
+                        flush()
+            except Exception as e:
+                logger.error(f"[{self.container_name}] Error flushing held message of '{topic}': {e}")
+
+    def _schedule_expiry(self, topic: str, slot: TopicSlot, received_at: float) -> None:
+        """Arm the expiry timer of a dynamic topic for an entry received at received_at.
 
-                logger.info(
-                    f"[{self.container_name}] Successfully subscribed to '{topic}'"
+        The timer fires once the entry would become stale. If newer messages
+        arrived meanwhile it re-arms itself for the newest one, otherwise it
+        clears the slot.
+        """
+        def expire() -> None:
+            had_entry = slot.entry is not None
+            fresh_at = slot.expire(time.time() - DYNAMIC_TOPIC_STALE_TIME)
+            if fresh_at is not None:
+                self._schedule_expiry(topic, slot, fresh_at)
+            elif had_entry:
+                self._stale_cleared += 1
+                logger.debug(
+                    f"[{self.container_name}] Cleared stale cache for dynamic topic '{topic}' "
+                    f"(older than {DYNAMIC_TOPIC_STALE_TIME}s)"
                 )
-            except Exception as sub_error:
-                # Error is already logged by start() method, just raise
-                raise
 
-        except Exception as e:
-            # Error will be handled by start() method which calls this function
-            # Just raise it without logging again to avoid duplicate logs
-            raise
+        get_scheduler().call_later(received_at + DYNAMIC_TOPIC_STALE_TIME - time.time(), expire)
 
-    def _cleanup_subscribers(self) -> None:
-        """Clean up all subscribers."""
-        for topic, subscriber in list(self.subscribers.items()):
-            try:
-                subscriber.close()
-                logger.debug(f"[{self.container_name}] Closed subscriber for '{topic}'")
-            except Exception as e:
+    def _status_check(self) -> None:
+        """Log subscription status and drop idle subscriptions (every STATUS_CHECK_INTERVAL).
+
+        Runs on the shared timing wheel thread, like the expiry timers; idle
+        subscriptions are closed on a separate thread.
+        """
+        if not self.is_running:
+            return
+        self._status_check_count += 1
+        check_count = self._status_check_count
+        current_time = time.time()
+
+        if self.lazy_subscribe:
+            self._unsubscribe_idle_topics(current_time)
+
+        # Only log warnings for dynamic topics without data (not stale, just missing)
+        for topic_name in self.topics.keys():
+            if self.lazy_subscribe and topic_name not in self.subscribers:
+                continue  # Not subscribed because nobody is reading it
+            slot = self.slots.get(topic_name)
+            if slot is None or slot.entry is None:
                 logger.warning(
-                    f"[{self.container_name}] Error closing subscriber for '{topic}': {e}"
+                    f"[{self.container_name}] Dynamic topic '{topic_name}' has no cached data "
+                    f"(no messages received in {check_count * STATUS_CHECK_INTERVAL} seconds)"
                 )
-        self.subscribers.clear()
-
-
-    def _periodic_status_check(self) -> None:
-        """Periodically log subscription status, cache state, and clear stale dynamic topics."""
-        check_count = 0
-        while self.is_running:
-            time.sleep(STATUS_CHECK_INTERVAL)
-            if not self.is_running:
-                break
-
-            check_count += 1
-            current_time = time.time()
-
-            with self.lock:
-                # Clear stale dynamic topics
-                stale_topics = []
-                for topic_name in list(self.msg_cache.keys()):
-                    # Only check dynamic topics for staleness
-                    if topic_name in self.topics:
-                        cached = self.msg_cache.get(topic_name)
-                        if cached is not None:
-                            received_at = cached.get("received_at")
-                            if received_at is not None:
-                                age = current_time - received_at
-                                if age > DYNAMIC_TOPIC_STALE_TIME:
-                                    del self.msg_cache[topic_name]
-                                    stale_topics.append(topic_name)
-                                    logger.debug(
-                                        f"[{self.container_name}] Cleared stale cache for dynamic topic '{topic_name}' "
-                                        f"(age: {age:.1f}s > {DYNAMIC_TOPIC_STALE_TIME}s)"
-                                    )
-
-                # Only log warnings for dynamic topics without data (not stale, just missing)
-                for topic_name in self.topics.keys():
-                    if topic_name not in self.msg_cache:
-                        logger.warning(
-                            f"[{self.container_name}] Dynamic topic '{topic_name}' has no cached data "
-                            f"(no messages received in {check_count * STATUS_CHECK_INTERVAL} seconds)"
-                        )
 
-                # Debug-level summary (only if DEBUG logging is enabled)
-                if logger.isEnabledFor(logging.DEBUG):
-                    total_topics = len(self.topics) + len(self.static_topics)
-                    logger.debug(
-                        f"[{self.container_name}] Status check #{check_count}: "
-                        f"subscribers={len(self.subscribers)}, "
-                        f"cached_topics={len(self.msg_cache)}/{total_topics}, "
-                        f"stale_cleared={len(stale_topics)}"
-                    )
+        # Debug-level summary (only if DEBUG logging is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            total_topics = len(self.topics) + len(self.static_topics)
+            cached_topics = sum(1 for slot in self.slots.values() if slot.entry is not None)
+            logger.debug(
+                f"[{self.container_name}] Status check #{check_count}: "
+                f"subscribers={len(self.subscribers)}, "
+                f"cached_topics={cached_topics}/{total_topics}, "
+                f"stale_cleared={self._stale_cleared}"
+            )
+        self._stale_cleared = 0
@@ -0,0 +1,311 @@
+"""Columnar time-series store for numeric ROS2 topic fields.
+
+Selected numeric fields of a topic (e.g. ``position``/``velocity``/``effort``
+of ``/joint_states``) are appended at ingest into preallocated NumPy column
+arrays indexed by receive time. The store is a ring buffer: memory is fixed
+at ``capacity`` rows per field, and queries (time slicing, min/max/mean and
+resampling) are vectorized over the stored columns instead of walking
+Python message objects.
+"""
+
+import operator
+import threading
+import warnings
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+
+def _compile_field_getter(path: str) -> Callable[[Any], Any]:
+    """Compile a dotted field path into a getter.
+
+    Numeric path segments index into sequences, e.g. ``points.0.positions``.
+
+    Args:
+        path: Dotted field path.
+
+    Returns:
+        Function extracting the field from a message.
+    """
+    steps = []
+    for segment in path.split("."):
+        if segment.isdigit():
+            steps.append(operator.itemgetter(int(segment)))
+        else:
+            steps.append(operator.attrgetter(segment))
+
+    def getter(msg: Any) -> Any:
+        value = msg
+        for step in steps:
+            value = step(value)
+        return value
+
+    return getter
+
+
+def to_json_list(values: np.ndarray) -> list:
+    """Convert an array to nested lists with NaN replaced by None (JSON null)."""
+    nan_mask = np.isnan(values)
+    if not nan_mask.any():
+        return values.tolist()
+    converted = values.astype(object)
+    converted[nan_mask] = None
+    return converted.tolist()
+
+
+class TopicTimeSeries:
+    """Ring buffer of numeric field columns for a single topic.
+
+    Each field is stored as a (capacity, width) array, where width is the
+    number of values the field had in the first sample (1 for scalars).
+    Samples whose field width differs are truncated or padded with NaN.
+
+    Attributes:
+        fields: Configured field paths
+        capacity: Maximum number of rows kept
+        dtype: NumPy dtype of the value columns
+    """
+
+    def __init__(self, fields: list[str], capacity: int, dtype: str = "float64"):
+        """Initialize an empty time-series store.
+
+        Args:
+            fields: Dotted numeric field paths to extract, e.g. ["position", "velocity"].
+            capacity: Maximum number of rows kept. Must be positive.
+            dtype: NumPy dtype name of the value columns ("float32" or "float64").
+
+        Raises:
+            ValueError: If capacity is not positive or no fields are given.
+        """
+        if capacity <= 0:
+            raise ValueError(f"Time-series capacity must be positive, got {capacity}")
+        if not fields:
+            raise ValueError("Time-series requires at least one field")
+
+        self.fields = list(fields)
+        self.capacity = capacity
+        self.dtype = np.dtype(dtype)
+        self._getters = {field: _compile_field_getter(field) for field in self.fields}
+        self._times = np.zeros(capacity, dtype=np.float64)
+        # Allocated on the first sample carrying the field, once its width is known
+        self._columns: dict[str, Optional[np.ndarray]] = {field: None for field in self.fields}
+        self._count = 0  # Total rows appended
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    # ============================================================================
+    # Ingest
+    # ============================================================================
+
+    def append(self, received_at: float, msg: Any) -> None:
+        """Append the configured fields of a message as a new row.
+
+        Fields missing from the message are stored as NaN.
+
+        Args:
+            received_at: Receive timestamp of the message.
+            msg: ROS2 message object.
+        """
+        values = {}
+        for field, getter in self._getters.items():
+            try:
+                values[field] = np.asarray(getter(msg), dtype=self.dtype).ravel()
+            except Exception:
+                values[field] = None
+
+        with self._lock:
+            row = self._count % self.capacity
+            self._times[row] = received_at
+            for field, value in values.items():
+                column = self._columns[field]
+                if column is None:
+                    if value is None:
+                        continue
+                    column = np.full((self.capacity, value.size), np.nan, dtype=self.dtype)
+                    self._columns[field] = column
+
+                if value is None:
+                    column[row] = np.nan
+                elif value.size == column.shape[1]:
+                    column[row] = value
+                else:
+                    width = min(value.size, column.shape[1])
+                    column[row, :width] = value[:width]
+                    column[row, width:] = np.nan
+            self._count += 1
+
+    def clear(self) -> None:
+        """Remove all rows (column allocations are kept)."""
+        with self._lock:
+            self._count = 0
+
+    # ============================================================================
+    # Queries
+    # ============================================================================
+
+    def resolve_column(self, path: str) -> tuple[str, Optional[int]]:
+        """Split a numeric field path into a stored field and column index.
+
+        ``path`` is either a stored field (e.g. "position") or a stored field
+        followed by a column index (e.g. "position.3").
+
+        Args:
+            path: Field path.
+
+        Returns:
+            Tuple of (field, column_index or None).
+
+        Raises:
+            KeyError: If the path does not refer to a stored field.
+        """
+        if path in self._columns:
+            return path, None
+        field, _, index = path.rpartition(".")
+        if field in self._columns and index.isdigit():
+            return field, int(index)
+        raise KeyError(f"Field '{path}' is not stored for this time series")
+
+    def width(self, field: str) -> int:
+        """Get the number of columns of a stored field (0 before its first sample)."""
+        column = self._columns[field]
+        return 0 if column is None else column.shape[1]
+
+    def query(
+        self,
+        field: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get rows of a field received within a time window, oldest first.
+
+        Args:
+            field: Configured field path.
+            since: Inclusive lower bound on receive time. None for no bound.
+            until: Inclusive upper bound on receive time. None for no bound.
+
+        Returns:
+            Tuple of (timestamps, values) copies with shapes (n,) and (n, width).
+
+        Raises:
+            KeyError: If the field is not configured.
+        """
+        if field not in self._columns:
+            raise KeyError(f"Field '{field}' is not configured for this time series")
+
+        with self._lock:
+            size = len(self)
+            lo = 0 if since is None else self._searchsorted(since, "left")
+            hi = size if until is None else self._searchsorted(until, "right")
+            hi = max(hi, lo)
+            times = self._take(self._times, lo, hi)
+            column = self._columns[field]
+            if column is None:
+                values = np.full((hi - lo, 0), np.nan, dtype=self.dtype)
+            else:
+                values = self._take(column, lo, hi)
+        return times, values
+
+    def stats(
+        self,
+        field: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> dict[str, np.ndarray]:
+        """Get per-column min, max and mean of a field within a time window.
+
+        Args:
+            field: Configured field path.
+            since: Inclusive lower bound on receive time.
+            until: Inclusive upper bound on receive time.
+
+        Returns:
+            Dictionary with 'count', 'min', 'max' and 'mean' (arrays of width
+            values, NaN for columns without data).
+        """
+        times, values = self.query(field, since, until)
+        with warnings.catch_warnings():
+            # All-NaN columns legitimately produce NaN results
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if times.size == 0:
+                empty = np.full(values.shape[1], np.nan)
+                return {"count": 0, "min": empty, "max": empty, "mean": empty}
+            return {
+                "count": int(times.size),
+                "min": np.nanmin(values, axis=0),
+                "max": np.nanmax(values, axis=0),
+                "mean": np.nanmean(values, axis=0),
+            }
+
+    def resample(
+        self,
+        field: str,
+        period: float,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Resample a field into fixed-period buckets by averaging.
+
+        Buckets are aligned to ``since`` (or the first sample) and empty
+        buckets are omitted.
+
+        Args:
+            field: Configured field path.
+            period: Bucket length in seconds. Must be positive.
+            since: Inclusive lower bound on receive time.
+            until: Inclusive upper bound on receive time.
+
+        Returns:
+            Tuple of (bucket_start_times, bucket_means).
+
+        Raises:
+            ValueError: If period is not positive.
+        """
+        if period <= 0:
+            raise ValueError(f"Resample period must be positive, got {period}")
+
+        times, values = self.query(field, since, until)
+        if times.size == 0:
+            return times, values
+
+        origin = since if since is not None else times[0]
+        buckets = np.floor((times - origin) / period).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+
+        valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0)
+        counts = np.add.reduceat(valid, starts, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        return origin + buckets[starts] * period, means.astype(self.dtype, copy=False)
+
+    # ============================================================================
+    # Private Helper Methods (caller holds the lock)
+    # ============================================================================
+
+    def _start(self) -> int:
+        """Physical row index of the oldest sample."""
+        return self._count % self.capacity if self._count > self.capacity else 0
+
+    def _searchsorted(self, value: float, side: str) -> int:
+        """Logical (oldest-first) insertion index of a timestamp."""
+        size = len(self)
+        start = self._start()
+        if start == 0:
+            return int(np.searchsorted(self._times[:size], value, side))
+
+        older = self._times[start:]
+        position = int(np.searchsorted(older, value, side))
+        if position < older.size:
+            return position
+        return older.size + int(np.searchsorted(self._times[:start], value, side))
+
+    def _take(self, array: np.ndarray, lo: int, hi: int) -> np.ndarray:
+        """Copy logical rows [lo, hi) of a ring-buffer array."""
+        start = self._start()
+        first = (start + lo) % self.capacity
+        count = hi - lo
+        if first + count <= self.capacity:
+            return array[first:first + count].copy()
+        return np.concatenate((array[first:], array[:first + count - self.capacity]))
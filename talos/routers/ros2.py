@@ -1,14 +1,42 @@
 """ROS2 endpoints router."""
 
+import asyncio
 import logging
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 
-from talos.state import get_config, get_ros2_plugin
+from talos.state import get_config, get_ros2_plugin, get_tf_buffer
+from talos.plugins.ros2_encoding import (
+    encode_json,
+    encode_topic_data_response,
+    encode_topic_history_response,
+)
+from talos.plugins.ros2_diagnostics import DiagnosticsIndex, parse_level
+from talos.plugins.ros2_downsample import downsample
+from talos.plugins.ros2_image import DEFAULT_QUALITY, IMAGE_TYPES, ImageEncoding
+from talos.plugins.ros2_memory import get_memory_budget
+from talos.plugins.ros2_precision import FloatPrecision
+from talos.plugins.ros2_projection import FieldProjection, compile_projection
+from talos.plugins.ros2_tf_buffer import ROS2TFBuffer, TFExtrapolationError, TFLookupError
+from talos.plugins.ros2_topic_subscriber import ROS2TopicSubscriber
+from talos.plugins.ros2_topic_timeseries import TopicTimeSeries, to_json_list
 from talos.models import (
+    ROS2DiagnosticsResponse,
+    ROS2DiagnosticStatus,
+    ROS2GraphResponse,
+    ROS2MemoryUsage,
+    ROS2TFFramesResponse,
     ROS2TopicDataResponse,
+    ROS2TopicHistoryResponse,
+    ROS2TopicPlotResponse,
+    ROS2TopicSeriesResponse,
     ROS2TopicsListResponse,
     ROS2TopicStatus,
+    ROS2TopicSubscribeRequest,
+    ROS2TopicSubscriptionResponse,
+    ROS2TransformResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -16,6 +44,62 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/containers/{container}/ros2", tags=["ros2"])
 
 
+def _get_plugin_for_topic(container: str, topic: str, config) -> ROS2TopicSubscriber:
+    """Get the ROS2 plugin of a container after validating container and topic.
+
+    Raises:
+        HTTPException: 404 if container or topic is unknown, 503 if the plugin is unavailable.
+    """
+    if container not in config.containers:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Container '{container}' not found",
+        )
+
+    plugin = get_ros2_plugin(container)
+    if plugin is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"ROS2 plugin for container '{container}' is not available. "
+                   f"Check if ROS2 configuration exists in config.yml and zenoh connection.",
+        )
+
+    if topic not in plugin.list_topics():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Topic '{topic}' is not configured for container '{container}'",
+        )
+    return plugin
+
+
+def _compile_fields(fields: Optional[str]) -> Optional[FieldProjection]:
+    """Compile a `fields` query parameter into a projection (None if not given).
+
+    Raises:
+        HTTPException: 400 if a field path is malformed.
+    """
+    if fields is None:
+        return None
+    try:
+        return compile_projection(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _parse_precision(precision: Optional[str]) -> Optional[FloatPrecision]:
+    """Parse a `precision` query parameter (None if not given).
+
+    Raises:
+        HTTPException: 400 if it is neither a number of decimal places nor "float32".
+    """
+    if precision is None:
+        return None
+    try:
+        return FloatPrecision.parse(precision)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get("/topics", response_model=ROS2TopicsListResponse)
 async def list_ros2_topics(
     container: str,
@@ -45,24 +129,45 @@ async def list_ros2_topics(
             configured=status_info["configured"],
             available=status_info["available"],
             subscribed=status_info["subscribed"],
+            stats=status_info.get("stats"),
+            subscribe_latency_ms=status_info.get("subscribe_latency_ms"),
+            subscribe_error=status_info.get("subscribe_error"),
+            cached_bytes=status_info.get("cached_bytes", 0),
+            from_snapshot=status_info.get("from_snapshot", False),
+            shared_by=status_info.get("shared_by", 0),
         )
         for topic, status_info in topics_status.items()
     ]
 
+    memory_budget = get_memory_budget()
+    memory = ROS2MemoryUsage(
+        used_bytes=plugin.get_memory_used(),
+        budget_bytes=plugin.memory_budget,
+        process_used_bytes=memory_budget.get_memory_used(),
+        process_budget_bytes=memory_budget.budget,
+        evicted_count=plugin.evicted_count,
+    )
+
     return ROS2TopicsListResponse(
         container=container,
         domain_id=plugin.domain_id,
         topics=topics,
+        memory=memory,
     )
 
 
-@router.get("/topics/{topic:path}", response_model=ROS2TopicDataResponse)
-async def get_ros2_topic_data(
+@router.get("/graph", response_model=ROS2GraphResponse)
+async def get_ros2_graph(
     container: str,
-    topic: str,
+    include_hidden: bool = False,
     config=Depends(get_config),
-) -> ROS2TopicDataResponse:
-    """Get the latest data from a specific ROS2 topic for a container."""
+) -> ROS2GraphResponse:
+    """Get the live ROS2 graph: topics with their types, publishers and subscribers.
+
+    Served from an index kept up to date by Zenoh liveliness tokens, so it also
+    lists topics that are not configured in config.yml. Hidden topics (`/_...`)
+    are included with `include_hidden=true`.
+    """
     if container not in config.containers:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,24 +182,593 @@ async def get_ros2_topic_data(
                    f"Check if ROS2 configuration exists in config.yml and zenoh connection.",
         )
 
-    if topic not in plugin.list_topics():
+    graph = plugin.graph
+    if graph is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"ROS2 graph discovery is not available for container '{container}'. "
+                   f"Check the discovery setting in config.yml and zenoh connection.",
+        )
+
+    configured = set(plugin.list_topics())
+    return ROS2GraphResponse(
+        container=container,
+        domain_id=plugin.domain_id,
+        topics=[
+            {**entry, "configured": entry["topic"] in configured}
+            for entry in graph.topics(include_hidden=include_hidden)
+        ],
+    )
+
+
+def _get_diagnostics_index(container: str, topic: str, config) -> DiagnosticsIndex:
+    """Get the diagnostics index of a DiagnosticArray topic.
+
+    Raises:
+        HTTPException: 404 if the container or topic is unknown or the topic is not indexed,
+            503 if the plugin is unavailable.
+    """
+    plugin = _get_plugin_for_topic(container, topic, config)
+    index = plugin.get_topic_diagnostics(topic)
+    if index is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Topic '{topic}' is not configured for container '{container}'",
+            detail=f"Diagnostics index is not available for topic '{topic}' in container '{container}'. "
+                   f"It requires a dynamic diagnostic_msgs/msg/DiagnosticArray topic and diagnostics_index.",
         )
+    return index
 
-    cached_data = plugin.get_topic_data(topic)
-    available = plugin.is_topic_available(topic)
 
-    data = None
-    if cached_data:
-        data = cached_data.get("data")
+@router.get("/diagnostics", response_model=ROS2DiagnosticsResponse)
+async def get_ros2_diagnostics(
+    container: str,
+    topic: str = "/diagnostics",
+    hardware_id: Optional[str] = None,
+    after_seq: Optional[int] = None,
+    config=Depends(get_config),
+) -> ROS2DiagnosticsResponse:
+    """Get the indexed statuses of a DiagnosticArray topic.
+
+    Pass the `seq` of the previous response as `after_seq` to get only the statuses
+    whose level, message or values changed since, oldest change first.
+    """
+    index = _get_diagnostics_index(container, topic, config)
+    seq = index.seq
+    if after_seq is not None:
+        statuses = index.get_changes(after_seq)
+        if hardware_id is not None:
+            statuses = [entry for entry in statuses if entry["hardware_id"] == hardware_id]
+    else:
+        statuses = index.get_statuses(hardware_id=hardware_id)
+    return ROS2DiagnosticsResponse(
+        container=container,
+        topic=topic,
+        seq=seq,
+        level_counts=index.get_level_counts(),
+        statuses=statuses,
+    )
+
 
-    return ROS2TopicDataResponse(
+@router.get("/diagnostics/levels/{level}", response_model=ROS2DiagnosticsResponse)
+async def get_ros2_diagnostics_level(
+    container: str,
+    level: str,
+    topic: str = "/diagnostics",
+    config=Depends(get_config),
+) -> ROS2DiagnosticsResponse:
+    """Get the statuses at one level, given as 0-3 or OK, WARN, ERROR, STALE."""
+    index = _get_diagnostics_index(container, topic, config)
+    try:
+        level_value = parse_level(level)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ROS2DiagnosticsResponse(
         container=container,
         topic=topic,
-        msg_type=plugin.topics[topic],
-        data=data,
-        available=available,
+        seq=index.seq,
+        level_counts=index.get_level_counts(),
+        statuses=index.get_statuses(level=level_value),
+    )
+
+
+@router.get("/diagnostics/status", response_model=ROS2DiagnosticStatus)
+async def get_ros2_diagnostic_status(
+    container: str,
+    name: str,
+    hardware_id: Optional[str] = None,
+    topic: str = "/diagnostics",
+    config=Depends(get_config),
+) -> ROS2DiagnosticStatus:
+    """Get one status by name (and hardware_id when several hardware report the same name)."""
+    index = _get_diagnostics_index(container, topic, config)
+    statuses = index.get_statuses(hardware_id=hardware_id, name=name)
+    if not statuses:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Diagnostic status '{name}' not found in '{topic}'",
+        )
+    if len(statuses) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Diagnostic status '{name}' is reported by several hardware IDs "
+                   f"{[entry['hardware_id'] for entry in statuses]}; pass hardware_id",
+        )
+    return ROS2DiagnosticStatus(**statuses[0])
+
+
+def _get_tf_buffer(container: str, config) -> ROS2TFBuffer:
+    """Get the TF buffer of a container.
+
+    Raises:
+        HTTPException: 404 if the container is unknown, 503 if the TF buffer is not available.
+    """
+    if container not in config.containers:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Container '{container}' not found",
+        )
+
+    tf_buffer = get_tf_buffer(container)
+    if tf_buffer is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"TF buffer for container '{container}' is not available. "
+                   f"Check the ros2.tf setting in config.yml and zenoh connection.",
+        )
+    return tf_buffer
+
+
+@router.get("/tf", response_model=ROS2TransformResponse)
+async def get_ros2_transform(
+    container: str,
+    target: str,
+    source: str,
+    time: Optional[float] = None,
+    config=Depends(get_config),
+) -> ROS2TransformResponse:
+    """Look up the transform from the source frame to the target frame.
+
+    Returns the pose of `source` in `target`. Without `time` (ROS time in seconds)
+    the latest transform available on the whole chain is returned; with `time`
+    the buffered transforms are interpolated.
+    """
+    tf_buffer = _get_tf_buffer(container, config)
+    try:
+        stamp, transform = tf_buffer.lookup(target, source, time)
+    except TFExtrapolationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except TFLookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    x, y, z, qx, qy, qz, qw = transform
+    return ROS2TransformResponse(
+        container=container,
+        target=target,
+        source=source,
+        time=stamp,
+        translation={"x": x, "y": y, "z": z},
+        rotation={"x": qx, "y": qy, "z": qz, "w": qw},
+    )
+
+
+@router.get("/tf/frames", response_model=ROS2TFFramesResponse)
+async def get_ros2_tf_frames(
+    container: str,
+    config=Depends(get_config),
+) -> ROS2TFFramesResponse:
+    """List the frames of the TF tree with their parents and buffered time range."""
+    tf_buffer = _get_tf_buffer(container, config)
+    return ROS2TFFramesResponse(
+        container=container,
+        message_count=tf_buffer.message_count,
+        frames=tf_buffer.buffer.get_frames(),
+    )
+
+
+def _parse_image_encoding(
+    image_format: str, quality: int, width: Optional[int], height: Optional[int]
+) -> ImageEncoding:
+    """Build the requested image encoding from query parameters.
+
+    Raises:
+        HTTPException: 400 if the format is unknown or a value is out of range.
+    """
+    try:
+        return ImageEncoding(image_format, quality, width, height)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get(
+    "/image",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/jpeg": {}, "image/png": {}}, "description": "Encoded frame"},
+        304: {"description": "The latest frame still has sequence number after_seq"},
+    },
+)
+async def get_ros2_image(
+    container: str,
+    topic: str,
+    format: str = "jpeg",
+    quality: int = DEFAULT_QUALITY,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    after_seq: Optional[int] = None,
+    config=Depends(get_config),
+) -> Response:
+    """Get the latest frame of a sensor_msgs/msg/Image or CompressedImage topic as JPEG or PNG.
+
+    The frame is scaled down to fit `width` x `height` (aspect ratio kept) and
+    encoded on the image worker pool. The `X-Seq` response header carries the
+    frame's sequence number; pass it as `after_seq` to get an empty 304 while
+    the frame is unchanged.
+    """
+    plugin = _get_plugin_for_topic(container, topic, config)
+    if plugin.get_msg_type(topic) not in IMAGE_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Topic '{topic}' is not a sensor_msgs/msg/Image or CompressedImage topic",
+        )
+    encoding = _parse_image_encoding(format, quality, width, height)
+
+    if after_seq is not None and plugin.get_topic_seq(topic) == after_seq:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    future = plugin.encode_topic_image(topic, encoding)
+    if future is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No image available for topic '{topic}' in container '{container}' "
+                   f"(no fresh frame, or isolated_ingest is enabled)",
+        )
+    try:
+        result = await asyncio.wrap_future(future)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e))
+
+    return Response(
+        content=result["image"],
+        media_type=result["media_type"],
+        headers={
+            "X-Seq": str(result["seq"]),
+            "X-Received-At": repr(result["received_at"]),
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+@router.get("/history", response_model=ROS2TopicHistoryResponse)
+async def get_ros2_topic_history(
+    container: str,
+    topic: str,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    limit: Optional[int] = None,
+    config=Depends(get_config),
+) -> Response:
+    """Get buffered messages of a ROS2 topic received within a time window.
+
+    `since` and `until` are receive timestamps in seconds since epoch (inclusive).
+    When `limit` is set and the window holds more samples, the most recent are returned.
+    """
+    plugin = _get_plugin_for_topic(container, topic, config)
+
+    # Converting and encoding up to history_size samples is CPU-bound: keep it off the event loop
+    content = await run_in_threadpool(_encode_topic_history, plugin, container, topic, since, until, limit)
+    if content is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"History is not enabled for topic '{topic}' in container '{container}'. "
+                   f"Set history_size in the ROS2 configuration.",
+        )
+
+    return Response(content=content, media_type="application/json")
+
+
+def _encode_topic_history(
+    plugin: ROS2TopicSubscriber,
+    container: str,
+    topic: str,
+    since: Optional[float],
+    until: Optional[float],
+    limit: Optional[int],
+) -> Optional[bytes]:
+    """Look up and encode the history response of a topic (None if history is disabled)."""
+    samples = plugin.get_topic_history(topic, since=since, until=until, limit=limit)
+    if samples is None:
+        return None
+    return encode_topic_history_response(
+        container=container,
+        topic=topic,
+        msg_type=plugin.get_msg_type(topic),
         domain_id=plugin.domain_id,
+        samples=[(sample["received_at"], sample["data_json"]) for sample in samples],
+    )
+
+
+def _get_topic_timeseries(
+    plugin: ROS2TopicSubscriber, container: str, topic: str, field: Optional[str] = None
+) -> TopicTimeSeries:
+    """Get the time-series store of a topic, optionally validating a stored field.
+
+    Raises:
+        HTTPException: 404 if time series is not enabled for the topic or field.
+    """
+    series = plugin.get_topic_timeseries(topic)
+    if series is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Time series is not enabled for topic '{topic}' in container '{container}'. "
+                   f"Configure it under timeseries in the ROS2 configuration.",
+        )
+    if field is not None and field not in series.fields:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Field '{field}' is not stored for topic '{topic}'. "
+                   f"Available fields: {series.fields}",
+        )
+    return series
+
+
+@router.get("/series", response_model=ROS2TopicSeriesResponse)
+async def get_ros2_topic_series(
+    container: str,
+    topic: str,
+    field: str,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    period: Optional[float] = None,
+    config=Depends(get_config),
+) -> Response:
+    """Get stored numeric samples of a topic field within a time window.
+
+    `since` and `until` are receive timestamps in seconds since epoch (inclusive).
+    When `period` is set, samples are averaged into buckets of that many seconds.
+    Summary statistics are always computed over the raw samples in the window.
+    """
+    plugin = _get_plugin_for_topic(container, topic, config)
+    series = _get_topic_timeseries(plugin, container, topic, field)
+
+    if period is not None and period <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="period must be positive",
+        )
+
+    if period is None:
+        timestamps, values = series.query(field, since=since, until=until)
+    else:
+        timestamps, values = series.resample(field, period, since=since, until=until)
+    stats = series.stats(field, since=since, until=until)
+
+    return Response(
+        content=encode_json({
+            "container": container,
+            "topic": topic,
+            "field": field,
+            "period": period,
+            "timestamps": timestamps.tolist(),
+            "values": to_json_list(values),
+            "stats": {
+                "count": stats["count"],
+                "min": to_json_list(stats["min"]),
+                "max": to_json_list(stats["max"]),
+                "mean": to_json_list(stats["mean"]),
+            },
+        }),
+        media_type="application/json",
+    )
+
+
+@router.get("/plot", response_model=ROS2TopicPlotResponse)
+async def get_ros2_topic_plot(
+    container: str,
+    topic: str,
+    field: str,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    points: int = 1000,
+    method: Literal["lttb", "minmax"] = "lttb",
+    config=Depends(get_config),
+) -> Response:
+    """Get a downsampled series of one numeric column for plotting.
+
+    `field` is a stored time-series field with a column index for multi-value
+    fields (e.g. `position.3`). Samples in the `since`/`until` window are reduced
+    to about `points` samples with LTTB or per-bucket min/max selection.
+    """
+    plugin = _get_plugin_for_topic(container, topic, config)
+    series = _get_topic_timeseries(plugin, container, topic)
+    try:
+        stored_field, index = series.resolve_column(field)
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Field '{field}' is not stored for topic '{topic}'. "
+                   f"Available fields: {series.fields}",
+        )
+
+    if points <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="points must be positive",
+        )
+
+    width = series.width(stored_field)
+    if index is None:
+        if width > 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Field '{field}' has {width} columns; select one as '{field}.<index>'",
+            )
+        index = 0
+    elif index >= width and width > 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Column {index} is out of range for field '{stored_field}' ({width} columns)",
+        )
+
+    timestamps, values = series.query(stored_field, since=since, until=until)
+    source_count = int(timestamps.size)
+    if values.shape[1] > index:
+        timestamps, column = downsample(timestamps, values[:, index], points, method)
+    else:
+        # No samples carried the field yet
+        timestamps, column = timestamps[:0], timestamps[:0]
+
+    return Response(
+        content=encode_json({
+            "container": container,
+            "topic": topic,
+            "field": field,
+            "method": method,
+            "source_count": source_count,
+            "timestamps": timestamps.tolist(),
+            "values": column.tolist(),
+        }),
+        media_type="application/json",
+    )
+
+
+@router.get(
+    "/topics/{topic:path}",
+    response_model=ROS2TopicDataResponse,
+    responses={304: {"description": "The latest message still has sequence number after_seq"}},
+)
+async def get_ros2_topic_data(
+    container: str,
+    topic: str,
+    after_seq: Optional[int] = None,
+    fields: Optional[str] = None,
+    precision: Optional[str] = None,
+    config=Depends(get_config),
+) -> Response:
+    """Get the latest data from a specific ROS2 topic for a container.
+
+    Pass the `seq` of the previous response as `after_seq` to poll for changes:
+    while the latest message is unchanged the response is an empty 304 Not Modified,
+    without converting or encoding the message.
+
+    Pass comma-separated field paths as `fields` (e.g. `/position[0:7],/name`) to get
+    only those fields: `data` then maps each path to its value.
+
+    Pass `precision` (decimal places, or `float32`) to round the floats in `data`.
+    """
+    plugin = _get_plugin_for_topic(container, topic, config)
+    projection = _compile_fields(fields)
+    float_precision = _parse_precision(precision)
+
+    if after_seq is not None and plugin.get_topic_seq(topic) == after_seq:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    # Reads can deserialize, convert and encode the message (lazy_deserialize, views)
+    cached_data = await run_in_threadpool(plugin.get_topic_view, topic, projection, float_precision)
+
+    # Reuse the message JSON encoded once at the plugin instead of re-serializing
+    data_json = b"null"
+    seq = None
+    from_snapshot = False
+    if cached_data:
+        data_json = cached_data["data_json"]
+        seq = cached_data["seq"]
+        from_snapshot = cached_data.get("from_snapshot", False)
+
+    return Response(
+        content=encode_topic_data_response(
+            container=container,
+            topic=topic,
+            msg_type=plugin.get_msg_type(topic),
+            data_json=data_json,
+            available=cached_data is not None,
+            domain_id=plugin.domain_id,
+            seq=seq,
+            from_snapshot=from_snapshot,
+        ),
+        media_type="application/json",
+    )
+
+
+@router.put("/topics/{topic:path}", response_model=ROS2TopicSubscriptionResponse)
+async def add_ros2_topic(
+    container: str,
+    topic: str,
+    request: ROS2TopicSubscribeRequest,
+    config=Depends(get_config),
+) -> ROS2TopicSubscriptionResponse:
+    """Subscribe to a ROS2 topic at runtime without restarting talos.
+
+    Other subscriptions and cached data are not affected. The topic is not
+    written to config.yml and is gone after a restart. Without `msg_type`, the
+    type is taken from the live topic graph.
+    """
+    if container not in config.containers:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Container '{container}' not found",
+        )
+
+    plugin = get_ros2_plugin(container)
+    if plugin is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"ROS2 plugin for container '{container}' is not available. "
+                   f"Check if ROS2 configuration exists in config.yml and zenoh connection.",
+        )
+
+    msg_type = request.msg_type
+    if msg_type is None:
+        try:
+            msg_type = plugin.resolve_msg_type(topic)
+        except LookupError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    try:
+        subscribed = await run_in_threadpool(plugin.add_topic, topic, msg_type, request.static)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to subscribe to topic '{topic}': {str(e)}",
+        )
+
+    return ROS2TopicSubscriptionResponse(
+        container=container,
+        topic=topic,
+        action="added",
+        msg_type=msg_type,
+        static=request.static,
+        subscribed=subscribed,
+    )
+
+
+@router.delete("/topics/{topic:path}", response_model=ROS2TopicSubscriptionResponse)
+async def remove_ros2_topic(
+    container: str,
+    topic: str,
+    config=Depends(get_config),
+) -> ROS2TopicSubscriptionResponse:
+    """Unsubscribe a ROS2 topic at runtime and drop its cached data.
+
+    Works for topics from config.yml as well as runtime topics; a configured
+    topic comes back after a restart.
+    """
+    plugin = _get_plugin_for_topic(container, topic, config)
+
+    try:
+        await run_in_threadpool(plugin.remove_topic, topic)
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Topic '{topic}' is not configured for container '{container}'",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return ROS2TopicSubscriptionResponse(
+        container=container,
+        topic=topic,
+        action="removed",
+        subscribed=False,
     )
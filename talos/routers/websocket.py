@@ -6,6 +6,7 @@ import time
 from typing import Any, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError
 
 from talos.state import (
@@ -13,7 +14,13 @@ from talos.state import (
     get_client_pool_or_none,
     get_ros2_plugin,
 )
-from talos.models import ROS2TopicDataResponse
+from talos.plugins.ros2_encoding import (
+    encode_topic_data_response,
+    encode_websocket_data_message,
+)
+from talos.plugins.ros2_image import DEFAULT_QUALITY, IMAGE_TYPES, ImageEncoding
+from talos.plugins.ros2_precision import FloatPrecision
+from talos.plugins.ros2_projection import FieldProjection, compile_projection
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +35,10 @@ FALLBACK_LOG_TAIL = 10000
 # ROS2 topic WebSocket throttling: maximum send rate per topic (Hz)
 # Prevents overwhelming WebSocket with high-frequency topics (e.g., 100Hz)
 ROS2_TOPIC_MAX_SEND_RATE = 10.0  # Hz (10 messages per second max)
+UNAVAILABLE_SEQ = 0  # last-sent marker for "unavailable status sent" (message seqs start at 1)
+# ROS2 image WebSocket: frames per second sent to each client (default and upper bound of max_fps)
+ROS2_IMAGE_DEFAULT_FPS = 10.0  # Hz
+ROS2_IMAGE_MAX_FPS = 30.0  # Hz
 
 
 # ============================================================================
@@ -90,6 +101,69 @@ async def _send_websocket_data(websocket: WebSocket, data: dict) -> bool:
         return False
 
 
+async def _send_websocket_encoded_data(websocket: WebSocket, data_json: bytes) -> bool:
+    """Send a pre-encoded data message via WebSocket.
+
+    Args:
+        websocket: WebSocket connection.
+        data_json: Pre-encoded JSON bytes for the message ``data`` field.
+
+    Returns:
+        True if message was sent successfully, False otherwise.
+    """
+    try:
+        # Check if WebSocket is still connected
+        # WebSocketState.CONNECTED = 1
+        if websocket.client_state.value != 1:
+            logger.debug(f"WebSocket not connected (state: {websocket.client_state.value})")
+            return False
+
+        await websocket.send_text(encode_websocket_data_message(data_json).decode("utf-8"))
+        return True
+    except (WebSocketDisconnect, ConnectionClosedOK, ConnectionClosedError, RuntimeError) as e:
+        logger.debug(f"Failed to send data message, WebSocket likely closed: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Unexpected error sending WebSocket data message: {e}", exc_info=True)
+        return False
+
+
+async def _send_websocket_bytes(websocket: WebSocket, data: bytes) -> bool:
+    """Send a binary message via WebSocket.
+
+    Returns:
+        True if message was sent successfully, False otherwise.
+    """
+    try:
+        if websocket.client_state.value != 1:
+            logger.debug(f"WebSocket not connected (state: {websocket.client_state.value})")
+            return False
+
+        await websocket.send_bytes(data)
+        return True
+    except (WebSocketDisconnect, ConnectionClosedOK, ConnectionClosedError, RuntimeError) as e:
+        logger.debug(f"Failed to send binary message, WebSocket likely closed: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Unexpected error sending WebSocket binary message: {e}", exc_info=True)
+        return False
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """Consume incoming messages until the client disconnects.
+
+    Send-only streams run this in a task, so they notice a closed client
+    while they have nothing to send.
+    """
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+    except Exception as e:
+        logger.debug(f"Stopped receiving from WebSocket: {e}")
+
+
 async def _close_websocket_ignoring_error(websocket: WebSocket) -> None:
     """Close WebSocket connection, ignoring any errors.
 
@@ -130,25 +204,36 @@ async def _check_service_status(
 # ROS2 WebSocket Helper Functions
 # ============================================================================
 
-def _get_topic_msg_type(plugin: Any, topic: str) -> str:
-    """Get message type for a topic (check both topics and static_topics).
+async def _send_topic_data(
+    websocket: WebSocket,
+    container: str,
+    plugin: Any,
+    topic: str,
+    cached_data: Optional[dict[str, Any]],
+) -> bool:
+    """Send a topic data message built around the plugin's pre-encoded message JSON.
 
     Args:
+        websocket: WebSocket connection.
+        container: Container name.
         plugin: ROS2TopicSubscriber plugin.
         topic: Topic name.
+        cached_data: Result of plugin.get_topic_data(), or None if no data is available.
 
     Returns:
-        Message type string.
-
-    Raises:
-        KeyError: If topic is not found in either topics or static_topics.
+        True if message was sent successfully, False otherwise.
     """
-    if topic in plugin.topics:
-        return plugin.topics[topic]
-    elif topic in plugin.static_topics:
-        return plugin.static_topics[topic]
-    else:
-        raise KeyError(f"Topic '{topic}' not found in topics or static_topics")
+    response_json = encode_topic_data_response(
+        container=container,
+        topic=topic,
+        msg_type=plugin.get_msg_type(topic),
+        data_json=cached_data["data_json"] if cached_data else b"null",
+        available=cached_data is not None,
+        domain_id=plugin.domain_id,
+        seq=cached_data["seq"] if cached_data else None,
+        from_snapshot=cached_data.get("from_snapshot", False) if cached_data else False,
+    )
+    return await _send_websocket_encoded_data(websocket, response_json)
 
 
 async def _poll_and_send_single_topic_data(
@@ -157,12 +242,16 @@ async def _poll_and_send_single_topic_data(
     plugin: Any,
     topic: str,
     last_send_time: float,
-    last_sent_data_hash: Optional[int],
-    min_interval: float
+    last_sent_seq: Optional[int],
+    min_interval: float,
+    projection: Optional[FieldProjection] = None,
+    precision: Optional[FloatPrecision] = None,
 ) -> Tuple[bool, float, Optional[int]]:
     """Poll for single topic data and send if changed (with throttling).
 
-    This is optimized for single-topic WebSocket connections.
+    Changes are detected by comparing the topic's message sequence number
+    with the last one sent, so unchanged data costs an integer compare and
+    is never converted or encoded.
 
     Args:
         websocket: WebSocket connection.
@@ -170,77 +259,54 @@ async def _poll_and_send_single_topic_data(
         plugin: ROS2TopicSubscriber plugin.
         topic: Topic name.
         last_send_time: Last send time for this topic.
-        last_sent_data_hash: Last sent data hash for this topic.
+        last_sent_seq: Sequence number of the last sent message, UNAVAILABLE_SEQ
+            if unavailable status was sent, or None if nothing was sent yet.
         min_interval: Minimum time between sends (throttling).
+        projection: Fields to send instead of the whole message (None for all).
+        precision: Float precision of this connection (None for the topic's own).
 
     Returns:
-        Tuple of (connection_alive, new_last_send_time, new_last_sent_data_hash).
+        Tuple of (connection_alive, new_last_send_time, new_last_sent_seq).
     """
     current_time = time.time()
     time_since_last_send = current_time - last_send_time
 
     if time_since_last_send < min_interval:
-        return True, last_send_time, last_sent_data_hash  # Throttled
-
-    # Get latest cached data
-    cached_data = plugin.get_topic_data(topic)
-    available = plugin.is_topic_available(topic)
-
-    if cached_data:
-        data = cached_data.get("data")
-        # Check if data changed (simple hash comparison)
-        data_hash = hash(str(data)) if data is not None else None
-
-        if data_hash != last_sent_data_hash or not available:
-            # Data changed or became unavailable, send update
-            msg_type = _get_topic_msg_type(plugin, topic)
-            response = ROS2TopicDataResponse(
-                container=container,
-                topic=topic,
-                msg_type=msg_type,
-                data=data,
-                available=available,
-                domain_id=plugin.domain_id,
-            )
+        return True, last_send_time, last_sent_seq  # Throttled
 
-            success = await _send_websocket_data(websocket, response.model_dump())
-            return success, current_time, data_hash
-    elif not available:
-        # Topic became unavailable or no data yet
-        # Send notification if this is the first check (last_sent_data_hash is None)
-        # or if we had data before (last_sent_data_hash is not None)
-        if last_sent_data_hash is None:
-            # First time checking - send initial unavailable status
-            msg_type = _get_topic_msg_type(plugin, topic)
-            response = ROS2TopicDataResponse(
-                container=container,
-                topic=topic,
-                msg_type=msg_type,
-                data=None,
-                available=False,
-                domain_id=plugin.domain_id,
-            )
+    seq = plugin.get_topic_seq(topic)
+    if seq is None:
+        seq = UNAVAILABLE_SEQ
+    if seq == last_sent_seq:
+        return True, last_send_time, last_sent_seq  # No change
 
-            success = await _send_websocket_data(websocket, response.model_dump())
-            return success, current_time, -1  # Use -1 as sentinel value to indicate unavailable status sent
-        elif last_sent_data_hash != -1:
-            # We had data before, now it's unavailable - send notification
-            msg_type = _get_topic_msg_type(plugin, topic)
-            response = ROS2TopicDataResponse(
-                container=container,
-                topic=topic,
-                msg_type=msg_type,
-                data=None,
-                available=False,
-                domain_id=plugin.domain_id,
-            )
+    # Data changed or became unavailable, send update
+    return await _send_latest_topic_data(
+        websocket, container, plugin, topic, last_send_time, last_sent_seq, projection, precision
+    )
 
-            success = await _send_websocket_data(websocket, response.model_dump())
-            return success, current_time, -1
-        # If last_sent_data_hash is -1, we already sent unavailable status, don't send again
-        return True, last_send_time, last_sent_data_hash
 
-    return True, last_send_time, last_sent_data_hash  # No change
+async def _send_latest_topic_data(
+    websocket: WebSocket,
+    container: str,
+    plugin: Any,
+    topic: str,
+    last_send_time: float,
+    last_sent_seq: Optional[int],
+    projection: Optional[FieldProjection] = None,
+    precision: Optional[FloatPrecision] = None,
+) -> Tuple[bool, float, Optional[int]]:
+    """Send the latest topic data (or unavailable status) unconditionally.
+
+    Returns:
+        Tuple of (connection_alive, new_last_send_time, new_last_sent_seq).
+    """
+    # Reads can deserialize, convert and encode the message (lazy_deserialize, views)
+    cached_data = await run_in_threadpool(plugin.get_topic_view, topic, projection, precision)
+    if not await _send_topic_data(websocket, container, plugin, topic, cached_data):
+        return False, last_send_time, last_sent_seq
+    # Record the sequence number actually sent; it may be newer than the one polled
+    return True, time.time(), cached_data["seq"] if cached_data else UNAVAILABLE_SEQ
 
 
 @router.websocket("/ws/containers/{container}/services/{service}/logs")
@@ -454,11 +520,19 @@ async def websocket_service_logs(websocket: WebSocket, container: str, service:
 
 
 @router.websocket("/ws/containers/{container}/ros2/topics/{topic:path}")
-async def websocket_ros2_topic_data(websocket: WebSocket, container: str, topic: str):
+async def websocket_ros2_topic_data(
+    websocket: WebSocket,
+    container: str,
+    topic: str,
+    fields: Optional[str] = None,
+    precision: Optional[str] = None,
+):
     """WebSocket endpoint for streaming single ROS2 topic data in real-time.
 
     This endpoint uses one WebSocket connection per topic. Each connection
-    streams data for only the specified topic.
+    streams data for only the specified topic. The optional `fields` and
+    `precision` query parameters work as in the REST endpoint; they are
+    parsed once per connection.
     """
     await websocket.accept()
     logger.info(f"WebSocket connection established for {container}/ros2/{topic}")
@@ -486,48 +560,31 @@ async def websocket_ros2_topic_data(websocket: WebSocket, container: str, topic:
             await _close_websocket_ignoring_error(websocket)
             return
 
-        # Throttling state: track last send time and last sent data hash for single topic
+        projection = None
+        float_precision = None
+        try:
+            if fields is not None:
+                projection = compile_projection(fields)
+            if precision is not None:
+                float_precision = FloatPrecision.parse(precision)
+        except ValueError as e:
+            await _send_websocket_error(websocket, str(e))
+            await _close_websocket_ignoring_error(websocket)
+            return
+
+        # Throttling state: track last send time and last sent sequence number for single topic
         last_send_time: float = 0.0
-        last_sent_data_hash: Optional[int] = None
+        last_sent_seq: Optional[int] = None
         min_interval = 1.0 / ROS2_TOPIC_MAX_SEND_RATE
-        initial_send_done = False
 
         try:
-            # Send initial data immediately if available (before entering polling loop)
-            cached_data = plugin.get_topic_data(topic)
-            available = plugin.is_topic_available(topic)
-
-            if cached_data:
-                data = cached_data.get("data")
-                data_hash = hash(str(data)) if data is not None else None
-                msg_type = _get_topic_msg_type(plugin, topic)
-                response = ROS2TopicDataResponse(
-                    container=container,
-                    topic=topic,
-                    msg_type=msg_type,
-                    data=data,
-                    available=available,
-                    domain_id=plugin.domain_id,
-                )
-                if await _send_websocket_data(websocket, response.model_dump()):
-                    last_send_time = time.time()
-                    last_sent_data_hash = data_hash
-                    initial_send_done = True
-            elif not available:
-                # Send unavailable status immediately
-                msg_type = _get_topic_msg_type(plugin, topic)
-                response = ROS2TopicDataResponse(
-                    container=container,
-                    topic=topic,
-                    msg_type=msg_type,
-                    data=None,
-                    available=False,
-                    domain_id=plugin.domain_id,
-                )
-                if await _send_websocket_data(websocket, response.model_dump()):
-                    last_send_time = time.time()
-                    last_sent_data_hash = -1
-                    initial_send_done = True
+            # Send initial data (or unavailable status) immediately, before entering polling loop
+            connection_alive, last_send_time, last_sent_seq = await _send_latest_topic_data(
+                websocket, container, plugin, topic, last_send_time, last_sent_seq, projection, float_precision
+            )
+            if not connection_alive:
+                logger.info(f"WebSocket disconnected for {container}/ros2/{topic}")
+                return
 
             # Poll-based approach: periodically check for new data and send with throttling
             # Note: For topics with TRANSIENT_LOCAL durability (like robot_description with depth=1),
@@ -536,10 +593,10 @@ async def websocket_ros2_topic_data(websocket: WebSocket, container: str, topic:
             while True:
                 await asyncio.sleep(min(LOG_POLL_INTERVAL, min_interval))
 
-                connection_alive, new_last_send_time, new_last_sent_data_hash = (
+                connection_alive, new_last_send_time, new_last_sent_seq = (
                     await _poll_and_send_single_topic_data(
                         websocket, container, plugin, topic,
-                        last_send_time, last_sent_data_hash, min_interval
+                        last_send_time, last_sent_seq, min_interval, projection, float_precision
                     )
                 )
 
@@ -549,7 +606,7 @@ async def websocket_ros2_topic_data(websocket: WebSocket, container: str, topic:
 
                 # Update state
                 last_send_time = new_last_send_time
-                last_sent_data_hash = new_last_sent_data_hash
+                last_sent_seq = new_last_sent_seq
 
         except WebSocketDisconnect:
             logger.info(f"WebSocket disconnected for {container}/ros2/{topic}")
@@ -565,3 +622,185 @@ async def websocket_ros2_topic_data(websocket: WebSocket, container: str, topic:
         logger.error(f"WebSocket error for {container}/ros2/{topic}: {e}", exc_info=True)
         await _close_websocket_ignoring_error(websocket)
 
+
+@router.websocket("/ws/containers/{container}/ros2/image")
+async def websocket_ros2_image(
+    websocket: WebSocket,
+    container: str,
+    topic: str,
+    format: str = "jpeg",
+    quality: int = DEFAULT_QUALITY,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    max_fps: float = ROS2_IMAGE_DEFAULT_FPS,
+):
+    """WebSocket endpoint for streaming an image topic as binary JPEG/PNG frames.
+
+    Each binary message is one encoded frame; errors are sent as JSON text
+    messages. `format`, `quality`, `width` and `height` work as in the REST
+    endpoint. At most `max_fps` frames per second are sent, always the latest
+    one: frames arriving faster, or while a slow link is still taking the
+    previous frame, are skipped. A frame that cannot be decoded is reported
+    as an error and skipped. The stream ends when the client disconnects or
+    the topic is removed.
+    """
+    await websocket.accept()
+    logger.info(f"WebSocket connection established for {container}/ros2/image ({topic})")
+
+    disconnected: Optional[asyncio.Task] = None
+    try:
+        plugin = get_ros2_plugin(container)
+        if plugin is None:
+            config = get_config_or_none()
+            error_msg = (
+                f"Container '{container}' not found"
+                if config is None or container not in config.containers
+                else f"ROS2 plugin for container '{container}' is not available."
+            )
+            await _send_websocket_error(websocket, error_msg)
+            await _close_websocket_ignoring_error(websocket)
+            return
+
+        if topic not in plugin.list_topics() or plugin.get_msg_type(topic) not in IMAGE_TYPES:
+            await _send_websocket_error(
+                websocket, f"Topic '{topic}' is not a configured image topic for container '{container}'"
+            )
+            await _close_websocket_ignoring_error(websocket)
+            return
+
+        if not plugin.encodes_images:
+            await _send_websocket_error(
+                websocket, f"Image streaming is not available for container '{container}' with isolated_ingest"
+            )
+            await _close_websocket_ignoring_error(websocket)
+            return
+
+        try:
+            encoding = ImageEncoding(format, quality, width, height)
+            if not 0 < max_fps <= ROS2_IMAGE_MAX_FPS:
+                raise ValueError(f"max_fps must be greater than 0 and at most {ROS2_IMAGE_MAX_FPS}, got {max_fps}")
+        except ValueError as e:
+            await _send_websocket_error(websocket, str(e))
+            await _close_websocket_ignoring_error(websocket)
+            return
+
+        min_interval = 1.0 / max_fps
+        last_sent_seq: Optional[int] = None
+        # While the camera is idle nothing is sent, so a closed client is only seen by receiving
+        disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+        while True:
+            started_at = time.monotonic()
+            if topic not in plugin.list_topics():
+                await _send_websocket_error(websocket, f"Topic '{topic}' was removed from container '{container}'")
+                await _close_websocket_ignoring_error(websocket)
+                return
+            seq = plugin.get_topic_seq(topic)
+            if seq is not None and seq != last_sent_seq:
+                future = plugin.encode_topic_image(topic, encoding)
+                if future is not None:
+                    try:
+                        result = await asyncio.wrap_future(future)
+                    except ValueError as e:
+                        # One corrupt frame must not end a live preview; wait for the next one
+                        logger.warning(f"Skipping undecodable frame of {container}/ros2/image ({topic}): {e}")
+                        if not await _send_websocket_error(websocket, str(e)):
+                            logger.info(f"WebSocket disconnected for {container}/ros2/image ({topic})")
+                            return
+                        last_sent_seq = seq
+                    else:
+                        if not await _send_websocket_bytes(websocket, result["image"]):
+                            logger.info(f"WebSocket disconnected for {container}/ros2/image ({topic})")
+                            return
+                        last_sent_seq = result["seq"]
+
+            # Encoding and sending count towards the frame interval
+            await asyncio.wait({disconnected}, timeout=max(min_interval - (time.monotonic() - started_at), 0.0))
+            if disconnected.done():
+                logger.info(f"WebSocket disconnected for {container}/ros2/image ({topic})")
+                return
+
+    except WebSocketDisconnect:
+        logger.info(f"WebSocket disconnected for {container}/ros2/image ({topic})")
+    except Exception as e:
+        logger.error(f"WebSocket error for {container}/ros2/image ({topic}): {e}", exc_info=True)
+        await _close_websocket_ignoring_error(websocket)
+    finally:
+        if disconnected is not None:
+            disconnected.cancel()
+
+
+@router.websocket("/ws/containers/{container}/ros2/diagnostics")
+async def websocket_ros2_diagnostics(websocket: WebSocket, container: str, topic: str = "/diagnostics"):
+    """WebSocket endpoint for streaming diagnostic status changes.
+
+    The first message carries all indexed statuses of the DiagnosticArray
+    topic (`full` true). Later messages carry only the statuses whose level,
+    message or values changed since the previous message, at most
+    ROS2_TOPIC_MAX_SEND_RATE times per second.
+    """
+    await websocket.accept()
+    logger.info(f"WebSocket connection established for {container}/ros2/diagnostics ({topic})")
+
+    try:
+        plugin = get_ros2_plugin(container)
+        if plugin is None:
+            config = get_config_or_none()
+            error_msg = (
+                f"Container '{container}' not found"
+                if config is None or container not in config.containers
+                else f"ROS2 plugin for container '{container}' is not available."
+            )
+            await _send_websocket_error(websocket, error_msg)
+            await _close_websocket_ignoring_error(websocket)
+            return
+
+        index = plugin.get_topic_diagnostics(topic) if topic in plugin.list_topics() else None
+        if index is None:
+            await _send_websocket_error(
+                websocket, f"Diagnostics index is not available for topic '{topic}' in container '{container}'"
+            )
+            await _close_websocket_ignoring_error(websocket)
+            return
+
+        last_seq = index.seq
+        if not await _send_websocket_data(websocket, {
+            "container": container,
+            "topic": topic,
+            "seq": last_seq,
+            "full": True,
+            "level_counts": index.get_level_counts(),
+            "statuses": index.get_statuses(),
+        }):
+            return
+
+        min_interval = 1.0 / ROS2_TOPIC_MAX_SEND_RATE
+        while True:
+            await asyncio.sleep(min_interval)
+
+            # Looked up on every poll: it stamps the read and notices a removed topic
+            index = plugin.get_topic_diagnostics(topic)
+            if index is None:
+                await _send_websocket_error(websocket, f"Topic '{topic}' was removed")
+                await _close_websocket_ignoring_error(websocket)
+                return
+            seq = index.seq
+            if seq == last_seq:
+                continue
+            changes = index.get_changes(last_seq)
+            last_seq = seq
+            if not await _send_websocket_data(websocket, {
+                "container": container,
+                "topic": topic,
+                "seq": seq,
+                "full": False,
+                "level_counts": index.get_level_counts(),
+                "statuses": changes,
+            }):
+                logger.info(f"WebSocket disconnected for {container}/ros2/diagnostics")
+                return
+
+    except WebSocketDisconnect:
+        logger.info(f"WebSocket disconnected for {container}/ros2/diagnostics")
+    except Exception as e:
+        logger.error(f"WebSocket error for {container}/ros2/diagnostics: {e}", exc_info=True)
+        await _close_websocket_ignoring_error(websocket)
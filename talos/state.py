@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 from talos.agent_client import AgentClient, AgentClientPool
 from talos.config import SystemConfig
 from talos.docker_client import DockerClient
+from talos.plugins.ros2_tf_buffer import ROS2TFBuffer
 from talos.plugins.ros2_topic_subscriber import ROS2TopicSubscriber
 
 # Global state (private)
@@ -13,6 +14,7 @@ _config: Optional[SystemConfig] = None
 _client_pool: Optional[AgentClientPool] = None
 _docker_client: Optional[DockerClient] = None
 _ros2_plugins: dict[str, ROS2TopicSubscriber] = {}
+_tf_buffers: dict[str, ROS2TFBuffer] = {}
 
 
 # State setters (for lifespan.py)
@@ -51,6 +53,21 @@ def clear_ros2_plugins():
     _ros2_plugins.clear()
 
 
+def set_tf_buffer(container_name: str, tf_buffer: ROS2TFBuffer):
+    """Set the TF buffer of a container."""
+    _tf_buffers[container_name] = tf_buffer
+
+
+def get_tf_buffers() -> dict[str, ROS2TFBuffer]:
+    """Get all TF buffers."""
+    return _tf_buffers
+
+
+def clear_tf_buffers():
+    """Clear all TF buffers."""
+    _tf_buffers.clear()
+
+
 # FastAPI Dependencies (for endpoints)
 def get_config() -> SystemConfig:
     """Get loaded configuration.
@@ -164,3 +181,16 @@ def get_ros2_plugin(container_name: str) -> Optional[ROS2TopicSubscriber]:
         return None
     return _ros2_plugins.get(container_name)
 
+
+def get_tf_buffer(container_name: str) -> Optional[ROS2TFBuffer]:
+    """Get the TF buffer of a container.
+
+    Args:
+        container_name: Name of the container.
+
+    Returns:
+        ROS2TFBuffer if enabled and started, None otherwise.
+    """
+    if _config is None or container_name not in _config.containers:
+        return None
+    return _tf_buffers.get(container_name)
@@ -119,18 +119,131 @@ export interface ErrorResponse {
 
 // ROS2 Plugin Types
 
+export interface ROS2TopicStats {
+  message_count: number;
+  rate_hz: number | null;
+  bandwidth_bps: number | null;
+  payload_bytes_total: number;
+  avg_payload_bytes: number | null;
+  dropped_rate_limited: number;
+  dropped_no_consumers: number;
+  interval_min_ms: number | null;
+  interval_max_ms: number | null;
+  interval_p99_ms: number | null;
+  jitter_ms: number | null;
+}
+
 export interface ROS2TopicStatus {
   topic: string;
   msg_type: string;
   configured: boolean;
   available: boolean;
   subscribed: boolean;
+  stats?: ROS2TopicStats | null;
+  subscribe_latency_ms?: number | null;
+  subscribe_error?: string | null;
+  cached_bytes: number;
+  from_snapshot?: boolean;
+  shared_by?: number;
+}
+
+export interface ROS2MemoryUsage {
+  used_bytes: number;
+  budget_bytes: number | null;
+  process_used_bytes: number;
+  process_budget_bytes: number | null;
+  evicted_count: number;
 }
 
 export interface ROS2TopicsListResponse {
   container: string;
   domain_id: number;
   topics: ROS2TopicStatus[];
+  memory?: ROS2MemoryUsage | null;
+}
+
+export interface ROS2GraphEndpoint {
+  node_name: string;
+  node_namespace: string;
+  msg_type: string;
+  type_hash: string;
+  qos: string;
+}
+
+export interface ROS2GraphTopic {
+  topic: string;
+  types: string[];
+  publishers: ROS2GraphEndpoint[];
+  subscribers: ROS2GraphEndpoint[];
+  configured: boolean;
+}
+
+export interface ROS2GraphResponse {
+  container: string;
+  domain_id: number;
+  topics: ROS2GraphTopic[];
+}
+
+export interface ROS2DiagnosticValue {
+  key: string;
+  value: string;
+}
+
+export interface ROS2DiagnosticStatus {
+  name: string;
+  hardware_id: string;
+  level: number;
+  level_name: string;
+  message: string;
+  values: ROS2DiagnosticValue[];
+  last_update: number;
+  last_change: number;
+  seq: number;
+}
+
+export interface ROS2DiagnosticsResponse {
+  container: string;
+  topic: string;
+  seq: number;
+  level_counts: Record<string, number>;
+  statuses: ROS2DiagnosticStatus[];
+}
+
+export interface ROS2TransformResponse {
+  container: string;
+  target: string;
+  source: string;
+  time: number;
+  translation: { x: number; y: number; z: number };
+  rotation: { x: number; y: number; z: number; w: number };
+}
+
+export interface ROS2TFFrame {
+  frame: string;
+  parent: string;
+  static: boolean;
+  latest: number;
+  oldest: number;
+}
+
+export interface ROS2TFFramesResponse {
+  container: string;
+  message_count: number;
+  frames: ROS2TFFrame[];
+}
+
+export interface ROS2TopicSubscribeRequest {
+  msg_type: string;
+  static?: boolean;
+}
+
+export interface ROS2TopicSubscriptionResponse {
+  container: string;
+  topic: string;
+  action: "added" | "removed";
+  msg_type: string | null;
+  static: boolean | null;
+  subscribed: boolean;
 }
 
 export interface ROS2TopicDataResponse {
@@ -140,4 +253,6 @@ export interface ROS2TopicDataResponse {
   data: any;
   available: boolean;
   domain_id: number;
+  seq?: number | null;
+  from_snapshot?: boolean;
 }
@@ -0,0 +1,65 @@
+"""Tests for the shared-memory latest-value table used by isolated ingest."""
+
+import struct
+
+import pytest
+
+from talos.plugins.ros2_shared_table import SharedLatestTable
+
+TOPICS = ["/a", "/b"]
+FRAME_CAPACITY = 64
+
+
+@pytest.fixture
+def table():
+    table = SharedLatestTable.create(TOPICS, FRAME_CAPACITY)
+    yield table
+    table.close()
+
+
+def _set_version(table: SharedLatestTable, offset: int, version: int) -> None:
+    struct.pack_into("<Q", table._buf, offset, version)
+
+
+def test_write_and_read_frame(table):
+    assert table.read_frame(0) is None
+    assert table.write_frame(0, 1, 10.0, b'{"x":1}')
+    assert table.read_frame(0) == (1, 10.0, b'{"x":1}')
+    assert table.read_seq(0) == 1
+    assert table.read_frame(1) is None
+
+
+def test_oversize_frame_hides_data(table):
+    assert not table.write_frame(0, 1, 10.0, b"x" * (FRAME_CAPACITY + 1))
+    assert table.read_frame(0) is None
+    assert table.write_frame(0, 2, 11.0, b"{}")
+    assert table.read_frame(0) == (2, 11.0, b"{}")
+
+
+def test_write_frame_recovers_from_crashed_writer(table):
+    table.write_frame(0, 1, 10.0, b"{}")
+    # A writer that died mid-write leaves the slot's version odd
+    _set_version(table, table._stride * 0, 3)
+    assert table.read_frame(0) is None
+
+    table.write_frame(0, 2, 11.0, b'{"x":2}')
+    assert table.read_frame(0) == (2, 11.0, b'{"x":2}')
+    table.write_frame(0, 3, 12.0, b'{"x":3}')
+    assert table.read_frame(0) == (3, 12.0, b'{"x":3}')
+
+
+def test_write_status_recovers_from_crashed_writer(table):
+    assert table.read_status() is None
+    table.write_status(b'{"a":1}')
+    _set_version(table, table._status_offset, 3)
+    assert table.read_status() is None
+
+    table.write_status(b'{"a":2}')
+    assert table.read_status() == b'{"a":2}'
+
+
+def test_last_read_survives_frame_writes(table):
+    table.mark_read(1, 42.0)
+    table.write_frame(1, 1, 10.0, b"{}")
+    assert table.read_last_read(1) == 42.0
+    assert table.read_last_read(0) == 0.0